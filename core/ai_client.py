@@ -6,8 +6,11 @@ import json
 import time
 from typing import Dict, List, Optional, AsyncGenerator, Callable
 import aiohttp
-import google.generativeai as genai
-from openai import AsyncOpenAI
+import httpx
+
+# 提供商SDK体积较大（genai会拉起grpcio），按需延迟导入，只加载实际使用的后端
+genai = None
+AsyncOpenAI = None
 
 from .ai_types import (
     AIProviderConfig, ChatMessage, ChatCompletionRequest, 
@@ -20,18 +23,36 @@ class BaseAIClient:
     def __init__(self, config: AIProviderConfig):
         self.config = config
         self.session: Optional[aiohttp.ClientSession] = None
-    
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """获取持久化会话（懒加载，复用keep-alive连接）"""
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=100,
+                    limit_per_host=32,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=75
+                ),
+                timeout=aiohttp.ClientTimeout(total=self.config.timeout),
+                headers=self.config.custom_headers or {}
+            )
+        return self.session
+
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=self.config.timeout),
-            headers=self.config.custom_headers or {}
-        )
+        # 会话持久化复用，进入上下文不再重建连接
         return self
-    
+
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
+        # 保持会话存活以复用连接，显式关闭请调用aclose()
+        pass
+
+    async def aclose(self):
+        """关闭客户端持有的会话"""
+        if self.session and not self.session.closed:
             await self.session.close()
-    
+        self.session = None
+
     async def get_models(self):
         """获取模型列表"""
         raise NotImplementedError
@@ -55,12 +76,16 @@ class BaseAIClient:
 class OpenAICompatibleClient(BaseAIClient):
     """OpenAI兼容客户端（支持DeepSeek、通义千问、NewAPI等）"""
     
-    def __init__(self, config: AIProviderConfig):
+    def __init__(self, config: AIProviderConfig, http_client: Optional[httpx.AsyncClient] = None):
         super().__init__(config)
+        global AsyncOpenAI
+        if AsyncOpenAI is None:
+            from openai import AsyncOpenAI
         self.client = AsyncOpenAI(
             api_key=config.api_key,
             base_url=config.base_url,
-            timeout=config.timeout
+            timeout=config.timeout,
+            http_client=http_client
         )
     
     async def get_models(self):
@@ -92,12 +117,11 @@ class OpenAICompatibleClient(BaseAIClient):
     async def chat_completion(self, request: ChatCompletionRequest) -> ChatCompletionResponse:
         """聊天完成"""
         try:
-            # 转换消息格式
-            messages = [
-                {"role": msg.role, "content": msg.content} 
-                for msg in request.messages
+            # 优先使用预序列化的消息，避免每次请求重建字典
+            messages = request.messages_serialized or [
+                msg._serialized for msg in request.messages
             ]
-            
+
             response = await self.client.chat.completions.create(
                 model=request.model,
                 messages=messages,
@@ -133,11 +157,10 @@ class OpenAICompatibleClient(BaseAIClient):
     ) -> AsyncGenerator[str, None]:
         """流式聊天完成"""
         try:
-            messages = [
-                {"role": msg.role, "content": msg.content} 
-                for msg in request.messages
+            messages = request.messages_serialized or [
+                msg._serialized for msg in request.messages
             ]
-            
+
             stream = await self.client.chat.completions.create(
                 model=request.model,
                 messages=messages,
@@ -160,6 +183,9 @@ class GeminiClient(BaseAIClient):
 
     def __init__(self, config: AIProviderConfig):
         super().__init__(config)
+        global genai
+        if genai is None:
+            import google.generativeai as genai
         genai.configure(api_key=config.api_key)
         self.model = genai.GenerativeModel(config.model)
 
@@ -176,11 +202,8 @@ class GeminiClient(BaseAIClient):
         """测试连接"""
         start_time = time.time()
         try:
-            # 发送一个简单的测试消息
-            response = await asyncio.to_thread(
-                self.model.generate_content, 
-                "Hello"
-            )
+            # 发送一个简单的测试消息（原生异步接口，不占用线程池）
+            response = await self.model.generate_content_async("Hello")
             response_time = (time.time() - start_time) * 1000
             return ConnectionTestResult(
                 success=True,
@@ -195,17 +218,16 @@ class GeminiClient(BaseAIClient):
     async def chat_completion(self, request: ChatCompletionRequest) -> ChatCompletionResponse:
         """聊天完成"""
         try:
-            # Gemini只需要用户消息，系统消息需要特殊处理
-            user_messages = [msg.content for msg in request.messages if msg.role == "user"]
-            prompt = "\n".join(user_messages)
-            
-            response = await asyncio.to_thread(
-                self.model.generate_content,
-                prompt
+            # 系统提示词和用户消息一并拼接，生成器表达式省去中间列表
+            prompt = "\n".join(
+                m.content for m in request.messages if m.role in ("system", "user")
             )
-            
+
+            created = int(time.time())
+            response = await self.model.generate_content_async(prompt)
+
             return ChatCompletionResponse(
-                id=f"gemini-{int(time.time())}",
+                id=f"gemini-{created}",
                 model=request.model,
                 choices=[{
                     "message": {
@@ -214,7 +236,7 @@ class GeminiClient(BaseAIClient):
                     },
                     "finish_reason": "stop"
                 }],
-                created=int(time.time())
+                created=created
             )
         except Exception as e:
             raise Exception(f"Gemini API调用失败: {str(e)}")
@@ -225,60 +247,125 @@ class GeminiClient(BaseAIClient):
         on_chunk: Callable[[str], None]
     ) -> AsyncGenerator[str, None]:
         """流式聊天完成"""
-        # Gemini的流式实现较复杂，这里先实现非流式版本
-        response = await self.chat_completion(request)
-        content = response.choices[0]["message"]["content"]
-        
-        # 模拟流式输出
-        words = content.split()
-        for i, word in enumerate(words):
-            chunk = word + (" " if i < len(words) - 1 else "")
-            on_chunk(chunk)
-            yield chunk
-            await asyncio.sleep(0.05)  # 模拟延迟
+        try:
+            prompt = "\n".join(
+                m.content for m in request.messages if m.role in ("system", "user")
+            )
+
+            # 真实SSE流式输出，逐块转发
+            stream = await self.model.generate_content_async(prompt, stream=True)
+            async for response in stream:
+                if response.text:
+                    on_chunk(response.text)
+                    yield response.text
+
+        except Exception as e:
+            raise Exception(f"Gemini流式API调用失败: {str(e)}")
 
 class AIClientFactory:
     """AI客户端工厂"""
     
     @staticmethod
-    def create_client(provider: str, config: AIProviderConfig) -> BaseAIClient:
+    def create_client(
+        provider: str,
+        config: AIProviderConfig,
+        http_client: Optional[httpx.AsyncClient] = None
+    ) -> BaseAIClient:
         """创建AI客户端"""
         if provider == "gemini":
             return GeminiClient(config)
         else:
             # DeepSeek、通义千问、OpenAI、NewAPI都使用OpenAI兼容客户端
-            return OpenAICompatibleClient(config)
+            return OpenAICompatibleClient(config, http_client=http_client)
 
 class AIClientManager:
     """AI客户端管理器"""
-    
+
+    # 每个提供商默认的并发上限，可用set_concurrency动态调整
+    DEFAULT_CONCURRENCY = 8
+
     def __init__(self):
         self.clients: Dict[str, BaseAIClient] = {}
-    
+        # provider -> {"cond": Condition, "active": int, "limit": int}
+        self._gates: Dict[str, dict] = {}
+        # 所有OpenAI兼容提供商共享一个httpx连接池，复用keep-alive连接
+        self._httpx = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+            timeout=60.0
+        )
+
     def get_client(self, provider: str, config: AIProviderConfig) -> BaseAIClient:
         """获取或创建客户端"""
         if provider not in self.clients:
-            self.clients[provider] = AIClientFactory.create_client(provider, config)
+            self.clients[provider] = AIClientFactory.create_client(
+                provider, config, http_client=self._httpx
+            )
         return self.clients[provider]
     
+    def _gate(self, provider: str) -> dict:
+        gate = self._gates.get(provider)
+        if gate is None:
+            gate = {
+                "cond": asyncio.Condition(),
+                "active": 0,
+                "limit": self.DEFAULT_CONCURRENCY
+            }
+            self._gates[provider] = gate
+        return gate
+
+    async def acquire(self, provider: str):
+        """获取提供商的并发许可，超限时等待"""
+        gate = self._gate(provider)
+        async with gate["cond"]:
+            while gate["active"] >= gate["limit"]:
+                await gate["cond"].wait()
+            gate["active"] += 1
+
+    async def release(self, provider: str):
+        """释放并发许可并唤醒一个等待者"""
+        gate = self._gate(provider)
+        async with gate["cond"]:
+            gate["active"] -= 1
+            gate["cond"].notify(1)
+
+    async def set_concurrency(self, provider: str, limit: int):
+        """调整提供商的并发上限，上调时唤醒所有等待者"""
+        gate = self._gate(provider)
+        async with gate["cond"]:
+            gate["limit"] = max(1, limit)
+            gate["cond"].notify_all()
+
+    async def _test_one(self, provider: str, config: AIProviderConfig) -> ConnectionTestResult:
+        """测试单个提供商连接"""
+        client = self.get_client(provider, config)
+        return await client.test_connection()
+
     async def test_all_connections(self, configs: Dict[str, AIProviderConfig]) -> Dict[str, ConnectionTestResult]:
-        """测试所有连接"""
+        """测试所有连接（并发执行，总耗时取决于最慢的提供商）"""
         results = {}
+        tasks = {}
         for provider, config in configs.items():
             if config.enabled and config.api_key:
-                client = self.get_client(provider, config)
-                async with client:
-                    results[provider] = await client.test_connection()
+                tasks[provider] = asyncio.create_task(self._test_one(provider, config))
             else:
                 results[provider] = ConnectionTestResult(
                     success=False,
                     error="未启用或缺少API密钥"
                 )
+        if tasks:
+            done = await asyncio.gather(*tasks.values(), return_exceptions=True)
+            for provider, result in zip(tasks, done):
+                if isinstance(result, Exception):
+                    results[provider] = ConnectionTestResult(success=False, error=str(result))
+                else:
+                    results[provider] = result
         return results
     
     async def close_all(self):
         """关闭所有客户端"""
         for client in self.clients.values():
-            if hasattr(client, 'session') and client.session:
-                await client.session.close()
+            await client.aclose()
         self.clients.clear()
+        if not self._httpx.is_closed:
+            await self._httpx.aclose()
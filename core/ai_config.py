@@ -2,7 +2,8 @@
 AI配置管理器 - 基于现代化架构设计
 """
 import os
-import json
+import orjson
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 from dataclasses import asdict, fields
@@ -10,18 +11,44 @@ from dotenv import load_dotenv
 
 from .ai_types import (
     AISettings, AIProviderConfig, AIProvider, AIModel,
-    AI_PROMPTS, MODEL_RECOMMENDATIONS
+    AI_PROMPTS, MODEL_RECOMMENDATIONS, PROVIDER_BY_VALUE
 )
 
+# 提供商配置字段名，导入时缓存一次，序列化/反序列化统一由此驱动
+_PROVIDER_FIELDS = tuple(f.name for f in fields(AIProviderConfig))
+
 class AIConfigManager:
     """AI配置管理器"""
-    
+
+    _instance: Optional["AIConfigManager"] = None
+
+    @classmethod
+    def instance(cls) -> "AIConfigManager":
+        """进程级单例，避免多个管理器重复读盘解析同一配置"""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
     def __init__(self, config_file: str = "data/ai_config.json"):
         self.config_file = Path(config_file)
         self.settings: AISettings = AISettings()
+        self._batching = False
+        self._dirty = False
         self._load_env()
         self._ensure_config_dir()
         self.load_config()
+
+    @contextmanager
+    def batched_writes(self):
+        """批量更新配置时合并落盘，退出时只写一次"""
+        self._batching = True
+        try:
+            yield self
+        finally:
+            self._batching = False
+            if self._dirty:
+                self._dirty = False
+                self.save_config()
     
     def _load_env(self):
         """加载环境变量"""
@@ -49,9 +76,8 @@ class AIConfigManager:
         """加载配置文件"""
         try:
             if self.config_file.exists():
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    self._deserialize_settings(data)
+                data = orjson.loads(self.config_file.read_bytes())
+                self._deserialize_settings(data)
                 return True
             else:
                 # 首次运行，保存默认配置
@@ -63,10 +89,13 @@ class AIConfigManager:
     
     def save_config(self) -> bool:
         """保存配置文件"""
+        if self._batching:
+            # 批量更新期间推迟写盘
+            self._dirty = True
+            return True
         try:
             data = self._serialize_settings()
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            self.config_file.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
             return True
         except Exception as e:
             print(f"保存AI配置失败: {e}")
@@ -81,48 +110,35 @@ class AIConfigManager:
             "system_prompt": self.settings.system_prompt,
             "max_history_length": self.settings.max_history_length,
             "auto_clear_history": self.settings.auto_clear_history,
+            "migrated": self.settings.migrated,
             "providers": {}
         }
         
         # 序列化提供商配置
         for name, config in self.settings.providers.items():
-            data["providers"][name] = {
-                "enabled": config.enabled,
-                "api_key": config.api_key,
-                "base_url": config.base_url,
-                "model": config.model,
-                "temperature": config.temperature,
-                "max_tokens": config.max_tokens,
-                "timeout": config.timeout,
-                "proxy": config.proxy,
-                "custom_headers": config.custom_headers
-            }
-        
+            data["providers"][name] = {k: getattr(config, k) for k in _PROVIDER_FIELDS}
+
         return data
     
     def _deserialize_settings(self, data: Dict[str, Any]):
         """从字典反序列化设置"""
         self.settings.enabled = data.get("enabled", True)
-        self.settings.default_provider = AIProvider(data.get("default_provider", "deepseek"))
+        self.settings.default_provider = PROVIDER_BY_VALUE.get(
+            data.get("default_provider", "deepseek"), AIProvider.DEEPSEEK
+        )
         self.settings.stream_enabled = data.get("stream_enabled", True)
         self.settings.system_prompt = data.get("system_prompt", "你是AI助手，名字叫VictorAI")
         self.settings.max_history_length = data.get("max_history_length", 10)
         self.settings.auto_clear_history = data.get("auto_clear_history", False)
+        self.settings.migrated = data.get("migrated", False)
         
         # 反序列化提供商配置
         providers_data = data.get("providers", {})
         for name, config_data in providers_data.items():
             if name in self.settings.providers:
                 config = self.settings.providers[name]
-                config.enabled = config_data.get("enabled", False)
-                config.api_key = config_data.get("api_key", "")
-                config.base_url = config_data.get("base_url", "")
-                config.model = config_data.get("model", "")
-                config.temperature = config_data.get("temperature", 0.7)
-                config.max_tokens = config_data.get("max_tokens", 2000)
-                config.timeout = config_data.get("timeout", 30)
-                config.proxy = config_data.get("proxy")
-                config.custom_headers = config_data.get("custom_headers")
+                for k in _PROVIDER_FIELDS:
+                    setattr(config, k, config_data.get(k, getattr(config, k)))
     
     # 配置访问方法
     def get_provider_config(self, provider: str) -> Optional[AIProviderConfig]:
@@ -189,8 +205,7 @@ class AIConfigManager:
         """导出配置"""
         try:
             data = self._serialize_settings()
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            Path(file_path).write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
             return True
         except Exception as e:
             print(f"导出配置失败: {e}")
@@ -199,10 +214,9 @@ class AIConfigManager:
     def import_config(self, file_path: str) -> bool:
         """导入配置"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                self._deserialize_settings(data)
-                self.save_config()
+            data = orjson.loads(Path(file_path).read_bytes())
+            self._deserialize_settings(data)
+            self.save_config()
             return True
         except Exception as e:
             print(f"导入配置失败: {e}")
@@ -3,12 +3,13 @@
 """
 import asyncio
 import time
-from typing import Dict, List, Optional, Callable, AsyncGenerator
+from collections import deque
+from typing import Deque, Dict, List, Optional, Callable, AsyncGenerator
 from .ai_config import AIConfigManager
 from .ai_client import AIClientManager, BaseAIClient
 from .ai_types import (
     ChatMessage, ChatCompletionRequest, AIProvider,
-    ConnectionTestResult
+    ConnectionTestResult, PROVIDER_BY_VALUE
 )
 
 class ModernAIManager:
@@ -17,9 +18,14 @@ class ModernAIManager:
     def __init__(self, config_manager=None):
         # 兼容旧的config_manager，同时支持新的AI配置
         self.legacy_config = config_manager
-        self.ai_config = AIConfigManager()
+        self.ai_config = AIConfigManager.instance()
         self.client_manager = AIClientManager()
-        self.chat_histories: Dict[str, List[ChatMessage]] = {}
+        # 每个群: 系统消息 + 有界deque的最近消息，溢出时O(1)左侧淘汰
+        self.chat_histories: Dict[str, Deque[ChatMessage]] = {}
+        # 与chat_histories平行维护的预序列化消息，发送请求时直接复用
+        self.chat_dicts: Dict[str, Deque[dict]] = {}
+        self._system_messages: Dict[str, ChatMessage] = {}
+        self._system_dicts: Dict[str, dict] = {}
 
         # 如果有旧配置，迁移到新配置
         if config_manager:
@@ -27,58 +33,82 @@ class ModernAIManager:
 
     def _migrate_legacy_config(self):
         """迁移旧配置到新配置系统"""
+        if self.ai_config.settings.migrated:
+            # 已迁移过，跳过重复的序列化和写盘
+            return
         try:
-            # 迁移API密钥
-            for provider in ["deepseek", "gemini", "qianwen"]:
-                api_key = self.legacy_config.get_api_key(provider)
-                if api_key:
-                    self.ai_config.set_api_key(provider, api_key)
-
-            # 迁移系统提示词
-            system_prompt = self.legacy_config.get_system_prompt()
-            if system_prompt:
-                self.ai_config.settings.system_prompt = system_prompt
-
-            # 迁移默认模型
-            default_model = self.legacy_config.config.get("default_model", "deepseek")
-            if default_model in ["deepseek", "gemini", "qianwen"]:
-                self.ai_config.settings.default_provider = AIProvider(default_model)
-
-            # 迁移代理设置
-            proxy = self.legacy_config.get_proxy()
-            if proxy.get("http") or proxy.get("https"):
-                for provider_name in self.ai_config.settings.providers:
-                    self.ai_config.settings.providers[provider_name].proxy = proxy
-
-            # 保存迁移后的配置
-            self.ai_config.save_config()
+            # 批量写入：整个迁移只落盘一次
+            with self.ai_config.batched_writes():
+                # 迁移API密钥
+                for provider in ["deepseek", "gemini", "qianwen"]:
+                    api_key = self.legacy_config.get_api_key(provider)
+                    if api_key:
+                        self.ai_config.set_api_key(provider, api_key)
+
+                # 迁移系统提示词
+                system_prompt = self.legacy_config.get_system_prompt()
+                if system_prompt:
+                    self.ai_config.settings.system_prompt = system_prompt
+
+                # 迁移默认模型
+                default_model = self.legacy_config.config.get("default_model", "deepseek")
+                if default_model in ["deepseek", "gemini", "qianwen"]:
+                    self.ai_config.settings.default_provider = PROVIDER_BY_VALUE[default_model]
+
+                # 迁移代理设置
+                proxy = self.legacy_config.get_proxy()
+                if proxy.get("http") or proxy.get("https"):
+                    for provider_name in self.ai_config.settings.providers:
+                        self.ai_config.settings.providers[provider_name].proxy = proxy
+
+                # 标记已迁移并保存
+                self.ai_config.settings.migrated = True
+                self.ai_config.save_config()
             print("配置迁移完成")
 
         except Exception as e:
             print(f"配置迁移失败: {e}")
 
+    def _init_history(self, group_name: str):
+        """初始化群组的历史存储，返回(消息deque, 序列化deque)"""
+        system_prompt = self.ai_config.settings.system_prompt
+        max_length = self.ai_config.settings.max_history_length
+        self._system_messages[group_name] = ChatMessage(
+            role="system", content=system_prompt, timestamp=time.time()
+        )
+        self._system_dicts[group_name] = {"role": "system", "content": system_prompt}
+        hist = deque(maxlen=max_length)
+        dicts = deque(maxlen=max_length)
+        self.chat_histories[group_name] = hist
+        self.chat_dicts[group_name] = dicts
+        return hist, dicts
+
     def get_chat_history(self, group_name: str) -> List[ChatMessage]:
         """获取聊天历史"""
-        if group_name not in self.chat_histories:
-            system_prompt = self.ai_config.settings.system_prompt
-            self.chat_histories[group_name] = [
-                ChatMessage(role="system", content=system_prompt, timestamp=time.time())
-            ]
-        return self.chat_histories[group_name]
-
-    def add_message(self, group_name: str, role: str, content: str):
+        hist = self.chat_histories.get(group_name)
+        if hist is None:
+            hist, _ = self._init_history(group_name)
+        return [self._system_messages[group_name], *hist]
+
+    def get_chat_dicts(self, group_name: str) -> List[dict]:
+        """获取预序列化的聊天历史"""
+        dicts = self.chat_dicts.get(group_name)
+        if dicts is None:
+            _, dicts = self._init_history(group_name)
+        return [self._system_dicts[group_name], *dicts]
+
+    def add_message(self, group_name: str, role: str, content: str, timestamp: float = None):
         """添加消息到历史"""
-        history = self.get_chat_history(group_name)
-        message = ChatMessage(role=role, content=content, timestamp=time.time())
-        history.append(message)
-
-        # 保持历史记录在合理范围内
-        max_length = self.ai_config.settings.max_history_length
-        if len(history) > max_length + 1:  # +1 for system message
-            # 保留系统消息和最近的消息
-            system_msg = history[0]
-            recent_msgs = history[-(max_length):]
-            self.chat_histories[group_name] = [system_msg] + recent_msgs
+        hist = self.chat_histories.get(group_name)
+        if hist is None:
+            hist, dicts = self._init_history(group_name)
+        else:
+            dicts = self.chat_dicts[group_name]
+        if timestamp is None:
+            timestamp = time.time()
+        # deque自带maxlen，溢出时自动从左侧淘汰最旧消息
+        hist.append(ChatMessage(role=role, content=content, timestamp=timestamp))
+        dicts.append({"role": role, "content": content})
 
     async def get_ai_response(self, message: str, group_name: str, provider: str = None) -> Optional[str]:
         """获取AI回复 - 现代化版本"""
@@ -92,30 +122,37 @@ class ModernAIManager:
             if not config or not config.enabled or not config.api_key:
                 return f"提供商 {provider} 未配置或未启用"
 
+            # 提前取出配置属性，热路径上避免重复LOAD_ATTR
+            model, temperature, max_tokens = config.model, config.temperature, config.max_tokens
+
             # 添加用户消息到历史
             self.add_message(group_name, "user", message)
             history = self.get_chat_history(group_name)
 
             # 创建请求
             request = ChatCompletionRequest(
-                model=config.model,
+                model=model,
                 messages=history,
-                temperature=config.temperature,
-                max_tokens=config.max_tokens,
-                stream=False
+                temperature=temperature,
+                max_tokens=max_tokens,
+                stream=False,
+                messages_serialized=self.get_chat_dicts(group_name)
             )
 
-            # 获取客户端并发送请求
+            # 获取客户端并发送请求（客户端由管理器缓存，连接保持复用）
             client = self.client_manager.get_client(provider, config)
-            async with client:
+            await self.client_manager.acquire(provider)
+            try:
                 response = await client.chat_completion(request)
+            finally:
+                await self.client_manager.release(provider)
 
-                if response.choices and response.choices[0]["message"]["content"]:
-                    reply = response.choices[0]["message"]["content"].strip()
-                    self.add_message(group_name, "assistant", reply)
-                    return reply
-                else:
-                    return "AI 没有返回有效结果，请稍后再试"
+            if response.choices and response.choices[0]["message"]["content"]:
+                reply = response.choices[0]["message"]["content"].strip()
+                self.add_message(group_name, "assistant", reply)
+                return reply
+            else:
+                return "AI 没有返回有效结果，请稍后再试"
 
         except Exception as e:
             print(f"AI调用失败: {str(e)}")
@@ -140,31 +177,45 @@ class ModernAIManager:
                 yield f"提供商 {provider} 未配置或未启用"
                 return
 
-            # 添加用户消息到历史
-            self.add_message(group_name, "user", message)
+            # 提前取出配置属性，热路径上避免重复LOAD_ATTR
+            model, temperature, max_tokens = config.model, config.temperature, config.max_tokens
+
+            # 添加用户消息到历史（整个流式回合只取一次时间戳）
+            t0 = time.time()
+            self.add_message(group_name, "user", message, timestamp=t0)
             history = self.get_chat_history(group_name)
 
             # 创建请求
             request = ChatCompletionRequest(
-                model=config.model,
+                model=model,
                 messages=history,
-                temperature=config.temperature,
-                max_tokens=config.max_tokens,
-                stream=True
+                temperature=temperature,
+                max_tokens=max_tokens,
+                stream=True,
+                messages_serialized=self.get_chat_dicts(group_name)
             )
 
             # 获取客户端并发送流式请求
             client = self.client_manager.get_client(provider, config)
-            full_response = ""
+            chunks: List[str] = []
+            # 关闭历史保留时无需缓冲，纯透传
+            keep_history = not self.ai_config.settings.auto_clear_history
 
-            async with client:
+            await self.client_manager.acquire(provider)
+            try:
                 async for chunk in client.stream_chat_completion(request, on_chunk or (lambda x: None)):
-                    full_response += chunk
+                    # 先转发给调用方，再按需缓冲
                     yield chunk
+                    if keep_history:
+                        chunks.append(chunk)
+            finally:
+                await self.client_manager.release(provider)
 
-            # 添加完整回复到历史
-            if full_response:
-                self.add_message(group_name, "assistant", full_response)
+            # 添加完整回复到历史（一次join，避免逐块拼接的重复拷贝）
+            if keep_history:
+                full_response = "".join(chunks)
+                if full_response:
+                    self.add_message(group_name, "assistant", full_response, timestamp=t0)
 
         except Exception as e:
             print(f"流式AI调用失败: {str(e)}")
@@ -189,14 +240,14 @@ class ModernAIManager:
     def clear_chat_history(self, group_name: str):
         """清除指定群的聊天历史"""
         if group_name in self.chat_histories:
-            system_prompt = self.ai_config.settings.system_prompt
-            self.chat_histories[group_name] = [
-                ChatMessage(role="system", content=system_prompt, timestamp=time.time())
-            ]
+            self._init_history(group_name)
 
     def clear_all_histories(self):
         """清除所有聊天历史"""
         self.chat_histories.clear()
+        self.chat_dicts.clear()
+        self._system_messages.clear()
+        self._system_dicts.clear()
 
     def get_config_manager(self):
         """获取AI配置管理器"""
@@ -13,6 +13,9 @@ class AIProvider(Enum):
     OPENAI = "openai"
     NEWAPI = "newapi"
 
+# 按值索引的提供商表，避免热路径上Enum.__call__的线性查找
+PROVIDER_BY_VALUE = {p.value: p for p in AIProvider}
+
 @dataclass
 class AIModel:
     """AI模型信息"""
@@ -25,15 +28,20 @@ class AIModel:
     cost_per_1k_tokens: float = 0.0
     available: bool = True
 
-@dataclass
+@dataclass(slots=True)
 class ChatMessage:
     """聊天消息"""
     role: Literal["system", "user", "assistant"]
     content: str
     timestamp: Optional[float] = None
     tokens: Optional[int] = None
+    # 发送请求用的序列化形式，构造时计算一次
+    _serialized: Dict[str, str] = field(init=False, repr=False)
 
-@dataclass
+    def __post_init__(self):
+        self._serialized = {"role": self.role, "content": self.content}
+
+@dataclass(slots=True)
 class AIProviderConfig:
     """AI提供商配置"""
     enabled: bool = False
@@ -55,6 +63,8 @@ class AISettings:
     system_prompt: str = "你是AI助手，名字叫VictorAI"
     max_history_length: int = 10
     auto_clear_history: bool = False
+    # 旧配置是否已迁移过，避免每次启动重复写盘
+    migrated: bool = False
     providers: Dict[str, AIProviderConfig] = field(default_factory=dict)
     
     def __post_init__(self):
@@ -107,6 +117,8 @@ class ChatCompletionRequest:
     max_tokens: int = 2000
     stream: bool = False
     system: Optional[str] = None
+    # 预序列化的消息列表（{"role":..,"content":..}），存在时客户端直接使用
+    messages_serialized: Optional[List[Dict[str, str]]] = None
 
 @dataclass
 class ChatCompletionResponse:
@@ -2,137 +2,302 @@
 模型获取器 - 用于从API获取可用模型列表
 """
 import asyncio
+import atexit
+import functools
+import hashlib
+import heapq
+import re
+import threading
+import time
 import aiohttp
 import json
+import logging
+from types import MappingProxyType
 from typing import List, Optional
 from .ai_types import AIProviderConfig
 
+# orjson解析大响应明显更快，未安装时退回标准库json
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+logger = logging.getLogger(__name__)
+
+# 各服务的默认模型表，导入时构建一次（元组+只读代理，实例间安全共享）
+_DEFAULT_MODELS = MappingProxyType({
+    "openai": (
+        "gpt-3.5-turbo",
+        "gpt-4",
+        "gpt-4-turbo",
+        "gpt-4o",
+        "gpt-4o-mini"
+    ),
+    "deepseek": (
+        "deepseek-chat",
+        "deepseek-coder"
+    ),
+    "qianwen": (
+        "qwen-turbo",
+        "qwen-plus",
+        "qwen-max",
+        "qwen-long"
+    ),
+    "gemini": (
+        "gemini-1.5-flash",
+        "gemini-1.5-pro",
+        "gemini-pro"
+    ),
+    "claude": (
+        "claude-3-haiku-20240307",
+        "claude-3-sonnet-20240229",
+        "claude-3-opus-20240229",
+        "claude-3-5-sonnet-20241022"
+    )
+})
+# 兜底的openai列表绑定一次，未知服务类型不必二次查表
+_OPENAI_DEFAULT = _DEFAULT_MODELS["openai"]
+
+# 服务类型识别：一次正则扫描替代逐个子串查找，大小写交给正则处理
+_SVC_RE = re.compile(
+    r"deepseek"
+    r"|dashscope\.aliyuncs\.com"
+    r"|generativelanguage\.googleapis\.com"
+    r"|api\.openai\.com"
+    r"|claude"
+    r"|anthropic",
+    re.IGNORECASE
+)
+_SVC_MAP = {
+    "deepseek": "deepseek",
+    "dashscope.aliyuncs.com": "qianwen",
+    "generativelanguage.googleapis.com": "gemini",
+    "api.openai.com": "openai",
+    "claude": "claude",
+    "anthropic": "claude",
+}
+
+# 模型列表响应的大小上限，防止异常端点撑爆内存
+_MAX_RESPONSE_BYTES = 4 * 1024 * 1024
+
+# uvloop可用时替换默认事件循环（Windows或未安装时静默跳过）
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
+# 模块级共享会话：同一事件循环内复用keep-alive连接，免去每次请求的TCP+TLS握手
+_session: Optional[aiohttp.ClientSession] = None
+_session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+async def _get_session() -> aiohttp.ClientSession:
+    """懒加载共享会话，循环切换时重建"""
+    global _session, _session_loop
+    loop = asyncio.get_running_loop()
+    if _session is None or _session.closed or _session_loop is not loop:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=50,
+                limit_per_host=10,
+                ttl_dns_cache=300,
+                keepalive_timeout=60
+            )
+        )
+        _session_loop = loop
+    return _session
+
+# 并发闸门：批量获取时最多同时压多少个请求，循环切换时与会话一样重建
+_fetch_limit = 16
+_fetch_sem: Optional[asyncio.Semaphore] = None
+_fetch_sem_loop: Optional[asyncio.AbstractEventLoop] = None
+
+def _get_fetch_sem() -> asyncio.Semaphore:
+    """懒加载并发信号量，绑定当前运行的循环"""
+    global _fetch_sem, _fetch_sem_loop
+    loop = asyncio.get_running_loop()
+    if _fetch_sem is None or _fetch_sem_loop is not loop:
+        _fetch_sem = asyncio.Semaphore(_fetch_limit)
+        _fetch_sem_loop = loop
+    return _fetch_sem
+
+# 常驻后台事件循环：所有同步调用复用同一个循环，共享会话不再因换循环而重建
+_bg_loop: Optional[asyncio.AbstractEventLoop] = None
+_bg_thread: Optional[threading.Thread] = None
+_bg_lock = threading.Lock()
+
+def _get_bg_loop() -> asyncio.AbstractEventLoop:
+    """懒启动常驻后台循环线程（daemon，随进程退出）"""
+    global _bg_loop, _bg_thread
+    with _bg_lock:
+        if _bg_loop is None or _bg_loop.is_closed():
+            _bg_loop = asyncio.new_event_loop()
+            _bg_thread = threading.Thread(
+                target=_bg_loop.run_forever,
+                name="model-fetcher-loop",
+                daemon=True
+            )
+            _bg_thread.start()
+    return _bg_loop
+
+def _close_session_at_exit():
+    """进程退出时尽力关闭共享会话"""
+    if (_session is None or _session.closed
+            or _session_loop is None or _session_loop.is_closed()):
+        return
+    try:
+        if _session_loop.is_running():
+            # 后台循环仍在运行，线程安全地提交关闭
+            asyncio.run_coroutine_threadsafe(
+                _session.close(), _session_loop
+            ).result(timeout=2)
+        else:
+            _session_loop.run_until_complete(_session.close())
+    except Exception:
+        pass
+
+atexit.register(_close_session_at_exit)
+
 class ModelFetcher:
     """模型获取器"""
-    
+
+    @staticmethod
+    def set_concurrency(limit: int):
+        """调整并发请求上限，下次进入事件循环时生效"""
+        global _fetch_limit, _fetch_sem
+        _fetch_limit = max(1, limit)
+        # 置空强制按新上限重建信号量
+        _fetch_sem = None
+
     @staticmethod
     async def fetch_models_from_api(api_key: str, base_url: str, timeout: int = 10) -> List[str]:
         """从API获取模型列表"""
         if not api_key or not base_url:
             return []
         
-        # 确保URL以/v1结尾
-        if not base_url.endswith('/v1'):
-            if base_url.endswith('/'):
-                base_url = base_url + 'v1'
-            else:
-                base_url = base_url + '/v1'
-        
-        models_url = f"{base_url}/models"
+        # 确保URL以/v1/models结尾
+        base = base_url.rstrip('/')
+        models_url = base + ('/models' if base.endswith('/v1') else '/v1/models')
         
         headers = {
             'Authorization': f'Bearer {api_key}',
-            'Content-Type': 'application/json'
+            'Content-Type': 'application/json',
+            # 模型列表高度可压缩，协商gzip传输
+            'Accept-Encoding': 'gzip'
         }
-        
+
+        # 有上次的ETag就带上，端点未变化时只回304不传列表本体
+        etag, last_models = model_cache.get_validator(api_key, base_url)
+        if etag:
+            headers['If-None-Match'] = etag
+
         try:
-            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=timeout)) as session:
-                async with session.get(models_url, headers=headers) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        if 'data' in data and isinstance(data['data'], list):
-                            models = []
-                            for model in data['data']:
-                                if isinstance(model, dict) and 'id' in model:
-                                    models.append(model['id'])
-                            return sorted(models)
-                    else:
-                        print(f"获取模型列表失败，状态码: {response.status}")
+            session = await _get_session()
+            async with _get_fetch_sem(), session.get(
+                models_url, headers=headers,
+                timeout=aiohttp.ClientTimeout(total=timeout)
+            ) as response:
+                if response.status == 304 and last_models is not None:
+                    return last_models
+                if response.status == 200:
+                    # 异常端点可能回超大响应，读取前先看声明长度
+                    if (response.content_length is not None
+                            and response.content_length > _MAX_RESPONSE_BYTES):
+                        logger.warning(
+                            "模型列表响应过大(%s字节)，已放弃解析",
+                            response.content_length
+                        )
                         return []
+                    # 直接读原始字节交给orjson，跳过aiohttp的json封装
+                    data = _loads(await response.read())
+                    if 'data' in data and isinstance(data['data'], list):
+                        # 一次生成器表达式完成过滤+取id，sorted直接消费
+                        models = sorted(
+                            model['id'] for model in data['data']
+                            if isinstance(model, dict) and 'id' in model
+                        )
+                        new_etag = response.headers.get('ETag')
+                        if new_etag:
+                            model_cache.store_validator(api_key, base_url, new_etag, models)
+                        return models
+                else:
+                    logger.warning("获取模型列表失败，状态码: %s", response.status)
+                    return []
         except asyncio.TimeoutError:
-            print("获取模型列表超时")
+            logger.warning("获取模型列表超时")
             return []
         except Exception as e:
-            print(f"获取模型列表出错: {e}")
+            logger.warning("获取模型列表出错: %s", e)
             return []
     
+    @staticmethod
+    async def fetch_models_many(
+        credentials: List[tuple], timeout: int = 10
+    ) -> List[List[str]]:
+        """并发获取多组(api_key, base_url)的模型列表，整体耗时≈最慢的一个"""
+        results = await asyncio.gather(
+            *(
+                ModelFetcher.fetch_models_from_api(api_key, base_url, timeout)
+                for api_key, base_url in credentials
+            ),
+            return_exceptions=True
+        )
+        # 单个失败不影响其它结果，异常按空列表处理
+        return [r if isinstance(r, list) else [] for r in results]
+
+    @staticmethod
+    def fetch_models_many_sync(
+        credentials: List[tuple], timeout: int = 10
+    ) -> List[List[str]]:
+        """同步并发获取多组凭据的模型列表"""
+        try:
+            future = asyncio.run_coroutine_threadsafe(
+                ModelFetcher.fetch_models_many(credentials, timeout),
+                _get_bg_loop()
+            )
+            return future.result(timeout=timeout + 5)
+        except Exception as e:
+            logger.error("批量获取模型列表失败: %s", e)
+            return [[] for _ in credentials]
+
     @staticmethod
     def fetch_models_sync(api_key: str, base_url: str, timeout: int = 10) -> List[str]:
         """同步获取模型列表"""
+        # EAFP探测运行中的循环：get_running_loop不会像get_event_loop那样误建新循环
         try:
-            # 创建新的事件循环或使用现有的
-            try:
-                loop = asyncio.get_event_loop()
-                if loop.is_running():
-                    # 如果事件循环正在运行，使用线程池
-                    import concurrent.futures
-                    with concurrent.futures.ThreadPoolExecutor() as executor:
-                        future = executor.submit(
-                            lambda: asyncio.run(
-                                ModelFetcher.fetch_models_from_api(api_key, base_url, timeout)
-                            )
-                        )
-                        return future.result(timeout=timeout + 5)
-                else:
-                    return loop.run_until_complete(
-                        ModelFetcher.fetch_models_from_api(api_key, base_url, timeout)
-                    )
-            except RuntimeError:
-                # 没有事件循环，创建新的
-                return asyncio.run(
-                    ModelFetcher.fetch_models_from_api(api_key, base_url, timeout)
-                )
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is not None and running is _bg_loop:
+            # 在后台循环内同步等待自己必然死锁，调用方应直接await异步接口
+            logger.error("不能在后台循环内同步获取模型列表，请使用fetch_models_from_api")
+            return []
+
+        try:
+            # 提交到常驻后台循环：不再每次起线程+新建循环，连接池得以跨调用复用
+            future = asyncio.run_coroutine_threadsafe(
+                ModelFetcher.fetch_models_from_api(api_key, base_url, timeout),
+                _get_bg_loop()
+            )
+            return future.result(timeout=timeout + 5)
         except Exception as e:
-            print(f"同步获取模型列表失败: {e}")
+            logger.error("同步获取模型列表失败: %s", e)
             return []
     
     @staticmethod
     def get_default_models(service_type: str = "openai") -> List[str]:
         """获取默认模型列表"""
-        default_models = {
-            "openai": [
-                "gpt-3.5-turbo",
-                "gpt-4",
-                "gpt-4-turbo",
-                "gpt-4o",
-                "gpt-4o-mini"
-            ],
-            "deepseek": [
-                "deepseek-chat",
-                "deepseek-coder"
-            ],
-            "qianwen": [
-                "qwen-turbo",
-                "qwen-plus",
-                "qwen-max",
-                "qwen-long"
-            ],
-            "gemini": [
-                "gemini-1.5-flash",
-                "gemini-1.5-pro",
-                "gemini-pro"
-            ],
-            "claude": [
-                "claude-3-haiku-20240307",
-                "claude-3-sonnet-20240229",
-                "claude-3-opus-20240229",
-                "claude-3-5-sonnet-20241022"
-            ]
-        }
-        return default_models.get(service_type, default_models["openai"])
+        return list(_DEFAULT_MODELS.get(service_type, _OPENAI_DEFAULT))
     
     @staticmethod
+    @functools.lru_cache(maxsize=32)
     def detect_service_type(base_url: str) -> str:
-        """根据URL检测服务类型"""
-        url_lower = base_url.lower()
-        
-        if "deepseek" in url_lower:
-            return "deepseek"
-        elif "dashscope.aliyuncs.com" in url_lower:
-            return "qianwen"
-        elif "generativelanguage.googleapis.com" in url_lower:
-            return "gemini"
-        elif "api.openai.com" in url_lower:
-            return "openai"
-        elif "claude" in url_lower or "anthropic" in url_lower:
-            return "claude"
-        else:
-            return "openai"  # 默认为OpenAI兼容
+        """根据URL检测服务类型（同一URL的正则匹配只做一次）"""
+        match = _SVC_RE.search(base_url)
+        if match:
+            return _SVC_MAP[match.group(0).lower()]
+        return "openai"  # 默认为OpenAI兼容
     
     @staticmethod
     def get_models_with_fallback(api_key: str, base_url: str, timeout: int = 10) -> List[str]:
@@ -141,53 +306,99 @@ class ModelFetcher:
             service_type = ModelFetcher.detect_service_type(base_url) if base_url else "openai"
             return ModelFetcher.get_default_models(service_type)
         
-        # 尝试从API获取
-        models = ModelFetcher.fetch_models_sync(api_key, base_url, timeout)
-        
+        # 最近失败过的端点在短窗口内直接走默认列表，不再重复请求
+        if model_cache.has_recent_failure(api_key, base_url):
+            models = []
+        else:
+            # 尝试从API获取
+            models = ModelFetcher.fetch_models_sync(api_key, base_url, timeout)
+            if not models:
+                model_cache.cache_failure(api_key, base_url)
+
         if models:
             return models
         else:
             # 失败时返回默认模型
             service_type = ModelFetcher.detect_service_type(base_url)
             default_models = ModelFetcher.get_default_models(service_type)
-            print(f"使用默认模型列表: {service_type}")
+            logger.info("使用默认模型列表: %s", service_type)
             return default_models
 
 class ModelCache:
-    """模型缓存"""
-    
+    """模型缓存（过期堆索引，机会式O(log n)淘汰，内存有界）"""
+
+    # 实例字段固定，__slots__省掉每实例__dict__
+    __slots__ = ('_cache', '_heap', '_cache_timeout', '_etags')
+
+    # 失败结果的短缓存：坏端点在此窗口内不再重复请求
+    FAILURE_TTL = 30
+
     def __init__(self):
         self._cache = {}
+        self._heap = []  # (过期时间, 缓存键)
         self._cache_timeout = 300  # 5分钟缓存
-    
+        # 缓存键 -> (ETag, 模型列表)，不随TTL过期，用于条件GET再验证
+        self._etags = {}
+
+    def _purge_expired(self, now: float):
+        """弹出所有已到期的堆项并删除对应的过期缓存"""
+        while self._heap and self._heap[0][0] <= now:
+            _, cache_key = heapq.heappop(self._heap)
+            entry = self._cache.get(cache_key)
+            # 重新写入会留下旧堆项，只删真正过期的条目
+            if entry is not None and now - entry['timestamp'] >= entry['ttl']:
+                del self._cache[cache_key]
+
     def get_cache_key(self, api_key: str, base_url: str) -> str:
         """生成缓存键"""
-        # 使用API key的前8位和base_url作为缓存键
-        key_prefix = api_key[:8] if len(api_key) >= 8 else api_key
-        return f"{key_prefix}_{base_url}"
-    
+        # 定长16字节摘要：键更短、哈希恒定，且不在内存中留API key明文前缀
+        return hashlib.blake2b(
+            f"{api_key}|{base_url}".encode(), digest_size=16
+        ).hexdigest()
+
     def get_cached_models(self, api_key: str, base_url: str) -> Optional[List[str]]:
         """获取缓存的模型列表"""
-        cache_key = self.get_cache_key(api_key, base_url)
-        if cache_key in self._cache:
-            cached_data = self._cache[cache_key]
-            import time
-            if time.time() - cached_data['timestamp'] < self._cache_timeout:
-                return cached_data['models']
+        now = time.time()
+        self._purge_expired(now)
+        entry = self._cache.get(self.get_cache_key(api_key, base_url))
+        if entry is not None and now - entry['timestamp'] < entry['ttl']:
+            return entry['models']
         return None
-    
-    def cache_models(self, api_key: str, base_url: str, models: List[str]):
+
+    def cache_models(self, api_key: str, base_url: str, models: List[str], ttl: int = None):
         """缓存模型列表"""
+        now = time.time()
+        self._purge_expired(now)
+        ttl = ttl if ttl is not None else self._cache_timeout
         cache_key = self.get_cache_key(api_key, base_url)
-        import time
         self._cache[cache_key] = {
             'models': models,
-            'timestamp': time.time()
+            'timestamp': now,
+            'ttl': ttl
         }
-    
+        heapq.heappush(self._heap, (now + ttl, cache_key))
+
+    def cache_failure(self, api_key: str, base_url: str):
+        """缓存一次失败结果（空列表，短TTL），避免连续敲打同一个坏端点"""
+        self.cache_models(api_key, base_url, [], ttl=self.FAILURE_TTL)
+
+    def has_recent_failure(self, api_key: str, base_url: str) -> bool:
+        """最近是否缓存过失败结果"""
+        return self.get_cached_models(api_key, base_url) == []
+
+    def get_validator(self, api_key: str, base_url: str):
+        """返回(ETag, 上次的模型列表)，没有记录时为(None, None)"""
+        return self._etags.get(self.get_cache_key(api_key, base_url), (None, None))
+
+    def store_validator(self, api_key: str, base_url: str, etag: str, models: List[str]):
+        """记录响应的ETag与对应结果，供下次条件GET使用"""
+        self._etags[self.get_cache_key(api_key, base_url)] = (etag, models)
+
     def clear_cache(self):
         """清空缓存"""
         self._cache.clear()
+        self._heap.clear()
+        self._etags.clear()
 
 # 全局模型缓存实例
 model_cache = ModelCache()
@@ -6,894 +6,986 @@
 from PySide6 import QtCore
 
 qt_resource_data = b"\
-\x00\x006z\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\xc8\x00\x00\x00\xc8\x08\x06\x00\x00\x00\xadX\xae\x9e\
-\x00\x00\x00\x01sRGB\x00\xae\xce\x1c\xe9\x00\x00 \
-\x00IDATx^\xed]\x07|TU\xd6\xff\xdf\
-\xf7\xa6\xa5L2\xe9\x04H\x08=\x84. R\xac\x08\
-*\xca\xda]\xcb\xa2\xb8\xba\x0a\xae\x0dw\xed\xba\xc2Z\
-\xd6\xb6v]uUT,\xac\xd8\x96\x15;\xa0\x80t\
-AzBM\x81\xf4d&\xc9$\xd3^\xf9\xbe\xfb&\
-m\x92\x99\xcc\x9b\x997!\x93y\x87_x3\xef\x9d\
-{\xee\xb9\xe7\xdd\xff\xbcw\xef=\xe7\x5c\x82\x13H\xe2\
-\xde\xbad\x8ep\x13\x08\xabI\x11\x04>\x950$\x85\
-\x00\xa9\x82 \xa6\x12\x86I\x81 \xa6\x8aDL% \
-)\x00bO\xa0\xaaj\xd5\xca[\xa0I\x84XCD\
-R\x0d\x86T\x8b\x82P\xc3\xd0#P-\x0ab\x0d\xc3\
-\xb0\xd5\x22\xcf\xd5hD\xcd\xafddb\xad\xf2\xd5\xcb\
-\x93H\xe4\xb1)\xc3e\xdf_5\x8c\x80\x9dH\x08\xa6\
-A\xc4i\x84\x90Q\xcaHV\xa5\xf4f\x0b\x88\xa2\xb8\
-\x07\x04kE\x11\xbf\x88\xe0\xb7\x19F\xa4\x1d\xe8\xae\xf6\
-\x86\x15 \xce|\xcbD@\x9c\x0a`\x22\x019\x05\x10\
-\x87vW\xc3\xd4zz\xb3\x05\xc8A\x11\xe2&\x00\xdb\
-\x00\xb2A\x97k\xda\x16\xae\xd6\x86\x05 \xf6}\xb5\xb3\
-\x19\xc2\xcc%D\xbc2\x5c\x8a\xabrU\x0b\xb4X@\
-\x14\xc92A\x14\x96\x1a\xf2\x92\xbfV\xda*\x8a\x01D\
-\x14E\x86?`\x99+\x8a\xb8\x16\xc0YJ+\xaa\xca\
+\x00\x006z\x89PNG\x0d\x0a\x1a\x0a\x00\x00\
+\x00\x0dIHDR\x00\x00\x00\xc8\x00\x00\x00\xc8\
+\x08\x06\x00\x00\x00\xadX\xae\x9e\x00\x00\
+\x00\x01sRGB\x00\xae\xce\x1c\xe9\x00\x00 \
+\x00IDATx^\xed]\x07|TU\xd6\xff\xdf\xf7\xa6\
+\xa5L2\xe9\x04H\x08=\x84. R\xac\x08*\xca\xda\
+]\xcb\xa2\xb8\xba\x0a\xae\x0dw\xed\xba\xc2Z\
+\xd6\xb6v]uUT,\xac\xd8\x96\x15;\xa0\x80tAzBM\
+\x81\xf4d&\xc9$\xd3^\xf9\xbe\xfb&m\x92\x99\
+\xcc\x9b\x997!\x93y\x87_x3\xef\x9d{\xee\xb9\
+\xe7\xdd\xff\xbcw\xef=\xe7\\\x82\x13H\xe2\
+\xde\xbad\x8ep\x13\x08\xabI\x11\x04>\x950$\
+\x85\x00\xa9\x82 \xa6\x12\x86I\x81 \xa6\x8aD\
+L% )\x00bO\xa0\xaaj\xd5\xca[\xa0I\x84XCDR\
+\x0d\x86T\x8b\x82P\xc3\xd0#P-\x0ab\x0d\xc3\
+\xb0\xd5\"\xcf\xd5hD\xcd\xafddb\xad\xf2\xd5\
+\xcb\x93H\xe4\xb1)\xc3e\xdf_5\x8c\x80\x9dH\
+\x08\xa6A\xc4i\x84\x90Q\xcaHV\xa5\xf4f\x0b\
+\x88\xa2\xb8\x07\x04kE\x11\xbf\x88\xe0\xb7\
+\x19F\xa4\x1d\xe8\xae\xf6\x86\x15 \xce|\xcbD\
+@\x9c\x0a`\"\x019\x05\x10\x87vW\xc3\xd4zz\
+\xb3\x05\xc8A\x11\xe2&\x00\xdb\x00\xb2A\x97k\
+\xda\x16\xae\xd6\x86\x05 \xf6}\xb5\xb3\x19\
+\xc2\xcc%D\xbc2\\\x8a\xabrU\x0b\xb4X@\x14\
+\xc92A\x14\x96\x1a\xf2\x92\xbfV\xda*\x8a\x01\
+D\x14E\x86?`\x99+\x8a\xb8\x16\xc0YJ+\xaa\xca\
 S- \xc3\x02\xab\x09\xc1\xfb\xec0\xd3RB\x88 \
-\x83\xdf/K\xc8\x00\x11\x8fX38\xa7\xf3Z\x80\xcc\
-\x050\xdao\x8d*\x83j\x81\xf0[`7 .\xd5\
-\xe8t\xef\x93A\xf1\x15\xa1T\x17\x12@\xb8\x82\xba+\
-\x05Qx\x82\x00\x03CQB-\xabZ \x1c\x16\x10\
-\x81\xa3\x0ca\x1e\xd0\x0cO\x5c\x16\xac\xfc\xa0\x01\xe2\xca\
-7?\x0f\xe0\xce`+V\xcb\xa9\x16\xe8F\x0b\xbc\xa0\
-\xcdMZ\x18L}\x01\x03D,)\x89\xe1\x1a\x8d\xab\
-\x00qJ0\x15\xaaeT\x0b\x9c\x18\x0b\x90\x8d\x9a\xb8\
-\x86\x19$+\xcb\x16H\xfd\x01\x01\xc4u\xc0r6\x04\
-\xf1;\x00L \x95\xa8\xbc\xaa\x05z\x88\x05\x040\xe4\
-\x1c\xed0\xd3\x8fr\xf5\x91\x0d\x10\xd7\xfe\x9aE \xcc\
-#r\x05\xab|\x81[@0; Z9\x88M<\
-D\xbb\x0b\xa2]\x00l\x1c\x04\x1b\x0f\xd2|\x04\x0b\x80\
-e\xc0\xb0\x04\x22\xcb\xa0\xe5;a\x09\x88\x8e\x01\x93b\
-\x00I\xd1\x831\xe9@b5\x81+\x11\x05%\x04Q\
-X\xac\x1f\x91\xb2HNSe\x01\xc4\xb1\xafv\x14\xc3\
-\x90\xddr\x04\xaa<\xf2- \xd6\xb9 T\xdb\xc0\x97\
-\xd9 T\xd8 \xday\xf9\x85ep\x92x-\x98d\
-\x1d\x88I'\x01\x86\xc9\x88\x01\xd1Q\x84\xa9$\x08\xe2\
-h}^\xf2\x1e\x7f\x96\xf0\x0b\x10q\xef^\x1d\xc7\xf6\
-m\xa2\xbf[\xfe\x84\xa9\xd7\xfdX\xc0\xca\x81\xafh\x02\
-_\xe5\x80Pi\x83\xd8\xe0\xeaV\x93\x11\x03\x0b\xa6o\
-,\xd8~\xf4/\x0e`\xfd\xde\xfen\xd5\xaf\x9b+\xe3\
-5|i,\x199\xd2\xd9U\xbd~-\xe4\xcc\xaf\xfd\
-\x90\x80\x5c\xdd\xcd\xca\xf7\x9e\xeaD\x11|I#\x84\x92\
-Fp\xc5\x8d\x80 \xf6\x88\xb6\x91X\x0a\x968\xb0\xfd\
-c\xc1\xf6\x8d\x05\x88\xdf\xae\xd0#\xf4VR\x09\x11\xe2\
-G\xba\xdc\xe4k\x82\x06\x08\x9fo\xbeS\x00\xe8t\xae\
-J\x01Z@\xac\xb6\x83+i\x94\xc0\xd1\xddO\x8a\x00\
-U\x051j\xc1\x0e6B\x93k\x02\x1d\xcbD\x131\
-\xc0B67\xe9\x05_m\xf6i\x0d\xae\xa0n\xb6(\
-\x0a+\xa3\xc9XJ\xb4\x95?T\x0f\xbe\xa8\x11|9\
-}+\x8d,b\x92t\xd0\x0cO\x04;8!\xb2\x14\
-\x0fQ[B\x98\xf35\xc3\x13\xbd\xfaqy\x05\x08u\
-\x1fq9\x5c\xeb\x09\xc1\x90\x10\xeb\x8e\x9a\xe2\xfc\xb1F\
-\xf0\x05\xf5\x11\x09\x8c\x8e7\x89\xcd\x8c\x05K\x81\xd2/\
-:BpD\x11\x87\xb4z\xedton)^\x01\xe2\
-\xca\xaf\xbd\x1b OGM\xef\x0e\xa1\xa1\xd2\xabTA\
-\x1d\xb8Bk\x08RzfQ\xcd #\xd8\xdcD0\
-I\xfa\x9e\xa9\xa0\xa2Z\x89\xf7hs\x93\x9f\xe9(\xb2\
-\x13@\xa8W.W`\xf9Mu<\xf4c}+\x07\
-W\x81\x05\x5c~\x9d\xa2\xb7\xa9\xa7\x09#\x06\x0d\xb4\xe3\
-\x93\xc1\x0e2\xf64\xd5\x94\xd6g\xb7f\xb8i\x5cG\
-/\xe0N\x00\xe1\x0a\xcc\xd7\x89\x22\xdeU\xba\xf6\xde$\
-\x8f?P\x0f\xd7\xeeZ\xc5\xd7-z\xb2\x8d4#L\
-\xd0\x9eD#\x9f{/\x11\x82y\x9a\xe1I\xef\xb5o\
-a'\x80\xb8\xf2\xcd\xab\xd4x\x0e\xef\x9d@h\xe2\xc0\
-\xef\xac\x05w\xa4\xa1\xf7\xf6\x92.ZF\xc7$\xba3\
-2{s\xdbWks\x93f\xf8\x04\x08\x8d\x04d\x19\
-\xa2\xce\x5cy\xe9\x02\x5c\xb1\x15\xdc\xceZ\x88\xf5\xdd\xbb\
-\xb8\xd7\xd3z#\x9b\x13\x07\xdd\xb4>=M-\xc5\xf4\
-\xe1\x05\xf1\xfc\xf6\x91\x89\x1eO\x10\xe7~\xcb\xc7j\x98\
-lg[\xbb~\xab\x01\xb7\xd7\xa2\xd8M\x88tA\x9a\
-\xd1I\xd0\x8eI\x8e\xf4fx\xd5\x9f\x86\xef\xeaF\x98\
-\xaej\xb9\xd8\x0a\x10\x9a`\x81@\xdc\xda+[\x1dB\
-\xa3\x9c\xbf\x94\x83/l\x0cAB\xef,\xda\xabA\x02\
-2\xa9%\x11D;\x80\x98\xef$\xea\xaa\xb9Gov\
-n\xae\x02]\xf8S\xc9\xbb\x05\xb4\xe3S\xa0\xc93\xf5\
-:\xf3\x88\xc0B]\xf3\xeaz+@\xb8\x02\xcb\xc7\xa2\
-\xa8f!i\xb9\xdb\xce\xad\xd5\xe0\x0f\xf4\xee)\x5c%\
-z\xb6\xee\xb4>`\xb3\xe2\x94\x10\xd5cd\x10B\x96\
-i\x86\xbb_\xb3\xda\x00\x92o>\x22\xaa\xb1\xe5\xd2M\
-r\xed\xa8\x01\xb7O\x1ds\xc8\xe9\xb1\xd4\xe9\x91\xcel\
-\xf5\xa6\xc5D\x02\x1c\xd5\xe4&\x0dj\x05\x88coM\
-\x1e\xc32{\xe5\x18\xa4\xb7\xf3\xb8v\xd5\x82\xdbm\xee\
-\xed\xcdT\xb4}4\xceDO\xa7\x7f5\xbd\xc7\xd1Q\
-\xe0\x85\x91\xfa\x91)\xfb\xa4\x16q\x05\x96\x1bEQ\xfc\
-\xb7\xa2V\x8b@a\xd4\xf3\xd6\xb9\xb6<\x025?\xf1\
-*SO`\xed\x84\xde\xb3\x90H\x08\xf9\x93f\xb8\xe9\
--7@\xf2-\xef\x88\x10\xaf?\xf1f>q\x1aP\
-\x97t\xc7\x9a\xb2\x1e\xef\x9a~\xe2,\xe4\xbff\xdd\x8c\
-L\xb0}z\x87\x83#\x01Y\xa2\xc95\xfdQ\x02\x88\
-+\xdf\xb2\x1f\x10s\xfd\x9b\xa0\xf7r\xd0'\x07}\x82\
-\xa8\x14\xbc\x05(8(Hz\x07\x91|m\xaei\x04\
-\x11\x0b\xeaS9\x91\xaf\xea\x1d\x8d\x0a\xae\x15\xea\xb8#\
-8\xbby+E_\xb3\xe8\xebVo \x0da\xd3\x88\
-k_\xcdL0\xcc\xf7\xbd\xa1A\xc1\xb4\x81?\xde\x04\
-\xe7Oe\xc1\x14U\xcbx\xb1\x00\x8d{\xd7\x9d\xd7\x1f\
-Lo\xc8\xa8\x22\x08\xb3\x08M\x1f*\x8a\xc2\xc7\xd1z\
-\xb7]\xeb*@\xfd\xacTR\xce\x02\x9a\x91I\xd0\x8e\
-\x8b|W\x14B\x98\xab\x88s\x7f\xed\xad\x84\x90\x97\x95\
-3O\xe4H\x12\xcamp\xac*\x8d\x1c\x85#DS\
-\xa2a\xa0;\xa7\x9f\x94j(\x92I\x14\xc5\xdb\x88c\
-\x7f\xcd\x22&J\x13\xc29\xd7\x97K\xf1\xe3*)o\
-\x01\x1a\xdb\xae\x9d\x98\xaa\xbc\xe0n\x94H\x13\xcc\x11\xae\
-\xc0\xfc\xb2(\xe2\xd6n\xac\xb7GT%T;\xe0\xf8\
-\xeeX\x8f\xd0\xa5\xb7*\xa1??+\xa2\x9f\x22\x84\xe0\
-\x15\xfa\x8a\xf51!$\xeav\x82rn\xaa\x04\x7f8\
-:\x03\x9f\xba\x0b\x90\x9a1\xc9\xd0\x8eN\xea\xae\xea\x14\
-\xafG\x14\xc5e\xc4U`\xf9\x1e\xa28Sq\xe9=\
-Y`\x83\x0b\xb6\x15\xc5=Y\xc3^\xa1\x1bI\xd2\xc1\
-0;+r\xdbB\xc8\x0f\xc4\xb5\xdf\xbc\x1d\x04\xe3#\
-\xb7\x15\x81kNc\xca\x9d[\xbbg\xe9\xc7\x22\xd8Q\
-\xcc\xd5\xa1At\xa1Ap\xa0\x9ew\xa0\xc4V\x85\x0a\
-\x9b\x19fg\x03\x1a\x1cM\xb0\xb9\x9a`s\xda\xe1t\
-\xd9\xc1\xf3\x9c\xcf\x06\x11\x86\x05\xcb0\xa0\xff4\x0c\x0b\
-=\xa3\x85\x81\xd5\x22\x8e\xd5\xa3\x9f>\x09\xc3\xe22\x91\
-\x1d\x9b\x86\xec\x98Td\xc7\xa6BCN|\xb6X\xea\
-\xc8\x18\xb1\xe9\x83D\xec \xce\xfc\xdab\x02\x12\xc10\
-\x0f\x1c \xce\x9f\xcb\xc0\x1fS>\xb1\x9b]\xe4p\x90\
+\x83\xdf/K\xc8\x00\x11\x8fX38\xa7\xf3Z\x80\
+\xcc\x050\xdao\x8d*\x83j\x81\xf0[`7 .\xd5\
+\xe8t\xef\x93A\xf1\x15\xa1T\x17\x12@\xb8\x82\
+\xba+\x05Qx\x82\x00\x03CQB-\xabZ \x1c\x16\
+\x10\x81\xa3\x0ca\x1e\xd0\x0cO\\\x16\xac\xfc\
+\xa0\x01\xe2\xca7?\x0f\xe0\xce`+V\xcb\xa9\
+\x16\xe8F\x0b\xbc\xa0\xcdMZ\x18L}\x01\x03D,)\
+\x89\xe1\x1a\x8d\xab\x00qJ0\x15\xaaeT\x0b\
+\x9c\x18\x0b\x90\x8d\x9a\xb8\x86\x19$+\xcb\
+\x16H\xfd\x01\x01\xc4u\xc0r6\x04\xf1;\x00L \
+\x95\xa8\xbc\xaa\x05z\x88\x05\x040\xe4\x1c\
+\xed0\xd3\x8fr\xf5\x91\x0d\x10\xd7\xfe\x9aE \
+\xcc#r\x05\xab|\x81[@0; Z9\x88M<D\xbb\x0b\
+\xa2]\x00l\x1c\x04\x1b\x0f\xd2|\x04\x0b\x80e\
+\xc0\xb0\x04\"\xcb\xa0\xe5;a\x09\x88\x8e\x01\
+\x93b\x00I\xd1\x831\xe9@b5\x81+\x11\x05%\x04\
+QX\xac\x1f\x91\xb2HNSe\x01\xc4\xb1\xafv\x14\
+\xc3\x90\xddr\x04\xaa<\xf2- \xd6\xb9 T\xdb\
+\xc0\x97\xd9 T\xd8 \xday\xf9\x85ep\x92x-\x98\
+d\x1d\x88I'\x01\x86\xc9\x88\x01\xd1Q\x84\xa9\
+$\x08\xe2h}^\xf2\x1e\x7f\x96\xf0\x0b\x10q\
+\xef^\x1d\xc7\xf6m\xa2\xbf[\xfe\x84\xa9\xd7\
+\xfdX\xc0\xca\x81\xafh\x02_\xe5\x80Pi\x83\
+\xd8\xe0\xeaV\x93\x11\x03\x0b\xa6o,\xd8~\xf4\
+/\x0e`\xfd\xde\xfen\xd5\xaf\x9b+\xe35|i,\x19\
+9\xd2\xd9U\xbd~-\xe4\xcc\xaf\xfd\x90\x80\\\
+\xdd\xcd\xca\xf7\x9e\xeaD\x11|I#\x84\x92Fp\
+\xc5\x8d\x80 \xf6\x88\xb6\x91X\x0a\x968\xb0\
+\xfdc\xc1\xf6\x8d\x05\x88\xdf\xae\xd0#\xf4VR\
+\x09\x11\xe2G\xba\xdc\xe4k\x82\x06\x08\x9fo\
+\xbeS\x00\xe8t\xaeJ\x01Z@\xac\xb6\x83+i\x94\
+\xc0\xd1\xddO\x8a\x00U\x051j\xc1\x0e6B\x93k\
+\x02\x1d\xcbD\x131\xc0B67\xe9\x05_m\xf6i\x0d\
+\xae\xa0n\xb6(\x0a+\xa3\xc9XJ\xb4\x95?T\x0f\
+\xbe\xa8\x11|9}+\x8d,b\x92t\xd0\x0cO\x04;8!\
+\xb2\x14\x0fQ[B\x98\xf35\xc3\x13\xbd\xfaqy\
+\x05\x08u\x1fq9\\\xeb\x09\xc1\x90\x10\xeb\
+\x8e\x9a\xe2\xfc\xb1F\xf0\x05\xf5\x11\x09\
+\x8c\x8e7\x89\xcd\x8c\x05K\x81\xd2/:BpD\x11\
+\x87\xb4z\xedton)^\x01\xe2\xca\xaf\xbd\x1b O\
+GM\xef\x0e\xa1\xa1\xd2\xabTA\x1d\xb8Bk\x08Rz\
+fQ\xcd #\xd8\xdcD0I\xfa\x9e\xa9\xa0\xa2Z\x89\
+\xf7hs\x93\x9f\xe9(\xb2\x13@\xa8W.W`\xf9Mu<\
+\xf4c}+\x07W\x81\x05\\~\x9d\xa2\xb7\xa9\xa7\
+\x09#\x06\x0d\xb4\xe3\x93\xc1\x0e2\xf64\xd5\
+\x94\xd6g\xb7f\xb8i\\G/\xe0N\x00\xe1\x0a\xcc\
+\xd7\x89\"\xdeU\xba\xf6\xde$\x8f?P\x0f\xd7\
+\xeeZ\xc5\xd7-z\xb2\x8d4#L\xd0\x9eD#\x9f{/\
+\x11\x82y\x9a\xe1I\xef\xb5oa'\x80\xb8\xf2\
+\xcd\xab\xd4x\x0e\xef\x9d@h\xe2\xc0\xef\xac\
+\x05w\xa4\xa1\xf7\xf6\x92.ZF\xc7$\xba32{s\
+\xdbWks\x93f\xf8\x04\x08\x8d\x04d\x19\xa2\
+\xce\\y\xe9\x02\\\xb1\x15\xdc\xceZ\x88\xf5\
+\xdd\xbb\xb8\xd7\xd3z#\x9b\x13\x07\xdd\xb4>=\
+M-\xc5\xf4\xe1\x05\xf1\xfc\xf6\x91\x89\x1eO\
+\x10\xe7~\xcb\xc7j\x98lg[\xbb~\xab\x01\xb7\
+\xd7\xa2\xd8M\x88tA\x9a\xd1I\xd0\x8eI\x8e\
+\xf4fx\xd5\x9f\x86\xef\xeaF\x98\xaej\xb9\xd8\
+\x0a\x10\x9a`\x81@\xdc\xda+[\x1dB\xa3\x9c\
+\xbf\x94\x83/l\x0cAB\xef,\xda\xabA\x022\xa9%\
+\x11D;\x80\x98\xef$\xea\xaa\xb9Govn\xae\x02]\
+\xf8S\xc9\xbb\x05\xb4\xe3S\xa0\xc93\xf5:\xf3\
+\x88\xc0B]\xf3\xeaz+@\xb8\x02\xcb\xc7\xa2\
+\xa8f!i\xb9\xdb\xce\xad\xd5\xe0\x0f\xf4\xee)\
+\\%z\xb6\xee\xb4>`\xb3\xe2\x94\x10\xd5cd\x10\
+B\x96i\x86\xbb_\xb3\xda\x00\x92o>\"\xaa\xb1\
+\xe5\xd2Mr\xed\xa8\x01\xb7O\x1ds\xc8\xe9\xb1\
+\xd4\xe9\x91\xcel\xf5\xa6\xc5D\x02\x1c\xd5\
+\xe4&\x0dj\x05\x88coM\x1e\xc32{\xe5\x18\xa4\
+\xb7\xf3\xb8v\xd5\x82\xdbm\xee\xed\xcdT\xb4}\
+4\xceDO\xa7\x7f5\xbd\xc7\xd1Q\xe0\x85\x91\
+\xfa\x91)\xfb\xa4\x16q\x05\x96\x1bEQ\xfc\xb7\
+\xa2V\x8b@a\xd4\xf3\xd6\xb9\xb6<\x025?\xf1*S\
+O`\xed\x84\xde\xb3\x90H\x08\xf9\x93f\xb8\xe9\
+-7@\xf2-\xef\x88\x10\xaf?\xf1f>q\x1aP\x97t\
+\xc7\x9a\xb2\x1e\xef\x9a~\xe2,\xe4\xbff\xdd\
+\x8cL\xb0}z\x87\x83#\x01Y\xa2\xc95\xfdQ\x02\
+\x88+\xdf\xb2\x1f\x10s\xfd\x9b\xa0\xf7r\xd0'\
+\x07}\x82\xa8\x14\xbc\x05(8(Hz\x07\x91|m\xae\
+i\x04\x11\x0b\xeaS9\x91\xaf\xea\x1d\x8d\x0a\
+\xae\x15\xea\xb8#8\xbby+E_\xb3\xe8\xebVo \
+\x0da\xd3\x88k_\xcdL0\xcc\xf7\xbd\xa1A\xc1\
+\xb4\x81?\xde\x04\xe7Oe\xc1\x14U\xcbx\xb1\
+\x00\x8d{\xd7\x9d\xd7\x1fLo\xc8\xa8\"\x08\
+\xb3\x08M\x1f*\x8a\xc2\xc7\xd1z\xb7]\xeb*@\
+\xfd\xacTR\xce\x02\x9a\x91I\xd0\x8e\x8b|W\
+\x14B\x98\xab\x88s\x7f\xed\xad\x84\x90\x97\
+\x953O\xe4H\x12\xcamp\xac*\x8d\x1c\x85#DS\
+\xa2a\xa0;\xa7\x9f\x94j(\x92I\x14\xc5\xdb\
+\x88c\x7f\xcd\"&J\x13\xc29\xd7\x97K\xf1\xe3*\
+)o\x01\x1a\xdb\xae\x9d\x98\xaa\xbc\xe0n\x94H\
+\x13\xcc\x11\xae\xc0\xfc\xb2(\xe2\xd6n\xac\
+\xb7GT%T;\xe0\xf8\xeeX\x8f\xd0\xa5\xb7*\xa1?\
+?+\xa2\x9f\"\x84\xe0\x15\xfa\x8a\xf51!$\xeav\
+\x82rn\xaa\x04\x7f8:\x03\x9f\xba\x0b\x90\x9a\
+1\xc9\xd0\x8eN\xea\xae\xea\x14\xafG\x14\xc5e\
+\xc4U`\xf9\x1e\xa28Sq\xe9=Y`\x83\x0b\xb6\x15\
+\xc5=Y\xc3^\xa1\x1bI\xd2\xc10;+r\xdbB\xc8\
+\x0f\xc4\xb5\xdf\xbc\x1d\x04\xe3#\xb7\x15\
+\x81kNc\xca\x9d[\xbbg\xe9\xc7\"\xd8Q\xcc\xd5\
+\xa1At\xa1Ap\xa0\x9ew\xa0\xc4V\x85\x0a\x9b\
+\x19fg\x03\x1a\x1cM\xb0\xb9\x9a`s\xda\xe1t\
+\xd9\xc1\xf3\x9c\xcf\x06\x11\x86\x05\xcb0\
+\xa0\xff4\x0c\x0b=\xa3\x85\x81\xd5\"\x8e\xd5\
+\xa3\x9f>\x09\xc3\xe22\x91\x1d\x9b\x86\xec\
+\x98Td\xc7\xa6BCN|\xb6X\xea\xc8\x18\xb1\xe9\
+\x83D\xec \xce\xfc\xdab\x02\x12\xc10\x0f\x1c\
+ \xce\x9f\xcb\xc0\x1fS>\xb1\x9b]\xe4p\x90\
 \xab\xc5!g-\x0esf\x1cv\xd5\xa2\xb4\xa1\x12.\
-\x87\x0d\x9c\xc3\x0e\xcea\x83\xcba\x07DE\xb6\xcf\xf3\
-\xdb\xf0\x0cC\x22\x86\xc6\xf5\xc5\xd8\xc4\x1c\x8cN\xc8\xc6\
-0c?h\xbb\x194\x9a\x81Fh\xa7\xa6\xfb\xd5\xb5\
-'2\x88\x10K\x88+\xdfL\xa7qz\x87\x03\x8d\x0c\
-+\xd3\xad\x05\x1c+\x8a \xf2\xca\xe4\xc8\xdd\xeb\xaa\xc2\
-.g%~s\x94\xe3\x08\xe7\xf6\x02v6Y\xe1\xb0\
-\xd6\xc3\xdeX\x07\x9e\x02\xa2\x87\x90\x8e\xd1`Lb\x0e\
-F\xc4\xf7\xc3\xb0\xf8~\x98\x922Lz\x0a\x85\x93\x18\
+\x87\x0d\x9c\xc3\x0e\xcea\x83\xcba\x07DE\xb6\
+\xcf\xf3\xdb\xf0\x0cC\"\x86\xc6\xf5\xc5\xd8\
+\xc4\x1c\x8cN\xc8\xc60c?h\xbb\x194\x9a\x81Fh\
+\xa7\xa6\xfb\xd5\xb5'2\x88\x10K\x88+\xdfL\
+\xa7qz\x87\x03\x8d\x0c+\xd3\xad\x05\x1c+\x8a\
+ \xf2\xca\xe4\xc8\xdd\xeb\xaa\xc2.g%~s\x94\
+\xe3\x08\xe7\xf6\x02v6Y\xe1\xb0\xd6\xc3\xdeX\
+\x07\x9e\x02\xa2\x87\x90\x8e\xd1`Lb\x0eF\xc4\
+\xf7\xc3\xb0\xf8~\x98\x922Lz\x0a\x85\x93\x18\
 \x83\x06\xfa\x8b\x06Dj\xea\xf3&\x0a\x10ezJ8\
 \xad\xac\xa0l\xfep=\x9c\x9bB{\xbd*p\xd5\xe0\
-\x07\xdb\x11\xecqU\xa2\x86o\xdb\xb0\xa8\xa1\xaa\x0c\x8e\
-\xc6zpv\xe5\x9fN\x0a\x9a\xa0UT?C2f\
-\xa4\x8f\xc1\x8c\xb41\x18\x14\x97\x11\x8e*$\x99\xd4\x15\
-\x9e\x89\xd0,\x8dQ\x07\x10\xe7\xfa\x0a\xf0E\xc1\xaf\x9c\
-\x7fc;\x84w\x1ah^\xbd6\xa2O\x8c\x86\xaaR\
-\xb8l\x91\xbb\xa6rv\xda\x18\x09,\xd3SF(\x0e\
-\x94H\xce\xa9\x15U\x00\x11\x1d\xf4\xf5\xaa\x18\xa23\xb8\
-1\xc0\xeb\x0d\xbfb\x95\xed\xa8G\x07j\xb2\xd4\xa0\xbe\
-\xbc\xf7\xcc\x88\xe5\x1a\xfb\xe1\xe6\x9cY\x98\x98\xa4\x5cZ\
-f\x1am\xa8\x9f\xdd_q\xe0u\x87\xc0\xa8\x02\x08_\
-b\x85smp\xdbf\xd3\xb1\xc6\x22\xf3\xcf\x9d\xeeI\
-m\xf1Ai\xcc\xd1\x15\xc5\xc5\xc6\xe0\xc5'\x16\xe3\xe0\
-\x91\xa38\x5cX\x84\xa2\x92\xe3(>v\x1c\x15U\xd5\
-\x8a\xdd\xe3\x96:\x8e\x14\x16\xe3Pa!\xa4\xe3\xd1B\
-X\xea\x82K:\xb1p\xc8\x1c\x5c\xd2\xf7\x14\xc5\xf43\
-\x5c\x90\x0d\x92\x18\xde\xf1\x8eb\xca\xb6\x13\x14U\x00\x09\
-%\xbf\xd5\xb3u\x1b\xb1\xd9q\xdc\xe3\x1e8\xac\x16\x98\
-\x8fy>Q:\xde\xa4\x8bf\x9f\x83E\xf7x\xdf\x81\
-\xf8\xf5w?\x00\xfd\x0b\x95\xba\xaa\xe3\x99W\xde\xc0\x87\
-\x9f~\x11T\x15\xff\x1c5\x0f''\x0f\x0d\xaal\xc7\
-B4m)}\xd5\x8a4\x8a*\x808V\x97A(\
-\x0b|\x00]\xc1[qk\xcd\xb7\x9d\xeem}y\x09\
-\x9a,\xbe\x9f\x02\x97\xce\x99\x8d\x87\xffr{\x97}\xe2\
-\xf1\xe7^\xc6\xf2\x15\xc1'\xb3\x94S\xc7\xed\xf7?\x82\
-\xb5\x1b7\x07\xdc7\xcfN\x1f\x8bGr\xaf\x08\xb8\x9c\
-\xb7\x02lf\x1ctgE^F\xc6\xa8\x02\x88\xfd\xd3\
-B\xd0qH\xa0\xb4\xc5q\x1c\xcf\xd4m\xecT\xac\xa6\
-\xe8\x80\xcf\x81y\xee\xd0\xc1x\xe7\xa5g\x11\x1b\x13\xd3\
-eu\xf4\x95\xeb\xd2y7\x07\xaa\x92\xc4/\xb7\x8eM\
-\x9fo\xc7\xfc\x97\x1e\x08\xaa\x8e\xb7NZ\x80\xe1\xf1\xa1\
-\x8f\x1f\x08C`\xb8r`\xc4m\xf5\x165\x00\x11-\
-N\xd8W\x96\x04\xd5I>\xb1\xee\xc3\xf2\xa6}\x1ee\
-E\x81G\xe5\xc1\xdd\x10E\xef\xb3\xe4\x17\xcc\x9a\x81\xc7\
-\x1e\xb8[V}\xe3\xce8W\x16_G&\xd9u\xfc\
-$\xe0\xf5y\xef\xe3\xf5\x9ce\x01\xd7s\xff\xb0K0\
-\xbb\xcf\x84\x80\xcby+\x10\x89\xab\xeaQ\x03\x10\x9a!\
-\x91fJ\x0c\x86\xbc\x8d?\xe8\x94.}\x82\xf8\xa2\xf9\
-\xf3\xfe\x00\xfa'\x87\x1e\x1d\xfe\x02>\xcb\xec\xfc\x0a\xe7\
-\xaf\xac\xec:~\x12\x8039\x5c}\xd2]\xd8g<\
-\xe4O\xac\xc7\xf5?d\x9d\x8e\x9b\x07\xce\x0a\xa8\x8c/\
-\xe6H\x0c\xa4\x8a\x1a\x80\x84\x92Ft~\xf5J\xd4\x08\
-m\x0b\x82\xb4\x03\xd0\xb1\x07\x1d\x83\xf8\xa2g\x16=\x88\
-\x99g\x9c*\xabc\xedL\xdc\x89\xeb\xc6\xdf+\x8b\xb7\
-=\x93\xec:\x9a\x01\xf2\xc4\xd0\xd7\xf1I_\xaf[\xf1\
-\xf9\xac\xfb\xb4\xd4<<\x9e\xd7\xe5F\xb0\xb2\xf5f\xb3\
-\xe3\xa1;5|\x0b\x92\xb2\x15\x09\x801j\x00Bc\
-?h\x0cH\xa0\xe4k\x80^W^\x02[\x17\x03\xf4\
-\xbb\x16\xfc\x09\xd7\xfe\xfeR\xff\xd5}!\xa0\xe9r+\
-\xa6N\x0f|0,\xbb\x8e\x7f\xf2\xc0_y\xbc>\xe0\
-\xa3\x80_\xb3\x06\xc6\xa6\xe3\xfd\x89w\xf8o\x87\x0c\x0e\
-\x92\xac\x87\xe1\xbc\xd0\xc732\xaaR\x8c%z\x00\xf2\
-e\x11\x84F\xdf\x9e\xb2\xbe,\xeak\x80^}4_\
-r>\xf4E\xd3N\x9e\x88W\x9f~\xcc\xff\x8d\xba\x8e\
-\x03\xde\x170\xee\xf4\xdf\xf9\xe7\xed\xc0!\xbb\x8e+8\
-`\xb9\x10\x14@\xa8G\xf0\x0f\xd3\x1fQ\xc63XK\
-\x10s\x85\x94\xd13b(j\x00b\xfb\xe80\x10\x84\
-\xd7\xd9G\xd6=\xf8\xa2)\xdf\xe3\x86\xd2\x01z\xc5\x81\
-]~o\xf2s\x97?\x8c\xb3\xfe<\xcd7\xdf\x9b\x02\
-p\xb3\x1b\xb4\xc1\x00\x84\x96\xf3;\x0eY\xfc\xff\xb3v\
-\x8b\xdc3w\xcf\x0d~\x07\xef\xf7\xff\xd2\xaf\xde\x1d\x19\
-\xde\x9bp\xbbb\xbeZ\x86\xcbr@\xf4'\xde\x0d_\
-\xae\x11\xa2\x02 \xa2\x9d\x87\xfd\xb3B\xb96\xf1\xe0\xfb\
-\xbbe-v;+=\xce9m\x8d\xa8\xedb\x80\xde\
-\xc2|i\xd9\xb9xx\xec\xad\xc0\xd3,\x90\xd3.o\
-\xed&\x11X\xc2\x03\x14 \x00J\x0d\x95\x98=\xf9\xc6\
-\xa0\xf4\xa3\x85\xe8X\xe7\xc9\xeb\xef\x05;@\xd3&c\
-\xa3\x08\xbc\xc4\x03\xcb\xda\xdcjn\x1c\xfb\x00\xb6\x99\xf6\
-\x04\x5c\xcf\xa3yW\xe3\x8c\xd4\x91\x01\x97\xf3V@O\
-\x939\xa4\x1a\x14\x91\xd5\x1dB\xa2\x03 f'\xec_\
-\x077\xc5;\xb7\xeaK\xd08\x8f\xf6\xd4X[\x89\x86\
-J\xcfUuo7\xab\xaf=\x1d_o~\xcb}\xe9\
-\x0c\xc6},\x17\x81|\xcfG\xd9\x8a>\xab\xf1\xb7\xe1\
-/\x84t\xbf\xaf>~\x01\xee\xe9?\xdf-\xe3\x90\x08\
-\x1c\xf3\xac\xa3(\xa6\x14WO\xb8\x13\x8dl\xe0\xee\xf7\
-\x7f\xca\x99\x89k\xb3\xcf\x08I\xbf\x96\xc2\xdai\x19\xd0\
-\xe4\xc4+\x22\xab;\x84D\x05@BI\x0ewy\xe5\
-\xa7\x9d\xeeC\xa3\xb9\x0a\x0d\x15\xf2\x12>\xcc/\xbc\x12\
-\xf3\x8b\xae\xf6y/\x0f\xc7\x15\xe3\xee\xbc\xa7p$6\
-8\x00\xb7\x08Nv%\xe2\xe9}\xf7b\xa2eT\xa7\
-\xba,\xda\x06\xdc;\xe2ilN\xda\x19T\x9f:'\
-c\x1c\x1e\x1a~yPe;\x16\x8a\xb48\xf5\xe8\x00\
-H\x08k \xde\x00b\xaf7\xc3R*\xff\x95mf\
-\xd54<\xb3\xaf\xf34\xee\xb7\xe9\xeb\xf0\xe6\x80e!\
-\x83\xa3}'\x9cQ=\x05\xd7\x96\x5c\x8c\xb1\xf5\xb9\xa8\
-\xd2\xd5\xe2\xfb\xf4\xf5X\x9e\xf9\x0d\x0ac\xfd?\xf1|\
-!\x80z\xf6>?Z\x99\xdc\xe6\xec\xa0\x04\xe8\xa6\xa4\
-)\x02\xb6\xee\x10\x12\x14@j\xeb\xeb\x90\x9c\x90\xe8W\
-?^\xe0QP\x5c\x88\xfc\xe2\xa3\xb8\xe4\xb4\xb3\xfd\xf2\
-\x87\x8b!\x94\xdc\xbb\xde\x00\xe2\xb06\xc0|,\xb0\x05\
-\xb7,[_L\xaf\x9d\x80D\x97{7\xa65\xa9[\
-P\x10\x7f$\x5cMVT\xee\xcc\xf4q\xf8[\xae2\
-O\x10&\xdd\x00\xfd\xcc~\x8a\xea\x17Na\x01\x01\xc4\
-\xe6t\xe0\x93\xd5\xdf\xe2?k\xbe\xc5\x92\xfb\x1eGF\
-\x92\xef\xf4\x92\x9f\xad\xfd\x11o\xae\xf8\x145\x0d\xee\x9d\
-\x9a^\xb9\xe3\x01\x9c\x927&\x9cm\xf1)\xdb\xb5\xad\
-\x1a\x5cAp\xdb\xa9\xbd\xd9\xb0]\x8a\x1e\xecH5\x85\
-\x05pEH\xe4`\xa8F\xbf\xb2\xdft\xfcy\xf0y\
-\xa1\x8a\x91\xca\x93\x18\x16\x86Kr\x14\x91\xd5\x1dBd\
-\x03d\xc97_\xe2\xed\x95\x9f\xc3\xeerJz=v\
-\xe3\xed8w\xd2T\x9f:\xd64\xd4\xe1\x9c\xbf\xb69\
-\xe1\x9d3i\x0a\x1e\xbfQ\x99\x05\xa7@\x0d\xe3\xdcP\
-\x01\xfeh\xf0Q\x84\xde\x9e\x22rg\xb2\x02\xd5\xb5'\
-\xf2\xd3\xd7+%\x03\xa8b\xae\x1e\xdcn\xf3\xbf\x9e\xd8\
-\xe26\x9dd\x03d\xce\xfd\xb7\xa2\xac\xb6\xcd\xb5\xfb\xa2\
-\xe9g\xe1\xa1\xb97u\xd9\xba\x897{\xe6\xa3\xdb\xf6\
-F\xe0\xcerJ\x98\x8ffo\xa7\x03\xf5`\xe9\xa8\xcb\
-\x82\xc5u?\xa3Qpy\x88\xb0\xd7\xd5\xc2RV\x14\
-\xac\xd8\xd6r\x0ca\xa0\xd5h\xa1e400:\x18\
-\xb4z0\x84\x05aY\xf0\x04\xe0\x18\x82&\xce\x0e'\
-\xe7\x80\xc0\xb9\xc0\xd3\xbf\xe6\x1f\xaa\x90+\xf7#\x80\x06\
-M\xd1\xe0)%\xc9pi\x0eh\x16\xf8H \xd9\x00\
-y\xe8\xad\x97\xf0\xed\xd6\x0d\xadm\xea\x9b\x9a\x8e\x15\x8f\
-\xbf\xd4e\x1b\xef{\xe3\x05\xfc\xb8}S+\xcfS7\
-/\xc4\x8c\x93&w\xbb]\x82u3\xe9\xa8(\x8dE\
-\xa71\xe9\xed\x89vT:\xe5\xcb\xd9\x9a\xc0q\xee\xa7\
-k\x0b\xe9X\x0d\x12\xb4qH\xd2\xc5#M\x97\x80\x0c\
-\xbd\x09}\xf5&\xa4\xea\x12\x90\xa27\x22U\xeb>\xc6\
-\xb2\xf2\x92<;\xc0\xa3\x8e\xb7\xa3Nt\xc0\xcc\xdbq\
-\xcciF\x99\xcd\x82R\xa7\x19U\xcez\xd48\xeaa\
-u6\x81s9\xc0;\x1d\x12\x90B\xa1a\xf1\x99x\
-b\xe4\x5cd\xe8\xfd\x8f7\x03\xa9\xc70'\x1b$!\
-2\xa2\x0be\x03d\xf9\x9a\xef\xf1\xd4\xb2w<\xec\xb0\
-\xf2\xc9\xd7\xba\x1c\x87|\xb9~5\x1e[\xfafk\x99\
-\xcb\xcf\x98\x85{\xaf\xfac \xb6T\x84\xd7\xfeU1\
-\xc4\xba\xd0:K\x8b\x22\x8d\x82\x13\xf5\xa2\x03\xf5\xa2\x13\
-\x06h\x90\xc8\x18`b\xf4\xd2\xe5\x1ag\x03\x8am\xd5\
+\x07\xdb\x11\xecqU\xa2\x86o\xdb\xb0\xa8\xa1\
+\xaa\x0c\x8e\xc6zpv\xe5\x9fN\x0a\x9a\xa0UT?C\
+2f\xa4\x8f\xc1\x8c\xb41\x18\x14\x97\x11\x8e*\
+$\x99\xd4\x15\x9e\x89\xd0,\x8dQ\x07\x10\xe7\
+\xfa\x0a\xf0E\xc1\xaf\x9c\x7fc;\x84w\x1ah^\
+\xbd6\xa2O\x8c\x86\xaaR\xb8l\x91\xbb\xa6rv\
+\xda\x18\x09,\xd3SF(\x0e\x94H\xce\xa9\x15U\
+\x00\x11\x1d\xf4\xf5\xaa\x18\xa23\xb81\xc0\
+\xeb\x0d\xbfb\x95\xed\xa8G\x07j\xb2\xd4\xa0\
+\xbe\xbc\xf7\xcc\x88\xe5\x1a\xfb\xe1\xe6\x9c\
+Y\x98\x98\xa4\\Zf\x1am\xa8\x9f\xdd_q\xe0u\
+\x87\xc0\xa8\x02\x08_b\x85smp\xdbf\xd3\xb1\
+\xc6\"\xf3\xcf\x9d\xeeIm\xf1Ai\xcc\xd1\x15\
+\xc5\xc5\xc6\xe0\xc5'\x16\xe3\xe0\x91\xa38\\\
+X\x84\xa2\x92\xe3(>v\x1c\x15U\xd5\x8a\xdd\
+\xe3\x96:\x8e\x14\x16\xe3Pa!\xa4\xe3\xd1BX\
+\xea\x82K:\xb1p\xc8\x1c\\\xd2\xf7\x14\xc5\
+\xf43\\\x90\x0d\x92\x18\xde\xf1\x8eb\xca\xb6\
+\x13\x14U\x00\x09%\xbf\xd5\xb3u\x1b\xb1\xd9q\
+\xdc\xe3\x1e8\xac\x16\x98\x8fy>Q:\xde\xa4\
+\x8bf\x9f\x83E\xf7x\xdf\x81\xf8\xf5w?\x00\
+\xfd\x0b\x95\xba\xaa\xe3\x99W\xde\xc0\x87\
+\x9f~\x11T\x15\xff\x1c5\x0f''\x0f\x0d\xaal\
+\xc7B4m)}\xd5\x8a4\x8a*\x808V\x97A(\x0b|\x00\
+]\xc1[qk\xcd\xb7\x9d\xeem}y\x09\x9a,\xbe\x9f\
+\x02\x97\xce\x99\x8d\x87\xffr{\x97}\xe2\xf1\
+\xe7^\xc6\xf2\x15\xc1'\xb3\x94S\xc7\xed\xf7?\
+\x82\xb5\x1b7\x07\xdc7\xcfN\x1f\x8bGr\xaf\
+\x08\xb8\x9c\xb7\x02lf\x1ctgE^F\xc6\xa8\x02\
+\x88\xfd\xd3B\xd0qH\xa0\xb4\xc5q\x1c\xcf\xd4\
+m\xecT\xac\xa6\xe8\x80\xcf\x81y\xee\xd0\xc1x\
+\xe7\xa5g\x11\x1b\x13\xd3eu\xf4\x95\xeb\xd2y\
+7\x07\xaa\x92\xc4/\xb7\x8eM\x9fo\xc7\xfc\x97\
+\x1e\x08\xaa\x8e\xb7NZ\x80\xe1\xf1\xa1\x8f\
+\x1f\x08C`\xb8r`\xc4m\xf5\x165\x00\x11-N\xd8\
+W\x96\x04\xd5I>\xb1\xee\xc3\xf2\xa6}\x1eeE\
+\x81G\xe5\xc1\xdd\x10E\xef\xb3\xe4\x17\xcc\
+\x9a\x81\xc7\x1e\xb8[V}\xe3\xce8W\x16_G&\xd9\
+u\xfc$\xe0\xf5y\xef\xe3\xf5\x9ce\x01\xd7s\
+\xff\xb0K0\xbb\xcf\x84\x80\xcby+\x10\x89\xab\
+\xeaQ\x03\x10\x9a!\x91fJ\x0c\x86\xbc\x8d?\
+\xe8\x94.}\x82\xf8\xa2\xf9\xf3\xfe\x00\xfa'\
+\x87\x1e\x1d\xfe\x02>\xcb\xec\xfc\x0a\xe7\
+\xaf\xac\xec:~\x12\x8039\\}\xd2]\xd8g<\xe4O\
+\xac\xc7\xf5?d\x9d\x8e\x9b\x07\xce\x0a\xa8\
+\x8c/\xe6H\x0c\xa4\x8a\x1a\x80\x84\x92Ft~\
+\xf5J\xd4\x08m\x0b\x82\xb4\x03\xd0\xb1\x07\
+\x1d\x83\xf8\xa2g\x16=\x88\x99g\x9c*\xabc\
+\xedL\xdc\x89\xeb\xc6\xdf+\x8b\xb7=\x93\xec:\
+\x9a\x01\xf2\xc4\xd0\xd7\xf1I_\xaf[\xf1\xf9\
+\xac\xfb\xb4\xd4<<\x9e\xd7\xe5F\xb0\xb2\xf5f\
+\xb3\xe3\xa1;5|\x0b\x92\xb2\x15\x09\x801j\
+\x00Bc?h\x0cH\xa0\xe4k\x80^W^\x02[\x17\x03\
+\xf4\xbb\x16\xfc\x09\xd7\xfe\xfeR\xff\xd5}!\
+\xa0\xe9r+\xa6N\x0f|0,\xbb\x8e\x7f\xf2\xc0_y\
+\xbc>\xe0\xa3\x80_\xb3\x06\xc6\xa6\xe3\xfd\
+\x89w\xf8o\x87\x0c\x0e\x92\xac\x87\xe1\xbc\
+\xd0\xc732\xaaR\x8c%z\x00\xf2e\x11\x84F\xdf\
+\x9e\xb2\xbe,\xeak\x80^}4_r>\xf4E\xd3N\x9e\
+\x88W\x9f~\xcc\xff\x8d\xba\x8e\x03\xde\x170\
+\xee\xf4\xdf\xf9\xe7\xed\xc0!\xbb\x8e+8`\xb9\
+\x10\x14@\xa8G\xf0\x0f\xd3\x1fQ\xc63XK\x10s\
+\x85\x94\xd13b(j\x00b\xfb\xe80\x10\x84\xd7\
+\xd9G\xd6=\xf8\xa2)\xdf\xe3\x86\xd2\x01z\xc5\
+\x81]~o\xf2s\x97?\x8c\xb3\xfe<\xcd7\xdf\x9b\
+\x02p\xb3\x1b\xb4\xc1\x00\x84\x96\xf3;\x0eY\
+\xfc\xff\xb3v\x8b\xdc3w\xcf\x0d~\x07\xef\xf7\
+\xff\xd2\xaf\xde\x1d\x19\xde\x9bp\xbbb\xbeZ\
+\x86\xcbr@\xf4'\xde\x0d_\xae\x11\xa2\x02 \
+\xa2\x9d\x87\xfd\xb3B\xb96\xf1\xe0\xfb\xbbe-\
+v;+=\xce9m\x8d\xa8\xedb\x80\xde\xc2|i\xd9\
+\xb9xx\xec\xad\xc0\xd3,\x90\xd3.o\xed&\x11X\
+\xc2\x03\x14 \x00J\x0d\x95\x98=\xf9\xc6\xa0\
+\xf4\xa3\x85\xe8X\xe7\xc9\xeb\xef\x05;@\xd3&\
+c\xa3\x08\xbc\xc4\x03\xcb\xda\xdcjn\x1c\xfb\
+\x00\xb6\x99\xf6\x04\\\xcf\xa3yW\xe3\x8c\xd4\
+\x91\x01\x97\xf3V@O\x939\xa4\x1a\x14\x91\xd5\
+\x1dB\xa2\x03 f'\xec_\x077\xc5;\xb7\xeaK\xd0\
+8\x8f\xf6\xd4X[\x89\x86J\xcfUuo7\xab\xaf=\
+\x1d_o~\xcb}\xe9\x0c\xc6},\x17\x81|\xcfG\xd9\
+\x8a>\xab\xf1\xb7\xe1/\x84t\xbf\xaf>~\x01\
+\xee\xe9?\xdf-\xe3\x90\x08\x1c\xf3\xac\xa3(\
+\xa6\x14WO\xb8\x13\x8dl\xe0\xee\xf7\x7f\xca\
+\x99\x89k\xb3\xcf\x08I\xbf\x96\xc2\xdai\x19\
+\xd0\xe4\xc4+\"\xab;\x84D\x05@BI\x0ewy\xe5\
+\xa7\x9d\xeeC\xa3\xb9\x0a\x0d\x15\xf2\x12>\
+\xcc/\xbc\x12\xf3\x8b\xae\xf6y/\x0f\xc7\x15\
+\xe3\xee\xbc\xa7p$68\x00\xb7\x08Nv%\xe2\xe9}\
+\xf7b\xa2eT\xa7\xba,\xda\x06\xdc;\xe2ilN\xda\
+\x19T\x9f:'c\x1c\x1e\x1a~yPe;\x16\x8a\xb48\
+\xf5\xe8\x00H\x08k \xde\x00b\xaf7\xc3R*\xff\
+\x95mf\xd54<\xb3\xaf\xf34\xee\xb7\xe9\xeb\
+\xf0\xe6\x80e!\x83\xa3}'\x9cQ=\x05\xd7\x96\\\
+\x8c\xb1\xf5\xb9\xa8\xd2\xd5\xe2\xfb\xf4\xf5\
+X\x9e\xf9\x0d\x0ac\xfd?\xf1|!\x80z\xf6>?Z\
+\x99\xdc\xe6\xec\xa0\x04\xe8\xa6\xa4)\x02\
+\xb6\xee\x10\x12\x14@j\xeb\xeb\x90\x9c\x90\
+\xe8W?^\xe0QP\\\x88\xfc\xe2\xa3\xb8\xe4\xb4\
+\xb3\xfd\xf2\x87\x8b!\x94\xdc\xbb\xde\x00\
+\xe2\xb06\xc0|,\xb0\x05\xb7,[_L\xaf\x9d\x80D\
+\x97{7\xa65\xa9[P\x10\x7f$\\MVT\xee\xcc\xf4q\
+\xf8[\xae2O\x10&\xdd\x00\xfd\xcc~\x8a\xea\
+\x17Na\x01\x01\xc4\xe6t\xe0\x93\xd5\xdf\xe2?\
+k\xbe\xc5\x92\xfb\x1eGF\x92\xef\xf4\x92\x9f\
+\xad\xfd\x11o\xae\xf8\x145\x0d\xee\x9d\x9a^\
+\xb9\xe3\x01\x9c\x927&\x9cm\xf1)\xdb\xb5\xad\
+\x1a\\Ap\xdb\xa9\xbd\xd9\xb0]\x8a\x1e\xecH5\
+\x85\x05pEH\xe4`\xa8F\xbf\xb2\xdft\xfcy\xf0y\
+\xa1\x8a\x91\xca\x93\x18\x16\x86Kr\x14\x91\
+\xd5\x1dBd\x03d\xc97_\xe2\xed\x95\x9f\xc3\
+\xeerJz=v\xe3\xed8w\xd2T\x9f:\xd64\xd4\xe1\
+\x9c\xbf\xb69\xe1\x9d3i\x0a\x1e\xbfQ\x99\x05\
+\xa7@\x0d\xe3\xdcP\x01\xfeh\xf0Q\x84\xde\x9e\
+\"rg\xb2\x02\xd5\xb5'\xf2\xd3\xd7+%\x03\xa8b\
+\xae\x1e\xdcn\xf3\xbf\x9e\xd8\xe26\x9dd\x03d\
+\xce\xfd\xb7\xa2\xac\xb6\xcd\xb5\xfb\xa2\xe9\
+g\xe1\xa1\xb97u\xd9\xba\x897{\xe6\xa3\xdb\
+\xf6F\xe0\xcerJ\x98\x8ffo\xa7\x03\xf5`\xe9\
+\xa8\xcb\x82\xc5u?\xa3Qpy\x88\xb0\xd7\xd5\
+\xc2RV\x14\xac\xd8\xd6r\x0ca\xa0\xd5h\xa1e40\
+0:\x18\xb4z0\x84\x05aY\xf0\x04\xe0\x18\x82&\
+\xce\x0e'\xe7\x80\xc0\xb9\xc0\xd3\xbf\xe6\
+\x1f\xaa\x90+\xf7#\x80\x06M\xd1\xe0)%\xc9pi\
+\x0eh\x16\xf8H \xd9\x00y\xe8\xad\x97\xf0\xed\
+\xd6\x0d\xadm\xea\x9b\x9a\x8e\x15\x8f\xbf\
+\xd4e\x1b\xef{\xe3\x05\xfc\xb8}S+\xcfS7/\xc4\
+\x8c\x93&w\xbb]\x82u3\xe9\xa8(\x8dE\xa71\xe9\
+\xed\x89vT:\xe5\xcb\xd9\x9a\xc0q\xee\xa7k\
+\x0b\xe9X\x0d\x12\xb4qH\xd2\xc5#M\x97\x80\
+\x0c\xbd\x09}\xf5&\xa4\xea\x12\x90\xa27\"U\
+\xeb>\xc6\xb2\xf2\x92<;\xc0\xa3\x8e\xb7\xa3N\
+t\xc0\xcc\xdbq\xcciF\x99\xcd\x82R\xa7\x19U\
+\xcez\xd48\xeaau6\x81s9\xc0;\x1d\x12\x90B\
+\xa1a\xf1\x99xb\xe4\\d\xe8\xfd\x8f7\x03\xa9\
+\xc70'\x1b$!2\xa2\x0be\x03d\xf9\x9a\xef\xf1\
+\xd4\xb2w<\xec\xb0\xf2\xc9\xd7\xba\x1c\x87|\
+\xb9~5\x1e[\xfafk\x99\xcb\xcf\x98\x85{\xaf\
+\xfac \xb6T\x84\xd7\xfeU1\xc4\xba\xd0:K\x8b\
+\"\x8d\x82\x13\xf5\xa2\x03\xf5\xa2\x13\x06h\
+\x90\xc8\x18`b\xf4\xd2\xe5\x1ag\x03\x8am\xd5\
 \x01w|E\x1a\xd9NH\xb5`C\x15\xdf\x88\x0a\xae\
-\x01\x07\x9a*Pb\xafA\x85\xcd\x82\x1ag=\x1a\x1c\
-V\xb8\x9cN\xf0.\x07\xa8G\x80/\xa2S\xbbw\x0f\
-\xb9\x08zV\xf9\x8e\xac\x9f\xd5\x0fLZd,\x16\xca\
-\x06\xc8\xde\xa3\x87p\xdd\x93\x0fy\xd8\xf3\xc9\x9b\xee\xc4\
-\xd9\x13|\xc7-\x17\x96\x97\xe2\xb2G\xeej-sr\
-\xee(\xbc\xb6\xd0S\x86\xd2\x9d\xc3\x9b<\xba\x8aNW\
-\xd3Ur[\xc0,\xd8%\x00\x15:\xcd8\xd2T\x89\
-&G#lN\x1b\xe25z\x8c4\xf4A\x82&V\
-\xb1P[o6\xd7\x9d\xd1\x07l\xbf\xc8\xd8[]6\
-@\x1cN'\xa6\xddv\xadG{\xaf>{6\xee\xba\
-\xdc\xf3\x5cG\x83\x9c\xb5\xf0\x06\xd47\xb9\xd3\xe1\xa4\x9b\
-\x92\xf1\xf5S\xafu{?\x0d\xd6\x0f\xab\xdb\x15\x8d\x92\
-\x0auS3\xc0\x0e\x8c\x8c\xd5t\xd9\x00\xa1\xf7\xee\xf2\
-\xc5\x7f\xc1\xd1\xd2\xb6\x05\xa7\x91\x03\x87\xe0\xbd\xfb\xba\xf6\
-X\xbd\xf9\x9f\x7f\xc7\xaf\x07\xda\xa2\xf1~~\xf1]\xc4\
-\x19\xba\xf1\xf1\xca\x8b\xb0-\x8b\x8c\xf5\x86(\xc1\x07t\
-\x13S\xc1\x0eWv\x5c\x13.\xdb\x05\x04\x90\xc7>\xf8\
-7\xbe\x5c\xb7\xcaC\x977\xff\xf2\x08N\x1a\xe6;\xd9\
-XG\x80P@Q`u\x17\x896\x1e\xf6\xcf\xe5\xaf\
-zw\x97^\xd1\x5c\x8fft\x12\xb4c\x22c\x8b\xb6\
-\x80\x00\xb2\xfc\xa7\xef\xf1\xd4\xc7\x9e\x03\xf5\xb93\xe7\xe0\
-\x8e\xcb\xbcG\x9c\xdd\xf0\xf4#\xd8y\xb8\xc0\xa3/<\
-\xf8\x87\x1bq\xf1\xa9\xdd\xb7\xaaN\x07\xe7t\x90\xaeR\
-\xcf\xb1\x00;,\x01\xbaI\x91\xe1n\x12\x10@\xb6\x1f\
-\xd8\x87\x9b\xfe\xf9w\x0fK\x0f\xc8\xe8\x8b\xcf\xfe\xfe\x5c\
-'\xeb_\xb1\xe8\xaf8R\xd6\xd9\xa1\xaf\xbb\x01\x22\xd4\
-8\xc0\xfdV\xe3\xce\xa6A\x1dj\x09@\x18F\xfa.\
-\x12\x11\xa0\x9f\xa5\xf3\xa2\xfb\xbc\xf4\x99^\xa7\xd7\x88;\
-\x86\x84&f\xa0^\xe3\xf4\xb3 B\x14D\xe93\x91\
-\x8e\xf4\x8f\xf2\xd1\xf3B3\x8f\xbb\x0cM\xe2.%\xc9\
-n\xe6\xa3\x9f\xa52<M\xf0.\x00\xd2\xb5f\xf9=\
-\xa7\xff\x86]\x136'\x1e\xbai\x91\x11z\x1b\x10@\
-\xea\x1a\xad\x98qW\xe7\xb8\x05:\x93Eg\xb4(\x95\
-\xd5T\xe1\x8e\x97\x9f\xf2\x0a\x8e~i\x19x\xf7\xdeG\
-\x91dL\x08\xfbM\x88\xa4\x0a$\xc0Q\xa0H\xe0\x13\
-\xa4\xcf\x14Hnp5\x9fo\x01\x9a\x04:\xfa\x9f\xfb\
-Z\x1b\x9f\x1b\x88-\x80$\xcd,\x10\x047\xa0\x9b\x01\
-.\xf1\xd3\xb2T\x9e\x04n\xb8\x01+\xc9k\xfe\xde\xf2\
-# \xf1\x02L\xbb\x1f\x05*\x8b\xca\xa6\xe5Z\x7f\x10\
-\x0246\xdb7\x16\xba33\x03,ub\xd8\x03\x02\
-\x08U\xf1\x9a\xc7\xef\x93\x1c\x10;\xd2\x15g\x9c\x83\xcb\
-O\x9f\x85{\xdf|\xde+8(\xff}W\xdd\x80\xcb\
-\xce\x88\xae\xcd\xacN\xccm\xed\xe6Z%\xc0u\x06\x99\
-\x048\x09t\xa4\x0d\xfc\xd2S\x18\xa0N\x8b\x91@\x01\
-\x03d\xd1\xbb\xaf\xe1\xab\x8dk\xbd\xb6mPf\x7f\x9f\
-\xe0\xa0\x0b\x84t\xa1P%\xd5\x02\x91d\x81\x80\x01\xf2\
-\xc5\xba\x1f\xf1\xf8\x07\xcdQr2Z\x9ab4\xe1\xa1\
-\xebn\xc2\xa9\xa3O\x92\xc1\xad\x0c\xcb??y\x1f\x07\
-J\xdcO9{C\x93\xf4\x9a Q\xf3\x87\x87f\x5c\
-#\x8d\x0f\x04i\xcc H\xaf%\x82\xf4K'HG\
-\xfa\xbaA_%\xe8_\x1c\xf4\x88\xe5t`\x18\x02\x86\
-\x0e`@\x87&\xf4\xe8\xfeF\xff'\xf4;}\x15\xa1\
-\x9fA\xdc\xa1\xef\xd2XGb\x96\xc6;\x84\xa5c\x1e\
-\x22m$#\x95g\xe9\x98\xc8}\x9e\x8e\x83\x18\x0d=\
-\xc7\x80\xee1\xde\xf2Gy\x18\x9d\x06\x8c\x86\x014n\
-^\xc2\xba\xc7I\x22\xe5\xa3\xb2[dP9*)n\
-\x81\x80\x01B5xf\xd9\xbb\x92\xcb\xbb?\xca\xcb\x19\
-\x8c\x87\xe7\xde\x84\xa1\xfd\x07\xf8cU\xf4zG'\xc9\
-\xf6\xc2i\x07~z\xf4U\xb2\xebK\xd4\xc6cD|\
-\xf7\xea/[9\xcf\x86A\xa0?\x00Dt\xcf%4\
-\x1f)P\xe9\x19\x81\xce;H\xe7\xdd\xf3\x15- v\
-#\xbeY\x90\x84x\x22\xfd\x8e\xb8\x01\xddr\x9e\xfe\x08\
-\x00\x22\x05cs\xd9\xf6\xe0o\xf91\x10\xa5:(\x80\
-\xdd\x13\x22\x12\x80\xe9O\x06\x05/\xfd\x91\xa0\xb2\x9b\xcf\
-'\xe4\xa5\xbb'Ez8\x05\x05\x10\xda\xa6]\x87\x0f\
-`\xed\xae_\xb1v\xe7\xaf\x9d^\xabXV\x83I\xa3\
-\xc6`\xf2\xc8q\x98{z\xf7\xbeV545\xe1\xcc\
-\x85\xbe\xfd\xbd4\x84\xc1?F\xc9\xdf\xf5\xda\xa4\x89G\
-\xae1\x02\x00\xd2\xc3;Z\x8bz\xbf\xd4\xec\xc7}{\
-}g\xb4\xff\xd3\x05\x97\xe2\xe69\xca\x04g)a\x92\
-\xa0\x01\xd2\xbe\xf2\x8d{w\xe2\xbb\x9d[PXY\x81\
-z\x87\x0d\x1a]\x9bw\xea\x8dg\x9d\x8fYc'*\
-\xa1\xab,\x19t\x16m\xce\x03\xb7\xf9\xe4\xa5{\xf2=\
-6R\xfe\x0dH\xd2\x1a1<>[V\xdd*\x93\x7f\
-\x0b|[\xb1\x03\x8f\x17\xb4\xc5\xf9\x1bu1\x18\x971\
-\x18\xfd\xe2S\xa0eX\xc9\xe5\x9f\x8eU\xe9l\x9b \
-\xcd\xdc\x09\xd2\x91\xbe\xee\x1aRbaH\x8e\x87!)\
-\xae\xf9\xe9\xe4\xbf\xbeP9\x14\x01\xc8'\x1b\x7f\xc2\xa7\
-\x9b:o.C\x95;y\xc8\x08\xfcuN\xe0Y\x03\
-\x83m\x18\x9da\xa33m\xbe(\x86\xd5\xe1\xefy\x97\
-\xc9\x16\xaf\x02D\xb6\xa9d1.?\xfe\x0b^:\xdc\
-\x96\xfet\xf6\xa0I\xb8~t\xe03\x9b\x12P\x92c\
-\xa17\xb9\xffX]\xbb\x94G\xb24\x91\xc7\xa4\x08@\
-\x0e\x96\x1d\xc3\x83\xcb\xde\xf6Zc\x8cN\x87\xf7\xfe|\
-\xbf<m\x14\xe0\xdaV\xb0\x17\xf3\x9f{\xd4\xa7$\xba\
-\xa7\xf8\xa2<\x19)A\x9b%$\xe9\x8c\x18\x1e\xa7>\
-A\x14\xb85\x92\x88w\x8aVaI\xd1\xeaVq\x8f\
-\x9e:\x17\xb9\xc9\xa1\xefBNA\x12\x9b\x9e\x80\xb8>\
-\x09\xd0\xc6+7\x85\xac\x08@hk\xff\xf0\xf2\xe3p\
-r\xdeS{\xbex\xdd\xad\xc8LNQ\xca\xc6]\xca\
-Y\xb3c+\xee~\xfd\x9f>y\x124\x06<<\xe2\
-\x12\xd9\xba$k\x130,>\xf4\x1b(\xbb\xc2^\xce\
-\xf8\xfc\xa1\xff\xe1\xf3\xd2\xb6 \xba%\xe7\xdd\x85x]\
-\xe8\x1d\xfa\xd7\xba\x12|R\xbe\x0d\xe3\x12\xfa\xe3\xc6\xf1\
-g\xc34$\x1d\xba\x84\xae\xf7f\x91cj\xc5\x00\xf2\
-\xfc\xcaO\xb1\xf1\xc0^\xa9N:S4 &\x19\x13\
-\x12\xb2q\xb2)\x07\xc9\xc33\x918\xb8{|o\xfe\
-\xb7\xe1',~\xefu\x9fmO\xd4\xc6\xe2\xa1\xdc\x8b\
-\xe4\xd8F\xe2I\xd1%`h\x9c\x0a\x10\xd9\x06\xf3\xc3\
-\xf8\xf7\x82\xe5\xf8\xa1\xc2\xbdKpZl\x22^\x9b\xf9\
-gED\x7f\x5c\xb6\x15\xbf\xd5\x1f\xc3\xd4\xa4A\xb80\
-},\x18-+\x81$q`h\xfdN1\x80\xfc\xbc\
-o'~\xde\xfa+\xb2X#\xc6\x1a\xb3\x90\xa4\x8dm\
-m8\xc32\xc8\x9e9\xb2[\x06V\x1f\xfe\xb0\x12\xcf\
-\x7f\xba\xd4\xa7\xd1\x93tqx`\xf8\x85\xb2o\x8a\x0a\
-\x10\xd9\xa6\x92\xc5\xf8\xd7\xdd\xefa\xb3\xd9\xbd\xafJ^\
-J6\x16O\x97\xb7\x87\x8a?\xe1\xcf\x1c\xfd\x01\xd5N\
-+\xae\xe9{2\xc6\x18\xdb\xd2\x0a5e\xea\xb0\xa1\xf6\
-\x10r\xd221sL\xe0\x1b\x01)\x06\x90\xe2\xdf\x0e\
-\x83/\xf5\xbdOx\xca\x88L$\x84\x88f\x7fF\xa2\
-\xd7__\xf1\x09\xdeZ\xf9\xb9O\xd6T\xbd\x11\xf7\x0e\
-\x93\x9f\x84 Uk\xc2\x90\xf8\xc8\xc9\xe3$\xc7F'\
-\x92\xe7\xc6\xed\xffB\x81\xd5\xed\xc4\xaa\x14@(0(\
-@(=4d6\x8c\xff?\xcel\xa1ee\xdb\xb0\
-\xa3\xbe\x04\xf1\x86\x18\xbc\xb3\xe0\x9e\x80\x9b\xae\x18@\x8a\
-\xbe\xdf\x03\x81\xf3\xbd\xff8\xabe\xd1\xff\xcc\x5c0\x9a\
-\xf0f\xb3\xf0\xb7\x88\x99\xaeO\xc4\xdd\xc3\xce\x97m\xa8\
-4\xbd\x09\x83cU\x80\xc86\x98\x1f\xc6\xcb\xb7<\x8b\
-r\xbbYQ\x80\xd0W+\xfa\x8a\xd5\xdf\x90\x84\xdb\x06\
-\xb4\xe5\x10\xb6\xf1N<u\xf4\x07\xd0\xe3\x94\x81#\xb0\
-\xf0\xa2\xc0gS\x15\x03H\xf9\xd6\xa3\xb0U5ti\
-\x9e\xee\x18\x8b<\xb2\xe4U\xac\xdc\xb4\xce\xa7\x1e\x99\x86\
-D\xdc54\x00\x80\xe8L\x18\x1c\xa7\x02D)\x80\xcc\
-\xfa\xe5\xef\xb0\xf1\xee\x8d\x8c\x94z\x82|Y\xb1\x13\x1b\
--Gpj\xd2P\x5c\x90\xde\x96\x9bx\xa3\xe5(\xbe\
-l\x1e\xef\xcc\x1d:\x1ds.\x98\x11p3\x14\x03H\
-m~9\xea\x8exn\x13\xd0Q\x1b\x8dA\x8b\xbe\xd3\
-\x87\x81\xd5\x85\xef)r\xd7\xab\xcfH+\xfc\xbe\xa8_\
-L\x12\xee\x1c\x22?K`\xba\xde\x84A\xea\x13$\xe0\
-\x8e\xe5\xad@\x13\xe7\xc09\x1b\xda\xe2\x89\x94\x00\x88C\
-\xe0\xf0\xe4\x91\xef$\x7f\xb8[\xb2NG\xaa\xce\x9d\x0c\
-\xa2\x91w\xe0\xd5\xa2\x9fP\xe3j\xc2\xc4\xc4l\x5c\xde\
-g\x02\xd2O\x1a\x80\xb8>\x81\x85\xfa*\x06\x10\xbb\xa5\
-\x09e\x1b\xfc\xe7\xab\xa5\xb3Y\xf4I\x12.\xba\xf1\x99\
-G\xf0\xdb!\xcf(\xc6\xf6ue\xc5$\xe3\xf6!\xf2\
-w\x95\xcd\xd0'c`l\xf8\xf4\x0d\x97\x1dz\xa2\xdc\
-\x0a\x87\x05\x97m~\xa6U\xb5\xfe\x09\xa9x\xfe\xcc\xae\
-\x93\x0f\xfak\xc7F\xf3\x11|Y\xb9\x13\x17\xa5\x8f\xc5\
-\x94\xa4\xb6\xdd\xab>,\xdd\x82]\x0d\xee\xfc\x09\x8b\x87\
-\xce\x81\x81\xd1 >\xd3\x84\xb4\xf1\x81\xadi)\x06\x10\
-\xaaH\xe5\x8eb4\x96\xb9s\xf1\xfa\x22\xea\xa0\x969\
-u0\xf4\x0a\xccQ{\xab\xe3\xf7\x8b\xef\xc6\xe1R\xdf\
-[\x09\x0c\x88M\xc5\xad\x83\xe5\xfb\x87\xa5\xeb\x931H\
-\x05\x88\xbf~*\xeb\xfa\x01k\x19n\xd8\xfe\x8a\x07/\
-}\x8a\x8cL\xcd\xc6\xf8>C0\xd4\xd4W\x96\x9c\xf6\
-L\xf4)\xc12,\xe6g\xb5m\x98\xda\x02\x0e:X\
-\x9f\x975\x05\xfd\xf5IR\x11\xda\xf7\xb2\xcf\xces{\
-G\xcb$E\x01\xd2TY\x8f\x8am\xfe\x13$\xc4\xf7\
-3!ml`H\x96\xd9\x1e\x9c\x7f\xdf-\xa80\xd7\
-\xfad\x1f\x14\x97\x8e\x05\x83\xe4\xc7\xc4\xabO\x10\xb9\x96\
-\xf7\xcf\xb7\xd5r\x18w\xed\xf2\xcci\xd0\xb1\xd4c7\
-\xdc&\xe5|\xe6]<D\x17/\x1d\x9d\x0d6\xd8*\
-\x1a\xd0XY\xef\xc1^\xe5\xb4\xe2\xd9\xa3?\xe0\xcf\x03\
-\xce@\xb6\xc1\x0d\x82\x16pL6\xe5\xe0\xdc\xb4\x91\x88\
-e<\xb3V\xa6\x8e\xee\x07c\x96\xfcEkE\x01B\
-\x15\xac\xd9{\x1c\xf5E5~\xad\x951!\x07\xb1\x19\
-\xca\x87\xde\x9ev\xfb<49|\xef\xa2\x94k\xec\x87\
-\x1brN\xf7\xab_\x0bC\xa6>\x05\x03b\xfb\xc8\xe6\
-W\x19}[\xe0\xc7\xaa]X\xbc\xff?]\x9a\xe8\xc5\
-[\xef\xc3\xb4\xd1\xe3\xbc\xf2\x08\xbc\x00[u\x03l\x95\
-V\xd8\xaa\xea\xc1\xd9]\xd8V_\x84\x89\x09no\xeb\
-\x1f\xaa\xf7\xa3\xd4a\xc1\x8c\xd4\xdc\xd6\xa7FGA\xd4\
-\x87+\xf3\x14\xf9\x1b\x89*\x0e\x10\xaat\xd9\xa6\xc3\xe0\
-\x9a<\xf3\xd4\x86\xaa\xa8\x9c\x8e\xc7\xf1\x1cN\xb9\xa5\xeb\
-\x85\xa7\x09\xa6\x81\xb82k\x8a\x1cq\x12O_C*\
-\xb2c\x22#\xc1\x80\xecF\x9d F\xeabB]M\
-\xba\xa2\xb7\xefY\x8c\xb1\x83\x87\xfb\xd5\x90\x06\xb5\xd1Y\
-S\xfa\xd6\xd2Xj\xe9r\x89\xa1\xbd0:Q\x94u\
-\x96\xef4U\x1d+V\x1c \xb4\x02kI-\xaav\
-\xfb\xdf\xa2,ud?\x18\x07\xc8\x7f\xdc\xf9\xb3Ze\
-q\x05^\xfe\xf8\x03d\xc6\x99\x90\x11\x97\x84\xf7\xf7\xac\
-\xc2q\xab\xe7\xd3\xec\xd4\xd4\x5c\xfc.S~tc\xa6\
-!\x15\x03T\x80\xf83\xbd\xac\xeb\xef\x14\xae\xc2\x92\xe2\
-6GEo\x85>Y\xf4,h\xe8v \xc45:\
-\xd0Pj\x86\xe5`\xd7\xb3\xa8-2\x07\xcc\x1a%{\
-\x1c\x12\x16\x80PE*\xb7\x17\xa1\xb1\xbc\xebMk4\
-\xb1:\xf4\x9d:$dW\xe5\xa6\xaa\x06X\x8bj:\
-\xbd\xa3\xfeT\xb2\x1b\xafn\xf7\xfc\xc5:7c\x0cf\
-\xb4\x9b+\xf7w#\xd4'\x88?\x0b\xc9\xbf\xfeV\xe1\
-\x8fx\xafxM\x97\x05\xfc%D\xef\xaa\xb0\xf9`\xb9\
-,\x90\xf4\x9b6\x14\xbaDy\x8e\x8ca\x03\x88\xa3\xae\
-\x09\xa5\xbf\xf8\x9f\xf6\x0dv\xc0.\xb8x\xe9\xd1j-\
-\xb3\xc0^\xeb\xdb\xc5\xe5\x89M\xff\xc1\x8e\x8a\xc3\xadv\
-\xbd\xb4\xef\xc98%E~f\xc7~\x86Td\xa9O\
-\x10\xf9(\xe8\x82\xf3\x8d\xa3\xdf\xe3\x83\x12\xefqC-\
-\xc5BMM{|\xed\x018\xad]\xef\xe4\x9b6~\
-\x00\xe23\xe5\xad\x87\x84\x0d \xb4\xc1\xd5;K\xd0p\
-\xdc\xedV\xd0\x15Q\x1f-\xea\xab\xd5\x15\xb9\xac\x0e\xa9\
-\xe1\xaeF\x07\x5c\x0dv\x09\x14t\xbc\xe3\x8f~(\xdc\
-\x817w~\xd3\xca6w\xc0\xa9\x18\x93 \xdf;\xb7\
-\x9f!\x0dY1\xe9\xfe\xaaQ\xaf\xcb\xb0\xc0kG\xbe\
-\xc5\xc7\xc7|{90\x0c\x83-\xff\xfaH\x86$\xdf\
-,\xf4\xd5\x9e\xbe\xe2wE\xa6\xa1\xe9H\x1a*o\xe2\
-%\xac\x00\xa1\x9d\x98\x0e\xd8\xe5\x90&N\x0f\xbd\xd1\x00\
-\xad\xb1\xcd\xd1\x8c\xb3q\x12\x18\x5cV;\xe8\x0cF0\
-d\xb1[q\xc7\xaa7@Wq)\xcd\x1ft6\x06\
-\xc7\xc9\xef\xf0\xfd\x0di\xe8\xaf\x02$\x18\xd3w*\xf3\
-\xf2\xe1\xaf\xf1\xc9\xf1_|\xcaJ\x8c\x8b\xc7\xaa\xe7\xe4\
-g\xcc\xf1&\x88\xbe\xd6\xd3\xd7\xfb\x88\x00\x08UR\xce\
-X\xa4\xab\xc6T9\x1b\xf0}\xf5~\xc9\x8d9Xz\
-i\xfb\x0a\xac+\xd9#\x15\xff\xcb\xd0\xd9\xe8c0\xc9\
-\x16\xa5\x8eAd\x9b\xca/\xe3\x0b\x87\xbe\xc2g\xa5\x1b\
-}\xf2\xd1\xcc\x9b\xff}\xecE\xbfr\xbabpZ\x9a\
-p\xdc\x8fGG\x8fy\x82\xd0\x86\xd0\xa98\xea\xc8(\
-\x97j]\x8dX[{\x10\x17e\xb8\xe7\xc2w5\x1c\
-\xc3\x87\xa5[q\xf7\xc0\x99H\xd5\x05\xb7\xa7\x04\x05\x07\
-\x05\x09\xa5\xbf\xe5^\x0c\xa3V\xde\x00\x8d\xf2\xf7\xd1\xa7\
- G]\x07\x91{\xfb\xba\xe4{\xee\xe0\x0a|Q\xb6\
-\xd9'\xcf\xf0\xec\x1c|\xf8\xe0\x93!\xd5\xe5jp\xe0\
-\xd8:\xdf\xaeFTx\x8f\x02\x08UH\xce{!\xe5\
-\xb3\x0b.,9\xb6\x01\x03cSqn\xeaH\xc9P\
-\xbf\x98\x0fcE\xe5.\x5c\xdfo\x0ar\xe3\xe5\xbd7\
-v\xb4p\x83\xd3\x86;V\xbd\x0e\x9b\xcb\x81\xc7F^\
-\x01VJ\xea$\x8f\xd2\xf5I\x18\x14\x1b\xb8\x0b\x84<\
-\xe9\xd1\xc5\xf5\xf4\xc1/\xf1\xbf\xb2\xad>\x1b=aX\
-\x1e\xde\xf8\xcb\xdfB2\x0a\x1d\x97\x96\xac\xde\xdf\xa5\x8c\
-\x1e\x07\x10\xaat\xf9\x96\xa3\xd2X\xa2+\xfa\xe0\xf8f\
-\xec\xb6\x96ba\xce\x0c\xf4\xd1\xbbW\xd9\xd7\xd4\x16\xe0\
-\xdb\xaa}\x98\x93>\x1a\xd3\x93\xe4\xcf>u\xac\xe7\x85\
-m_bw\xe5Q<\x9c{q@7 U\x97\x88\
-!q\x81\xcd\xcb\x07TA\x141\xff\xe3\xc0\xe7\xf8\xba\
-\xdc\xb7\xa7\xf5\x19\xe3&\xe1\xd9\x05\x7f\x09\xc9\x22tv\
-\xb3\xe8\x07w\xe8\xb7/\xeaq\x00\xa1\x8aR'F\xea\
-\xcc\xe8\x8bZ\x83^\xf4I\xb8-\xa7-\xe8\x85\xba\x12\
-,/\xdb\x8e)\xa6A\xb8(cl\xd0\xc6\xfb$\x7f\
--\xd6\x17\xed\x0e(\x16\x84V\x96\xa2M\xc0P5i\
-C\xd0vo_\xf0\xb1\x82\xe5\xf8\xae9>\xc3\x9b\xc0\
-\x0b\xa6\x9c\x8eE\xf3\x16\x84T\x17\xcd\x9fU\xf8\xed\xee\
-.e$\xe4\xa4\x22%O\xde[AXg\xb1:j\
-Y\xb3\xaf\x14\xf5\x85m{\xad\xb7\xbf\xfeJ\xf1\xcf(\
-\xb1\xd5\x82:\x99]\x921\xbe\xf5\xd2\x81\xc6J\xbc}\
-\xec\x17\x0c\x89M\xc3\x9f\xb2\xa6\x07l<\xfaz\xf5\xcd\
-\x91\xadX^\xb0\x1e\x83\xe330\x7f``A3&\
-\xad\x11\xb9j\xe2\xb8\x80\xed\xee\xad\xc0\xe2\xfc\xff\xe0\xc7\
-\xca]>e]y\xd6\xb9\xf8\xeb\xef\xe7\x85\x5cW\xe1\
-\xb7{\xdc[3\xf8\xa0\xf8\xbe&\xa4\x8d\x93\xe7,\xdb\
-\xad\x00\xa1\xfaV\xed,\x86\xf5\xb8\xa7K|\x03\xe7\xc0\
-c\xcd\xc9\xc4\xceN\xc9\xc5\xcc\xd46_\x19\x0bg\xc3\
-?\x0e\xbb\xf3\x00\xdf\xd0\x7f\x1a\x86\xc9\x9c\xa2u\x09<\
-\xbe=\xf2+\xbe+\xdc\x86\x8aFw}c\x12\xb31\
-7;0\x90\xd1}\xce\xf3\xe2sB\xbei\xaa\x00\xe0\
-o\xfb?\xc6\x9a*\xf7l\xa27R*\xedh\xf1\x8f\
-\xfb\xc0;\xbd\xa7\xa0\xa2\xf5\x06\xe2\xb0\xd8\xed\x00\xa1\x0a\
-V\xef9\x86\x86\xe2\xb6\xc5\x9crG\x1d\x9e/t\xfb\
-\xe8t\x04\x08=G#\xc6\xcc\xae&\x8c5\xf6\xc7\xd5\
-}'\xf9\xedk\xab\x8a~\xc37G~EQ}\x85\
+\x01\x07\x9a*Pb\xafA\x85\xcd\x82\x1ag=\x1a\
+\x1cV\xb8\x9cN\xf0.\x07\xa8G\x80/\xa2S\xbbw\
+\x0f\xb9\x08zV\xf9\x8e\xac\x9f\xd5\x0fLZd,\
+\x16\xca\x06\xc8\xde\xa3\x87p\xdd\x93\x0fy\
+\xd8\xf3\xc9\x9b\xee\xc4\xd9\x13|\xc7-\x17\
+\x96\x97\xe2\xb2G\xeej-sr\xee(\xbc\xb6\xd0S\
+\x86\xd2\x9d\xc3\x9b<\xba\x8aNW\xd3Ur[\xc0,\
+\xd8%\x00\x15:\xcd8\xd2T\x89&G#lN\x1b\xe25z\
+\x8c4\xf4A\x82&V\xb1P[o6\xd7\x9d\xd1\x07l\
+\xbf\xc8\xd8[]6@\x1cN'\xa6\xddv\xadG{\xaf>{6\
+\xee\xba\xdc\xf3\\G\x83\x9c\xb5\xf0\x06\xd47\
+\xb9\xd3\xe1\xa4\x9b\x92\xf1\xf5S\xafu{?\x0d\
+\xd6\x0f\xab\xdb\x15\x8d\x92\x0auS3\xc0\x0e\
+\x8c\x8c\xd5t\xd9\x00\xa1\xf7\xee\xf2\xc5\
+\x7f\xc1\xd1\xd2\xb6\x05\xa7\x91\x03\x87\xe0\
+\xbd\xfb\xba\xf6X\xbd\xf9\x9f\x7f\xc7\xaf\
+\x07\xda\xa2\xf1~~\xf1]\xc4\x19\xba\xf1\xf1\
+\xca\x8b\xb0-\x8b\x8c\xf5\x86(\xc1\x07t\x13S\
+\xc1\x0eWv\\\x13.\xdb\x05\x04\x90\xc7>\xf87\
+\xbe\\\xb7\xcaC\x977\xff\xf2\x08N\x1a\xe6;\
+\xd9XG\x80P@Q`u\x17\x896\x1e\xf6\xcf\xe5\xaf\
+zw\x97^\xd1\\\x8fft\x12\xb4c\"c\x8b\xb6\x80\
+\x00\xb2\xfc\xa7\xef\xf1\xd4\xc7\x9e\x03\xf5\
+\xb93\xe7\xe0\x8e\xcb\xbcG\x9c\xdd\xf0\xf4#\
+\xd8y\xb8\xc0\xa3/<\xf8\x87\x1bq\xf1\xa9\xdd\
+\xb7\xaaN\x07\xe7t\x90\xaeR\xcf\xb1\x00;,\
+\x01\xbaI\x91\xe1n\x12\x10@\xb6\x1f\xd8\x87\
+\x9b\xfe\xf9w\x0fK\x0f\xc8\xe8\x8b\xcf\xfe\
+\xfe\\'\xeb_\xb1\xe8\xaf8R\xd6\xd9\xa1\xaf\
+\xbb\x01\"\xd48\xc0\xfdV\xe3\xce\xa6A\x1dj\
+\x09@\x18F\xfa.\x12\x11\xa0\x9f\xa5\xf3\xa2\
+\xfb\xbc\xf4\x99^\xa7\xd7\x88;\x86\x84&f\xa0\
+^\xe3\xf4\xb3 B\x14D\xe93\x91\x8e\xf4\x8f\
+\xf2\xd1\xf3B3\x8f\xbb\x0cM\xe2.%\xc9n\xe6\
+\xa3\x9f\xa52<M\xf0.\x00\xd2\xb5f\xf9=\xa7\
+\xff\x86]\x136'\x1e\xbai\x91\x11z\x1b\x10@\
+\xea\x1a\xad\x98qW\xe7\xb8\x05:\x93Eg\xb4(\
+\x95\xd5T\xe1\x8e\x97\x9f\xf2\x0a\x8e~i\x19x\
+\xf7\xdeG\x91dL\x08\xfbM\x88\xa4\x0a$\xc0Q\
+\xa0H\xe0\x13\xa4\xcf\x14Hnp5\x9fo\x01\x9a\
+\x04:\xfa\x9f\xfbZ\x1b\x9f\x1b\x88-\x80$\xcd\
+,\x10\x047\xa0\x9b\x01.\xf1\xd3\xb2T\x9e\x04\
+n\xb8\x01+\xc9k\xfe\xde\xf2# \xf1\x02L\xbb\
+\x1f\x05*\x8b\xca\xa6\xe5Z\x7f\x10\x0246\xdb\
+7\x16\xba33\x03,ub\xd8\x03\x02\x08U\xf1\x9a\
+\xc7\xef\x93\x1c\x10;\xd2\x15g\x9c\x83\xcbO\
+\x9f\x85{\xdf|\xde+8(\xff}W\xdd\x80\xcb\xce\
+\x88\xae\xcd\xacN\xccm\xed\xe6Z%\xc0u\x06\
+\x99\x048\x09t\xa4\x0d\xfc\xd2S\x18\xa0N\x8b\
+\x91@\x01\x03d\xd1\xbb\xaf\xe1\xab\x8dk\xbd\
+\xb6mPf\x7f\x9f\xe0\xa0\x0b\x84t\xa1P%\xd5\
+\x02\x91d\x81\x80\x01\xf2\xc5\xba\x1f\xf1\
+\xf8\x07\xcdQr2Z\x9ab4\xe1\xa1\xebn\xc2\xa9\
+\xa3O\x92\xc1\xad\x0c\xcb??y\x1f\x07J\xdcO9{\
+C\x93\xf4\x9a Q\xf3\x87\x87f\\#\x8d\x0f\x04i\
+\xcc H\xaf%\x82\xf4K'HG\xfa\xbaA_%\xe8_\x1c\
+\xf4\x88\xe5t`\x18\x02\x86\x0e`@\x87&\xf4\
+\xe8\xfeF\xff'\xf4;}\x15\xa1\x9fA\xdc\xa1\
+\xef\xd2XGb\x96\xc6;\x84\xa5c\x1e\"m$#\x95g\
+\xe9\x98\xc8}\x9e\x8e\x83\x18\x0d=\xc7\x80\
+\xee1\xde\xf2Gy\x18\x9d\x06\x8c\x86\x014n^\
+\xc2\xba\xc7I\"\xe5\xa3\xb2[dP9*)n\x81\x80\
+\x01B5xf\xd9\xbb\x92\xcb\xbb?\xca\xcb\x19\
+\x8c\x87\xe7\xde\x84\xa1\xfd\x07\xf8cU\xf4zG\
+'\xc9\xf6\xc2i\x07~z\xf4U\xb2\xebK\xd4\xc6cD\
+|\xf7\xea/[9\xcf\x86A\xa0?\x00Dt\xcf%4\x1f)P\
+\xe9\x19\x81\xce;H\xe7\xdd\xf3\x15- v#\xbeY\
+\x90\x84x\"\xfd\x8e\xb8\x01\xddr\x9e\xfe\x08\
+\x00\"\x05cs\xd9\xf6\xe0o\xf91\x10\xa5:(\x80\
+\xdd\x13\"\x12\x80\xe9O\x06\x05/\xfd\x91\xa0\
+\xb2\x9b\xcf'\xe4\xa5\xbb'Ez8\x05\x05\x10\
+\xda\xa6]\x87\x0f`\xed\xae_\xb1v\xe7\xaf\x9d\
+^\xabXV\x83I\xa3\xc6`\xf2\xc8q\x98{z\xf7\xbe\
+V545\xe1\xcc\x85\xbe\xfd\xbd4\x84\xc1?F\xc9\
+\xdf\xf5\xda\xa4\x89G\xae1\x02\x00\xd2\xc3;Z\
+\x8bz\xbf\xd4\xec\xc7}{}g\xb4\xff\xd3\x05\
+\x97\xe2\xe69\xca\x04g)a\x92\xa0\x01\xd2\xbe\
+\xf2\x8d{w\xe2\xbb\x9d[PXY\x81z\x87\x0d\x1a]\
+\x9bw\xea\x8dg\x9d\x8fYc'*\xa1\xab,\x19t\x16\
+m\xce\x03\xb7\xf9\xe4\xa5{\xf2=6R\xfe\x0dH\
+\xd2\x1a1<>[V\xdd*\x93\x7f\x0b|[\xb1\x03\x8f\
+\x17\xb4\xc5\xf9\x1bu1\x18\x971\x18\xfd\xe2S\
+\xa0eX\xc9\xe5\x9f\x8eU\xe9l\x9b \xcd\xdc\
+\x09\xd2\x91\xbe\xee\x1aRbaH\x8e\x87!)\xae\
+\xf9\xe9\xe4\xbf\xbeP9\x14\x01\xc8'\x1b\x7f\
+\xc2\xa7\x9b:o.C\x95;y\xc8\x08\xfcuN\xe0Y\
+\x03\x83m\x18\x9da\xa33m\xbe(\x86\xd5\xe1\
+\xefy\x97\xc9\x16\xaf\x02D\xb6\xa9d1.?\xfe\
+\x0b^:\xdc\x96\xfet\xf6\xa0I\xb8~t\xe03\x9b\
+\x12P\x92c\xa17\xb9\xffX]\xbb\x94G\xb24\x91\
+\xc7\xa4\x08@\x0e\x96\x1d\xc3\x83\xcb\xde\
+\xf6Zc\x8cN\x87\xf7\xfe|\xbf<m\x14\xe0\xdaV\
+\xb0\x17\xf3\x9f{\xd4\xa7$\xba\xa7\xf8\xa2<\
+\x19)A\x9b%$\xe9\x8c\x18\x1e\xa7>A\x14\xb85\
+\x92\x88w\x8aVaI\xd1\xeaVq\x8f\x9e:\x17\xb9\
+\xc9\xa1\xefBNA\x12\x9b\x9e\x80\xb8>\x09\xd0\
+\xc6+7\x85\xac\x08@hk\xff\xf0\xf2\xe3pr\xdeS\
+{\xbex\xdd\xad\xc8LNQ\xca\xc6]\xcaY\xb3c+\
+\xee~\xfd\x9f>y\x124\x06<<\xe2\x12\xd9\xba$k\
+\x130,>\xf4\x1b(\xbb\xc2^\xce\xf8\xfc\xa1\
+\xff\xe1\xf3\xd2\xb6 \xba%\xe7\xdd\x85x]\xe8\
+\x1d\xfa\xd7\xba\x12|R\xbe\x0d\xe3\x12\xfa\
+\xe3\xc6\xf1g\xc34$\x1d\xba\x84\xae\xf7f\x91\
+cj\xc5\x00\xf2\xfc\xcaO\xb1\xf1\xc0^\xa9N:S4\
+ &\x19\x13\x12\xb2q\xb2)\x07\xc9\xc33\x918\
+\xb8{|o\xfe\xb7\xe1',~\xefu\x9fmO\xd4\xc6\
+\xe2\xa1\xdc\x8b\xe4\xd8F\xe2I\xd1%`h\x9c\
+\x0a\x10\xd9\x06\xf3\xc3\xf8\xf7\x82\xe5\xf8\
+\xa1\xc2\xbdKpZl\"^\x9b\xf9gED\x7f\\\xb6\x15\
+\xbf\xd5\x1f\xc3\xd4\xa4A\xb80},\x18-+\x81$q\
+`h\xfdN1\x80\xfc\xbco'~\xde\xfa+\xb2X#\xc6\
+\x1a\xb3\x90\xa4\x8dmm8\xc32\xc8\x9e9\xb2[\
+\x06V\x1f\xfe\xb0\x12\xcf\x7f\xba\xd4\xa7\
+\xd1\x93tqx`\xf8\x85\xb2o\x8a\x0a\x10\xd9\
+\xa6\x92\xc5\xf8\xd7\xdd\xefa\xb3\xd9\xbd\
+\xafJ^J6\x16O\x97\xb7\x87\x8a?\xe1\xcf\x1c\
+\xfd\x01\xd5N+\xae\xe9{2\xc6\x18\xdb\xd2\x0a\
+5e\xea\xb0\xa1\xf6\x10r\xd221sL\xe0\x1b\x01)\
+\x06\x90\xe2\xdf\x0e\x83/\xf5\xbdOx\xca\x88L\
+$\x84\x88f\x7fF\xa2\xd7__\xf1\x09\xdeZ\xf9\
+\xb9O\xd6T\xbd\x11\xf7\x0e\x93\x9f\x84 Uk\
+\xc2\x90\xf8\xc8\xc9\xe3$\xc7F'\x92\xe7\xc6\
+\xed\xffB\x81\xd5\xed\xc4\xaa\x14@(0(@(=4d6\
+\x8c\xff?\xcel\xa1ee\xdb\xb0\xa3\xbe\x04\xf1\
+\x86\x18\xbc\xb3\xe0\x9e\x80\x9b\xae\x18@\
+\x8a\xbe\xdf\x03\x81\xf3\xbd\xff8\xabe\xd1\
+\xff\xcc\\0\x9a\xf0f\xb3\xf0\xb7\x88\x99\xae\
+O\xc4\xdd\xc3\xce\x97m\xa84\xbd\x09\x83cU\
+\x80\xc86\x98\x1f\xc6\xcb\xb7<\x8br\xbbYQ\
+\x80\xd0W+\xfa\x8a\xd5\xdf\x90\x84\xdb\x06\
+\xb4\xe5\x10\xb6\xf1N<u\xf4\x07\xd0\xe3\x94\
+\x81#\xb0\xf0\xa2\xc0gS\x15\x03H\xf9\xd6\xa3\
+\xb0U5ti\x9e\xee\x18\x8b<\xb2\xe4U\xac\xdc\
+\xb4\xce\xa7\x1e\x99\x86D\xdc54\x00\x80\xe8L\
+\x18\x1c\xa7\x02D)\x80\xcc\xfa\xe5\xef\xb0\
+\xf1\xee\x8d\x8c\x94z\x82|Y\xb1\x13\x1b-Gpj\
+\xd2P\\\x90\xde\x96\x9bx\xa3\xe5(\xbel\x1e\
+\xef\xcc\x1d:\x1ds.\x98\x11p3\x14\x03Hm~9\
+\xea\x8exn\x13\xd0Q\x1b\x8dA\x8b\xbe\xd3\x87\
+\x81\xd5\x85\xef)r\xd7\xab\xcfH+\xfc\xbe\xa8\
+_L\x12\xee\x1c\"?K`\xba\xde\x84A\xea\x13$\
+\xe0\x8e\xe5\xad@\x13\xe7\xc09\x1b\xda\xe2\
+\x89\x94\x00\x88C\xe0\xf0\xe4\x91\xef$\x7f\
+\xb8[\xb2NG\xaa\xce\x9d\x0c\xa2\x91w\xe0\xd5\
+\xa2\x9fP\xe3j\xc2\xc4\xc4l\\\xdeg\x02\xd2O\
+\x1a\x80\xb8>\x81\x85\xfa*\x06\x10\xbb\xa5\
+\x09e\x1b\xfc\xe7\xab\xa5\xb3Y\xf4I\x12.\xba\
+\xf1\x99G\xf0\xdb!\xcf(\xc6\xf6ue\xc5$\xe3\
+\xf6!\xf2w\x95\xcd\xd0'c`l\xf8\xf4\x0d\x97\
+\x1dz\xa2\xdc\x0a\x87\x05\x97m~\xa6U\xb5\xfe\
+\x09\xa9x\xfe\xcc\xae\x93\x0f\xfak\xc7F\xf3\
+\x11|Y\xb9\x13\x17\xa5\x8f\xc5\x94\xa4\xb6\
+\xdd\xab>,\xdd\x82]\x0d\xee\xfc\x09\x8b\x87\
+\xce\x81\x81\xd1 >\xd3\x84\xb4\xf1\x81\xadi)\
+\x06\x10\xaaH\xe5\x8eb4\x96\xb9s\xf1\xfa\"\
+\xea\xa0\x969u0\xf4\x0a\xccQ{\xab\xe3\xf7\
+\x8b\xef\xc6\xe1R\xdf[\x09\x0c\x88M\xc5\xad\
+\x83\xe5\xfb\x87\xa5\xeb\x931H\x05\x88\xbf~*\
+\xeb\xfa\x01k\x19n\xd8\xfe\x8a\x07/}\x8a\x8c\
+L\xcd\xc6\xf8>C0\xd4\xd4W\x96\x9c\xf6L\xf4)\
+\xc12,\xe6g\xb5m\x98\xda\x02\x0e:X\x9f\x975\
+\x05\xfd\xf5IR\x11\xda\xf7\xb2\xcf\xces{G\
+\xcb$E\x01\xd2TY\x8f\x8am\xfe\x13$\xc4\xf73!\
+ml`H\x96\xd9\x1e\x9c\x7f\xdf-\xa80\xd7\xfad\
+\x1f\x14\x97\x8e\x05\x83\xe4\xc7\xc4\xabO\
+\x10\xb9\x96\xf7\xcf\xb7\xd5r\x18w\xed\xf2\
+\xcci\xd0\xb1\xd4c7\xdc&\xe5|\xe6]<D\x17/\
+\x1d\x9d\x0d6\xd8*\x1a\xd0XY\xef\xc1^\xe5\
+\xb4\xe2\xd9\xa3?\xe0\xcf\x03\xce@\xb6\xc1\
+\x0d\x82\x16pL6\xe5\xe0\xdc\xb4\x91\x88e<\
+\xb3V\xa6\x8e\xee\x07c\x96\xfcEkE\x01B\x15\
+\xac\xd9{\x1c\xf5E5~\xad\x951!\x07\xb1\x19\
+\xca\x87\xde\x9ev\xfb<49|\xef\xa2\x94k\xec\
+\x87\x1brN\xf7\xab_\x0bC\xa6>\x05\x03b\xfb\
+\xc8\xe6W\x19}[\xe0\xc7\xaa]X\xbc\xff?]\x9a\
+\xe8\xc5[\xef\xc3\xb4\xd1\xe3\xbc\xf2\x08\
+\xbc\x00[u\x03l\x95V\xd8\xaa\xea\xc1\xd9]\
+\xd8V_\x84\x89\x09no\xeb\x1f\xaa\xf7\xa3\xd4\
+a\xc1\x8c\xd4\xdc\xd6\xa7FGA\xd4\x87+\xf3\
+\x14\xf9\x1b\x89*\x0e\x10\xaat\xd9\xa6\xc3\
+\xe0\x9a<\xf3\xd4\x86\xaa\xa8\x9c\x8e\xc7\
+\xf1\x1cN\xb9\xa5\xeb\x85\xa7\x09\xa6\x81\
+\xb82k\x8a\x1cq\x12O_C*\xb2c\"#\xc1\x80\xecF\
+\x9d F\xeabB]M\xba\xa2\xb7\xefY\x8c\xb1\x83\
+\x87\xfb\xd5\x90\x06\xb5\xd1YS\xfa\xd6\xd2Xj\
+\xe9r\x89\xa1\xbd0:Q\x94u\x96\xef4U\x1d+V\
+\x1c \xb4\x02kI-\xaav\xfb\xdf\xa2,ud?\x18\
+\x07\xc8\x7f\xdc\xf9\xb3Zeq\x05^\xfe\xf8\x03\
+d\xc6\x99\x90\x11\x97\x84\xf7\xf7\xac\xc2q\
+\xab\xe7\xd3\xec\xd4\xd4\\\xfc.S~tc\xa6!\x15\
+\x03T\x80\xf83\xbd\xac\xeb\xef\x14\xae\xc2\
+\x92\xe26GEo\x85>Y\xf4,h\xe8v \xc45:\xd0Pj\
+\x86\xe5`\xd7\xb3\xa8-2\x07\xcc\x1a%{\x1c\
+\x12\x16\x80PE*\xb7\x17\xa1\xb1\xbc\xebMk4\
+\xb1:\xf4\x9d:$dW\xe5\xa6\xaa\x06X\x8bj:\xbd\
+\xa3\xfeT\xb2\x1b\xafn\xf7\xfc\xc5:7c\x0cf\
+\xb4\x9b+\xf7w#\xd4'\x88?\x0b\xc9\xbf\xfeV\
+\xe1\x8fx\xafxM\x97\x05\xfc%D\xef\xaa\xb0\
+\xf9`\xb9,\x90\xf4\x9b6\x14\xbaDy\x8e\x8ca\
+\x03\x88\xa3\xae\x09\xa5\xbf\xf8\x9f\xf6\x0d\
+v\xc0.\xb8x\xe9\xd1j-\xb3\xc0^\xeb\xdb\xc5\
+\xe5\x89M\xff\xc1\x8e\x8a\xc3\xadv\xbd\xb4\
+\xef\xc98%E~f\xc7~\x86Td\xa9O\x10\xf9(\xe8\
+\x82\xf3\x8d\xa3\xdf\xe3\x83\x12\xefqC-\xc5B\
+MM{|\xed\x018\xad]\xef\xe4\x9b6~\x00\xe23\
+\xe5\xad\x87\x84\x0d \xb4\xc1\xd5;K\xd0p\xdc\
+\xedV\xd0\x15Q\x1f-\xea\xab\xd5\x15\xb9\xac\
+\x0e\xa9\xe1\xaeF\x07\\\x0dv\x09\x14t\xbc\
+\xe3\x8f~(\xdc\x817w~\xd3\xca6w\xc0\xa9\x18\
+\x93 \xdf;\xb7\x9f!\x0dY1\xe9\xfe\xaaQ\xaf\
+\xcb\xb0\xc0kG\xbe\xc5\xc7\xc7|{90\x0c\x83-\
+\xff\xfaH\x86$\xdf,\xf4\xd5\x9e\xbe\xe2wE\
+\xa6\xa1\xe9H\x1a*o\xe2%\xac\x00\xa1\x9d\x98\
+\x0e\xd8\xe5\x90&N\x0f\xbd\xd1\x00\xad\xb1\
+\xcd\xd1\x8c\xb3q\x12\x18\\V;\xe8\x0cF0d\xb1\
+[q\xc7\xaa7@Wq)\xcd\x1ft6\x06\xc7\xc9\xef\
+\xf0\xfd\x0di\xe8\xaf\x02$\x18\xd3w*\xf3\xf2\
+\xe1\xaf\xf1\xc9\xf1_|\xcaJ\x8c\x8b\xc7\xaa\
+\xe7\xe4g\xcc\xf1&\x88\xbe\xd6\xd3\xd7\xfb\
+\x88\x00\x08UR\xceX\xa4\xab\xc6T9\x1b\xf0}\
+\xf5~\xc9\x8d9Xzi\xfb\x0a\xac+\xd9#\x15\xff\
+\xcb\xd0\xd9\xe8c0\xc9\x16\xa5\x8eAd\x9b\xca\
+/\xe3\x0b\x87\xbe\xc2g\xa5\x1b}\xf2\xd1\xcc\
+\x9b\xff}\xecE\xbfr\xbabpZ\x9ap\xdc\x8fGG\
+\x8fy\x82\xd0\x86\xd0\xa98\xea\xc8(\x97j]\
+\x8dX[{\x10\x17e\xb8\xe7\xc2w5\x1c\xc3\x87\
+\xa5[q\xf7\xc0\x99H\xd5\x05\xb7\xa7\x04\x05\
+\x07\x05\x09\xa5\xbf\xe5^\x0c\xa3V\xde\x00\
+\x8d\xf2\xf7\xd1\xa7 G]\x07\x91{\xfb\xba\xe4\
+{\xee\xe0\x0a|Q\xb6\xd9'\xcf\xf0\xec\x1c|\
+\xf8\xe0\x93!\xd5\xe5jp\xe0\xd8:\xdf\xaeFTx\
+\x8f\x02\x08UH\xce{!\xe5\xb3\x0b.,9\xb6\x01\
+\x03cSqn\xeaH\xc9P\xbf\x98\x0fcE\xe5.\\\xdfo\
+\x0ar\xe3\xe5\xbd7v\xb4p\x83\xd3\x86;V\xbd\
+\x0e\x9b\xcb\x81\xc7F^\x01VJ\xea$\x8f\xd2\
+\xf5I\x18\x14\x1b\xb8\x0b\x84<\xe9\xd1\xc5\
+\xf5\xf4\xc1/\xf1\xbf\xb2\xad>\x1b=aX\x1e\
+\xde\xf8\xcb\xdfB2\x0a\x1d\x97\x96\xac\xde\
+\xdf\xa5\x8c\x1e\x07\x10\xaat\xf9\x96\xa3\
+\xd2X\xa2+\xfa\xe0\xf8f\xec\xb6\x96ba\xce\
+\x0c\xf4\xd1\xbbW\xd9\xd7\xd4\x16\xe0\xdb\
+\xaa}\x98\x93>\x1a\xd3\x93\xe4\xcf>u\xac\xe7\
+\x85m_bw\xe5Q<\x9c{q@7 U\x97\x88!q\x81\xcd\
+\xcb\x07TA\x141\xff\xe3\xc0\xe7\xf8\xba\xdc\
+\xb7\xa7\xf5\x19\xe3&\xe1\xd9\x05\x7f\x09\
+\xc9\"tv\xb3\xe8\x07w\xe8\xb7/\xeaq\x00\xa1\
+\x8aR'F\xea\xcc\xe8\x8bZ\x83^\xf4I\xb8-\xa7-\
+\xe8\x85\xba\x12,/\xdb\x8e)\xa6A\xb8(cl\xd0\
+\xc6\xfb$\x7f-\xd6\x17\xed\x0e(\x16\x84V\x96\
+\xa2M\xc0P5iC\xd0vo_\xf0\xb1\x82\xe5\xf8\xae\
+9>\xc3\x9b\xc0\x0b\xa6\x9c\x8eE\xf3\x16\x84T\
+\x17\xcd\x9fU\xf8\xed\xee.e$\xe4\xa4\"%O\xde\
+[AXg\xb1:jY\xb3\xaf\x14\xf5\x85m{\xad\xb7\
+\xbf\xfeJ\xf1\xcf(\xb1\xd5\x82:\x99]\x921\
+\xbe\xf5\xd2\x81\xc6J\xbc}\xec\x17\x0c\x89M\
+\xc3\x9f\xb2\xa6\x07l<\xfaz\xf5\xcd\x91\xadX\
+^\xb0\x1e\x83\xe330\x7f``A3&\xad\x11\xb9j\
+\xe2\xb8\x80\xed\xee\xad\xc0\xe2\xfc\xff\xe0\
+\xc7\xca]>e]y\xd6\xb9\xf8\xeb\xef\xe7\x85\\W\
+\xe1\xb7{\xdc[3\xf8\xa0\xf8\xbe&\xa4\x8d\x93\
+\xe7,\xdb\xad\x00\xa1\xfaV\xed,\x86\xf5\xb8\
+\xa7K|\x03\xe7\xc0c\xcd\xc9\xc4\xceN\xc9\xc5\
+\xcc\xd46_\x19\x0bg\xc3?\x0e\xbb\xf3\x00\xdf\
+\xd0\x7f\x1a\x86\xc9\x9c\xa2u\x09<\xbe=\xf2+\
+\xbe+\xdc\x86\x8aFw}c\x12\xb317;0\x90\xd1}\
+\xce\xf3\xe2sB\xbei\xaa\x00\xe0o\xfb?\xc6\
+\x9a*\xf7l\xa27R*\xedh\xf1\x8f\xfb\xc0;\xbd\
+\xa7\xa0\xa2\xf5\x06\xe2\xb0\xd8\xed\x00\xa1\
+\x0aV\xef9\x86\x86\xe2\xb6\xc5\x9crG\x1d\x9e\
+/t\xfb\xe8t\x04\x08=G#\xc6\xcc\xae&\x8c5\xf6\
+\xc7\xd5}'\xf9\xedk\xab\x8a~\xc37G~EQ}\x85\
 \x07\xef)\xc9Cpi\xbf\xc0\xa6\x8b\x8dl\x0cF&\
-\xc8\xf7\xfe\xf4\xab\x5c\x143<\xb8\xefC\xac\xadn\xdb\
-\xd0\xb5\xa3)\x16^6\x17\xd7\xcc\x94\x1f\x0e\xed\xcb\x94\
-%k\xf2\xc1\xd9|;\xcbj\xe3\xf5\xe8\x7f\x9a\x7f\x87\
-H*\xff\x84\x00\x84V\xdc>D\xb7=@F\x1a\xfb\
-\xe2\xda\xbe\x93=\xdaN\xc7 t,B\xe9\xfeA\xe7\
-\xc0\xd4.\xa5P2\xeb2\xe5\x00\x00\x16(IDA\
-T{\xc6\xb8L\x136U\x15`\xe5\xee\xb6\xb9v\x87\
-\xd5\x06[\x9d\xdb\x15%'.\x1d\xd4\x17+\x10\x8ac\
-\x0d\x18\x9d08\x90\x22*\xaf\x0f\x0b\xd0\xa4\xd54y\
-\xb5/\xfa\xdb\xb57\xe3w\xd3\xce\x0c\xd9~\xc7\xd6\x1e\
-\xe8rB\x88&\x0e\x190\xcb=K\xea\x8fN\x18@\
-\xa8b\xd4\xb9\xac\xa1\xb0F\x0a\x8ay\xfa\xc8\xf7\xa8q\
-\xb9;\xf2\xa2!\x17 \x86\xd5\xb6\xea^\xd0X\x81w\
-\x8em\x90\xbe\x9f\x9e<\x14\xb3\xd3\xda\x02\xf3\xa9\xd3\x19\
-\xfd\x8bKODl\xba\xb1S{K\xf7\x14\xa1\xe0\xa7\
-\x9d\xfe\xec\xe0\xf3\xba\x81\xd5a\x5c\xc2\xd0\xa0\xcb\xab\x05\
-\xdb,p\xf7\x9e\xf7\xb0\xa9\xd6\x9d\x13\xcb\x1b=5\x7f\
-!f\x8c\xf7\xfcq\x0c\xc6~e\x1b\x0f\xc1nn\xea\
-\xb2\xe8\xc0\xd9\xf2~(O(@h\x0b\x5c\x8dv\xd4\
-\x1d\xad\xc6\x87\xbf\xfe\x84_j\xddn)\xf7\x0d:\xc7\
-#\xf1\x1c=\xf7r\xf1O8f3cHB\x06\xee\
-\x9e~!t4iqB,41m@\xf2f\x91\
-\xf2\xfd\xc5\xd8\xbf\xca\x9d\xc9/\x18\xa2\xd9\xe0\xc7'\x0e\
-\x0b\xa6\xa8Z\xa6\x83\x05\x16\xee^\x82mf\xdf\x0e\xac\
-\xaf\xde\xf9 &\x8f\x18\x1d\xb2\xdd\xe8\x92\x02\x0d\xac\xea\
-\x8a\x22\x06 -\x8d\xa09\xb5\xb6\xef\xdd\x0f\xd6\xce#\
-\xcb\x90\x04\xde\xc1I;-1:\x16\xac^\x03\x18u\
-8\xee\xac\xc3\xe0>\xfd@\x13b\xcb\xa5\x8a\x83\xc7\xb1\
-\xef;\xdfs\xef\xfe\xe4h\x89\x06\x13L\xf2\xdeW\xfd\
-\xc9\x8a\xf6\xebw\xecz\x1b\xdb-G\xbc\x9aa\xd4\xc0\
-\xa1\xf8\xc7\x9fnGfJh\xa9B\xa9\xf0\x8a_\x0b\
-\xd1T\xe1\x19\x9e\xdb\xb1\xd2\x88\x03H\xb8:O\xf5\xd1\
-r\xec^\xb9%h\xf1\x1a\xc2b\xa2)7\xe8\xf2j\
-\xc1\xce\x16\xe0E\x1e\xf1\x7f\x08\xdfS\xb9\xea\xb7bX\
-K}'\x0f\xa1y{\x07\xcc\x8c\x801Hwt\x9e\
-\xda\xe2J\xec\x5c\xd1\x96M<\xd0:i\x22\xee\xc9I\
-y\x81\x16S\xf9\xbb\xb0\x80K\xe4\x90\xf0\x87\xf0=\x95\
-\xab\xf7\x1cGC\xb1\xef\xbc\x08=z\x1d\xa4\xbb{\x8e\
-\xa5\xb4\x06;>\xf7\xedb-G\x9f\xc9I#\x9b\xb7\
-\xef\x94\xc3\xad\xf2\xf8\xb3\x80St!\xf1\x0f\xe1{*\
-\xff\xe7\x9b\xef\x90\xdc\xa8A\xa6>\x01t?\x98\x8eD\
-\x17\x09)H\xe4\xd0\x09\x1f\xa4\xcbQ2\x14\x9e\x86J\
-\x0b\xb6}\xe2}\xdbj\xb9rO6\xe55\xefl+\
-\xb7\x84\xca\xd7\x95\x05\xecp!\xe9\x9a\xf0\x01\xe4\xf6\x7f\
-\xbf\x88r\xab\xfb\x15\x8b&\x8c\xebcHDfl\x12\
-\xfa\x9b\x921x\xe0\x00\x9c4J\xfe\x1bA\xaf\x07H\
-Sm\x036\x7f\xd4u\x1c\xb4\xbf\xee<11\x17\x1a\
-&|\xe9R\xfd\xd5\xdf\xdb\xae\xdb\x88\x13\xc9W\xcb\xcf\
-,\x12H\xfb]<\x87y\xaf=\x09\x17\xc7{-\xf6\
-\xf1\x9d\x0f\x07\xe4\xcd\xdd\xeb\x01B\x17\x097-]\x15\
-\x88\x8d;\xf1\xd2i^:\xdd\xab\x922\x16hb\x9d\
-H\xb92<\x00\xa9\xb0\x98q\xdb\x92\x97\xbc*j4\
-\xc4\xe2\xed\x05w\x07\xd4\x88^\x0f\x10G\xa3\x1d\x1b\x96\
-|\x1f\x90Q:2\x8fK\x1c\x0aC\x87\x0c}!\x09\
-\x8c\xf2\xc2\x8dZ'R\xaf\x08\x0f@\xf6\x1e+\xc4\xe2\
-\xe5\xefy\xb5\xf0\xa4\xc1\xc3q\xf7\xef\xe4o\x01N\x85\
-\xf4z\x80p\x0e\x17\xd6\xfd\xbb-iC0}s\x8c\
-q0b5\xa1\xef\xa3\x17L\xdd\xbd\xb1\x8cU\xefD\
-\xdae\xe1\x01\xc8\xa6\xfc\xdd\xf8\xdf\xb6\x8d(\xa9\xa9D\
-\x93\xcb\x09\x86m{5\x9e{\xdaL\xcc\x9905 \
-\x93\xf6z\x80\xf0\x1c\x8f\xb5\xaf\xaf\x0c\xc8(\x1d\x99G\
-\x19\x07!^#?L7\xa4\xca\xa2\xa0\xb05\xc6\x85\
-\xb4K\x94\x19\xa4\x1f:^\x82\xdf\x0e\xe57\xff\x15\xa0\
-\xbc\xd63\x9cB\xa3\xd5b\xf4\xd0\x11\x98y\xf2TL\
-\x1d6\x0a\xfdSR\x03\xb2p\xaf\x07\x08\xb5\xc6\x9aW\
-\xdc\xf1\xe8\xc1R\x9e1\x07\x09\x1a\xf7\xbe\x13*\x85n\
-\x81\x86x\x17\xd2/\x0c\x1d \xcf-_\x8a\x8f~\x94\
-\xff\xe3\xb7\xed\x8de\x01+\x1f\x15\x00\xa1c\x10:\x16\
-\x09\x96hD!\x8d,TI\x19\x0bX\x13x\xa4\xcd\
-\x09m%\xfd\xbc{\x17\xa0\xca\xe2?\xe7Z{\x8dG\
-d\x0f\xc2\xd2\x07\x9f\x08\xa8\x11Q\x01\x10\xba\x0eB\xd7\
-C\x82\xa5\x81\xb1}\x91\xd1\xbc\xc7D\xb02\xd4rm\
-\x16\xb0&\xf3H;/x\x80\xbc\xf1\xbf\xe5\xf8\xf7W\
-\x9f\x05e\xd2\xb3'\x9c\x82'o\xbaSv\xd9\xa8\x00\
-\x08\xf5\xc5\xa2>Y\xc1\x12\xcd\xacH3,\xaa\xa4\x8c\
-\x05\x1a\xd3D\xa4\xce\x0a>\x01\xc7\xe5\x8b\xff\x82\xa3\xa5\
-\xee\xdd\xa3\xbc\xd1\x98ACq\xda\xd8\x898^]\x85\
-/\xd6\xfd\xd8\x89\xe5\xd2\xd3\xce\xc6\xfd\xd7\xdc(\xab1\
-Q\x01\x10\x1a\x0fB\xe3B\x82%57V\xb0\x96\xf3\
-^\xae1\x93 \xf5\xac\xe0\xa24\x0f\x1e+\xc2U\x8f\
-\xde\xeb!\x98z\x02\x8f\x19<\x14c\x06\x0d\x03}B\
-\xb4\x10\x05\x11\x05SG2\xc6\xc6a\xcd\xf3o\xcbj\
-TT\x00\xa4p\xeb\x01\x1c\xdd\x9c/\xcb \xde\x98R\
-t\x89\x18\xaa\xa6\xfe\x09\xda~\x1d\x0b6e1H9\
-m`P\xf2\x96\xaf\xf9\x1eO-k\xdb\xa5j\xf2\x88\
-1x\xf5\xce\x07|\xca\xfa\xe3S\x0fc\xd7\x91\x83\x1e\
-\xd7O\x1f7\x11\xff\x5c\xf0WY\xf5G\x05@\xca\xf6\
-\x15!\x7fu\xf0Q\x85\x89\x9ax\x8c0\xbaw1R\
-)t\x0b4\x0d\xd1\x22e\xb2\xbc\xac\x22\x1dk\xbb\xf3\
-\x95\xa7\xb0~\xf7\x8e\xd6\xd3\x8f\x5c7\x1fs\xa6\xb6\xa5\
-\x89\xea\xc8\xefm\xbcr\xc7e\xd7`\xee\xcc9\xb2\x1a\
-\x12\x15\x00\xa9-\xae\xc2\xce\x15\xbes\xc2\xfa\xb3\x94\x1a\
-\x97\xee\xcfB\x81]\xb7\xe7\xea\x914!\xb8d|\x13\
-o\xf6\x5c\x09\xff\xe2\xd1\xe7\x91\x95\xee{g\x80E\xef\
-\xbe\x86\xaf6z:\xab.\xb9\xef1\x8c\x1e(o\x0c\
-\x14\x15\x00i\xac\xa9\xc7\x96\x8f\x7f\x0a\xec.\xb6\xe3\xd6\
-1Z\x9c\xa4\x86\xdd\x06m\xbf\x8e\x05\x1d\xa3c`\x1a\
-#/q[\xfb\xb2\xc5\x15e\xb8\xe4o\x0b[O\xd1\
-\xe8\xc3\xff=\xf1r\x97zu\xdc\x16\xdc\x18\x1b\x8b5\
-\xcfw\xbd\x91h{\x81Q\x01\x10\x97\xdd\x89\xf5o\xb9\
-sk\x05Cj\xd0T0V\xf3]\xc65\xde\x88\x84\
-<\xf9[P\xb4HZ\xb7{;\x16\xbe\xf2t\xab\xe0\
-+\xce8\x07\xf7\x5cu}\x97\xcau\x5c/9y\xc4\
-h\xbcv\xe7\x83\xb2\x1b\x14\x15\x00\xa1\xd6\xf8\xf9__\
-\x05\xbd\xc7\x08-\xaf\xc6\x84\xc8\xeeS~\x19\xb9\x09F\
-\x18s\x03\x07\xc8\xd2\x1f\xfe\x87\x17?\xfd\xb0U\xfe\xd3\
-\xf3\xef\xc2Y\xe3}\xe79khj\xc2\x99\x0b\xff\xe8\
-\xa1\xcf\x0d\xb3/\xc1\x82\x0b\xaf\xf0\xabc\x0bC\xd4\x00\
-d\xe3{?\xc2\xde\xd0u*\x98\xae\xac6>q(\
-\xf4\xaaG\xaf\xec\x8e\xd5\x15\xa30\xc9\x84\xb8a\x81o\
-\xde\xfa\xc8\x92W\xb1rS\xdb\x0eU\xdf?\xfb\x06\x92\
-\x8d\xbe\xb7R[\xbdc\x0b\xeey\xfd9\x0fU^\xbe\
-\xe3~L\xc9\x93\x9f\xe39j\x00\xb2\xfd\xd3u\xa8+\
-\x0f\xcc5\xa1\xbdeU\x87EE\xb0!\x09\x11ON\
-B\xec\xd0\xe4\x80\x05n\xc9\xdf\x83o\xb7\xfc\x82\xef\xb6\
-\xac\x87\xc3\xe5\x82?\xdf*:\x1dL\xa7\x85[(\xc9\
-\x98\x80\x15O\xbc\x8c\x18]\xe70\x5c_\xcaD\x0d@\
-\xf6~\xb3\x0d\x95\x87K\x03\xbe)-\x05r\xe3\xb2a\
-\xd2uNL\x17\xb4\xc0h.8%\x051\x83\xe4\xc5\
-\x84\xfb2SYm52\x93\xbb\xf6\xcc\x9d\xf7\xe4\xc3\
-\xd8s\xb4m\x0dd\xea\xc8\xb1x\xe9\xf6\xfb\x03\xb2|\
-\xd4\x00\xe4\xe0\xda\xdd8\xb6K\xfeNW\x1d\xadH\xf7\
-\x08\xa1{\x85\xa8\xa4\x80\x05\xa6\xa5\x22&'\xbc\xb6\xac\
-\xae\xb3\xe0\xe2\x87\xee\x80\xcd\xe9\xde\x9b\x92\xd2\x0d\xb3/\
-\xc6\x82\x0b\x7f\x1fP\x03\xa2\x06 \xc5\xbf\x1e\xc4\xe1\x8d\
-]\xef<\xd4\x95\xe5\x06\xc4\xf6A\xa6>\xf0\xf7\xe6\x80\
-\xeeF\x9403\xa7\xa6A\x9f\x1d^\xef\xe8o\xb7n\
-\xc0Coy\x86\xde\xd2\xd5s\xba\x8a\x1e\x08E\x0d@\
-\xca\xf3\x8fa\xff\x8f\xdb\x03\xb1\x8d\x07\xaf\xba\x99g\xd0\
-\xa6\xebT\x90==\x1d\xba\xfe\xe1}]}\xed\xcbe\
-x\xe7\x9b/[\xebNM4a\xe9\x03\xff@\x9a)\
-)\xa0\x86D\x0d@\xcc%U\xf8\xed\xbf\xc1\xaf\xa6\xab\
-{\x15\x06\xd4\xaf\xbad\xd6\x9e\x99\x09M\xdfX\xe5\x04\
-z\x91D]L:\xd2\xcds.\x0f\xb8\xce\xa8\x01H\
-S\xad\x15\x9b?r\xefA\x12\x0c%\xeb\x120,.\
-+\x98\xa2j\x99\x0e\x16\xd0\xce\xc8\x84\xa6Ox\x01\xa2\
-\x94\xd1\xa3\x06 t\xc7\xa1\xb5o~\x1d\xb4\xdd\x124\
-\xb1\xc83\x06\xe7\x81\x1at\xa5\xbd\xb4\xa0\xfe\xfc,0\
-&\xf9\x09\xc8O\xa4\x19\xa2\x06 \xd4\xc8\xeb\xde\xf8\x1a\
-\x9c\xcb\xf7\xd6\x5c]\xdd\x08u\x9f\x10\xe5\xba\xa9\xe1\xb2\
-\x1c\x10}d$\xe2\x8b*\x80l\xfe`5\x9a,\xd6\
-\xa0\xee4\xcd\xacH3,\xaa\x14\x9a\x05D\x88\x88\xbd\
-F\x9e'mh5)S:\xaa\x00\xb2\xe3\x8b\x0d\xb0\
-\x1c\xf7\xbe\xcb\xae\x1cs\x9e\x92$/e\xbe\x1cY\xd1\
-\xca\xc3\xb1\x02\x8cWF\xce\x8e]Q\x05\x90\x82\x9fw\
-\xa1twa\xd0}sl\xc2\x10\xc4x\xc9\x16\x1e\xb4\
-\xc0(,\xe82\x08H\xb8T\x05H\x8f\xbc\xf5\xc7w\
-\x17\xe2\xc0\xcf\xbe\xf7\xe9\xf6\xa7\xf4\xd0\xb8,\xa4\xe8\xc2\
-\xbb\xc0\xe5O\x87H\xbf\xeeL\xd7 qf\xe4Dg\
-F\xd5\x13\xc4|\xbc\x1a\xbf}\xe1\xde\x0c4\x18\xeao\
-HC\xff\x98\xc0\xdd\xb4\x83\xa9\xab\xb7\x96\x11\xc7' \
-6/r2\xc4D\x15@\x9c6\x07~y\xfb\xbb\xa0\
-\xfb\x1e}z\xd0\xa7\x88J\xc1[\xc0pQ6H\x5c\
-\xe4d\xca\x8f*\x80\xd0\xdb\xba\xf5??\xc3ZU\x17\
-\xd4\x1d\xa6\xf1 4.D\xa5\xe0,\xc0\xeb\x81\xf8\xcb\
-\x22k\xcf\xf9\xa8\x03H\xd1\xaf\x07q$\x04\xa7E5\
-p*8p\xd0R\x9a\xb1I\xd0\x8e\x0a<\x0e$\xf8\
-\x1aC/\x19u\x00i\xa8\xaa\xc3\x8e\xcf\xd7\x83wy\
-\xdf\x81\xc8\x9fI\x07\xc6f\x22C\x1fY7\xd9_\x9b\
-\xba\xe3:I\xd3\xc30+\xb8L&\xdd\xa1\x9f\xaf:\
-\xa2\x0e \xd4\x10\xc5\xbf\x1e\xc2\xe1\x8d\xfb\x82\xb2{\x1c\
-\x1b\x83\xd1\x09\xc1e\x05\x0c\xaa\xc2^PH3)\x15\
-\xdaa\xe1\x8d\xff\x08\x97\x99\xa2\x12 \xd4\x98\x05kv\
-\xa1topk\x224.\x84\xc6\x87\xa8\xe4\xdd\x02\x02\
-\x0b\x88\x89\x1a\xe8r\x12\xa0\xed\x1f\x0fb\x8c\x9cAy\
-\xc7\x16E-@\xa8!(@J\xf7\x14\xa3\xa1*\xf0\
-\xcc\xef\xd4\xbbw@LF\xafK\xe4\xc0\x8b\x02\x1ay\
-;\xac\xae&4pMhp5\xa2\xce\xd9\x08+\xdf\
-\x84F\x97\x0dv\xde\x09\xbb\xe0\x84\x8dsz\xf4\xa5\x09\
-c\xc7c\xd6ig\x81I\xd0\x81\xc4D\x86\x9f\x95\x9c\
-\x1f\xb8\xa8\x06H\x8b\x81l\x16+\x1a\xcd\x8dh2\xd7\
-\xe3\x93\xef\xfe\x8b\xaa\xfa\x1a\xb8\x04\x17\x5c<\x0f\x97\xc0\
-\x81\x139\xd0\x8e\xc3\x12\x06,a[\x8f\x06\x8d\x0e\x99\
-\x86\x14\xf4\x89I\x81I\x9b\xe0\xe6\x03\x0f\x8e\x17\xc0C\
-\x00/\xf0\xd2\xee\xb8Z\x96\x85\x16\x1a\xe8X-X\xe9\
-\xc8B\xc3h\xc0\x82\x01\xcb\xb0\xd2\x16\xd3,\xfdF \
-\xc9g\xa4z\x18H\xff\xe8\x91\x109\xf7\x12\x82(B\
-\x80\x00Q:\x8a\x10E\xa1\xf9\x9c\x88&\xce\x8eF\x97\
-\x1dV\x8evx+,.+,\xcezX\xa5s6\
-X\x5c\xf50;\xad\x120\x82\xa13&N\xc7\xa2\x05\
-\x9eI\xa5\x83\x91\xd3\xd3\xca\xa8\x00\xe9pG.\xbd\xeb\
-Z\xd4\xd4\x05\x9f\xfd\xa4\xa7\xdd\xe0\xee\xd2G\x05Hw\
-Y\xfa\x04\xd7s\xde-\x97\xc1\xe6h\x0b\xf4?\xc1\xea\
-DL\xf5\xd7\xfd\xee*\x5c\x7f\xe1\xd5\x11\xa3\xaf\x5cE\
-\xd5'H\x07K\xcd\x9a\x7f\x09\x9c.\x97\x5c\xfb\xa9|\
-\xcd\x16\xa0\xafW\xf4)\xd2\xdbH\x05H\x87;z\xed\
-C\x0bP\x5cv\xac\xb7\xdd\xe7\xb0\xb7\xe7\xbdG_\xc3\
-\x80\xbe\xbd\xcf\x0dG\x05H\x87\xae\xb3\xe8_O\xe1\xa7\
+\xc8\xf7\xfe\xf4\xab\\\x143<\xb8\xefC\xac\
+\xadn\xdb\xd0\xb5\xa3)\x16^6\x17\xd7\xcc\x94\
+\x1f\x0e\xed\xcb\x94%k\xf2\xc1\xd9|;\xcbj\
+\xe3\xf5\xe8\x7f\x9a\x7f\x87H*\xff\x84\x00\
+\x84V\xdc>D\xb7=@F\x1a\xfb\xe2\xda\xbe\x93=\
+\xdaN\xc7 t,B\xe9\xfeA\xe7\xc0\xd4.\xa5P2\
+\xeb2\xe5\x00\x00\x16(IDAT{\xc6\xb8L\x136U\
+\x15`\xe5\xee\xb6\xb9v\x87\xd5\x06[\x9d\xdb\
+\x15%'.\x1d\xd4\x17+\x10\x8ac\x0d\x18\x9d08\
+\x90\"*\xaf\x0f\x0b\xd0\xa4\xd54y\xb5/\xfa\
+\xdb\xb57\xe3w\xd3\xce\x0c\xd9~\xc7\xd6\x1e\
+\xe8rB\x88&\x0e\x190\xcb=K\xea\x8fN\x18@\xa8\
+b\xd4\xb9\xac\xa1\xb0F\x0a\x8ay\xfa\xc8\xf7\
+\xa8q\xb9;\xf2\xa2!\x17 \x86\xd5\xb6\xea^\
+\xd0X\x81w\x8em\x90\xbe\x9f\x9e<\x14\xb3\xd3\
+\xda\x02\xf3\xa9\xd3\x19\xfd\x8bKODl\xba\xb1\
+S{K\xf7\x14\xa1\xe0\xa7\x9d\xfe\xec\xe0\xf3\
+\xba\x81\xd5a\\\xc2\xd0\xa0\xcb\xab\x05\xdb,\
+p\xf7\x9e\xf7\xb0\xa9\xd6\x9d\x13\xcb\x1b=5\
+\x7f!f\x8c\xf7\xfcq\x0c\xc6~e\x1b\x0f\xc1nn\
+\xea\xb2\xe8\xc0\xd9\xf2~(O(@h\x0b\\\x8dv\
+\xd4\x1d\xad\xc6\x87\xbf\xfe\x84_j\xddn)\xf7\
+\x0d:\xc7#\xf1\x1c=\xf7r\xf1O8f3cHB\x06\xee\
+\x9e~!t4iqB,41m@\xf2f\x91\xf2\xfd\xc5\xd8\
+\xbf\xca\x9d\xc9/\x18\xa2\xd9\xe0\xc7'\x0e\
+\x0b\xa6\xa8Z\xa6\x83\x05\x16\xee^\x82mf\xdf\
+\x0e\xac\xaf\xde\xf9 &\x8f\x18\x1d\xb2\xdd\
+\xe8\x92\x02\x0d\xac\xea\x8a\"\x06 -\x8d\xa0\
+9\xb5\xb6\xef\xdd\x0f\xd6\xce#\xcb\x90\x04\
+\xde\xc1I;-1:\x16\xac^\x03\x18u8\xee\xac\xc3\
+\xe0>\xfd@\x13b\xcb\xa5\x8a\x83\xc7\xb1\xef;\
+\xdfs\xef\xfe\xe4h\x89\x06\x13L\xf2\xdeW\xfd\
+\xc9\x8a\xf6\xebw\xecz\x1b\xdb-G\xbc\x9aa\
+\xd4\xc0\xa1\xf8\xc7\x9fnGfJh\xa9B\xa9\xf0\
+\x8a_\x0b\xd1T\xe1\x19\x9e\xdb\xb1\xd2\x88\
+\x03H\xb8:O\xf5\xd1r\xec^\xb9%h\xf1\x1a\xc2b\
+\xa2)7\xe8\xf2j\xc1\xce\x16\xe0E\x1e\xf1\x7f\
+\x08\xdfS\xb9\xea\xb7bXK}'\x0f\xa1y{\x07\xcc\
+\x8c\x801Hwt\x9e\xda\xe2J\xec\\\xd1\x96M<\
+\xd0:i\"\xee\xc9Iy\x81\x16S\xf9\xbb\xb0\x80K\
+\xe4\x90\xf0\x87\xf0=\x95\xab\xf7\x1cGC\xb1\
+\xef\xbc\x08=z\x1d\xa4\xbb{\x8e\xa5\xb4\x06;\
+>\xf7\xedb-G\x9f\xc9I#\x9b\xb7\xef\x94\xc3\
+\xad\xf2\xf8\xb3\x80St!\xf1\x0f\xe1{*\xff\
+\xe7\x9b\xef\x90\xdc\xa8A\xa6>\x01t?\x98\x8e\
+D\x17\x09)H\xe4\xd0\x09\x1f\xa4\xcbQ2\x14\
+\x9e\x86J\x0b\xb6}\xe2}\xdbj\xb9rO6\xe55\xef\
+l+\xb7\x84\xca\xd7\x95\x05\xecp!\xe9\x9a\xf0\
+\x01\xe4\xf6\x7f\xbf\x88r\xab\xfb\x15\x8b&\
+\x8c\xebcHDfl\x12\xfa\x9b\x921x\xe0\x00\x9c4\
+J\xfe\x1bA\xaf\x07HSm\x036\x7f\xd4u\x1c\xb4\
+\xbf\xee<11\x17\x1a&|\xe9R\xfd\xd5\xdf\xdb\
+\xae\xdb\x88\x13\xc9W\xcb\xcf,\x12H\xfb]<\
+\x87y\xaf=\x09\x17\xc7{-\xf6\xf1\x9d\x0f\x07\
+\xe4\xcd\xdd\xeb\x01B\x17\x097-]\x15\x88\x8d\
+;\xf1\xd2i^:\xdd\xab\x922\x16hb\x9dH\xb92<\
+\x00\xa9\xb0\x98q\xdb\x92\x97\xbc*j4\xc4\xe2\
+\xed\x05w\x07\xd4\x88^\x0f\x10G\xa3\x1d\x1b\
+\x96|\x1f\x90Q:2\x8fK\x1c\x0aC\x87\x0c}!\x09\
+\x8c\xf2\xc2\x8dZ'R\xaf\x08\x0f@\xf6\x1e+\
+\xc4\xe2\xe5\xefy\xb5\xf0\xa4\xc1\xc3q\xf7\
+\xef\xe4o\x01N\x85\xf4z\x80p\x0e\x17\xd6\xfd\
+\xbb-iC0}s\x8cq0b5\xa1\xef\xa3\x17L\xdd\xbd\
+\xb1\x8cU\xefD\xdae\xe1\x01\xc8\xa6\xfc\xdd\
+\xf8\xdf\xb6\x8d(\xa9\xa9D\x93\xcb\x09\x86m{\
+5\x9e{\xdaL\xcc\x9905 \x93\xf6z\x80\xf0\x1c\
+\x8f\xb5\xaf\xaf\x0c\xc8(\x1d\x99G\x19\x07!^\
+#?L7\xa4\xca\xa2\xa0\xb05\xc6\x85\xb4K\x94\
+\x19\xa4\x1f:^\x82\xdf\x0e\xe57\xff\x15\xa0\
+\xbc\xd63\x9cB\xa3\xd5b\xf4\xd0\x11\x98y\xf2\
+TL\x1d6\x0a\xfdSR\x03\xb2p\xaf\x07\x08\xb5\
+\xc6\x9aW\xdc\xf1\xe8\xc1R\x9e1\x07\x09\x1a\
+\xf7\xbe\x13*\x85n\x81\x86x\x17\xd2/\x0c\x1d\
+ \xcf-_\x8a\x8f~\x94\xff\xe3\xb7\xed\x8de\
+\x01+\x1f\x15\x00\xa1c\x10:\x16\x09\x96hD!\
+\x8d,TI\x19\x0bX\x13x\xa4\xcd\x09m%\xfd\xbc{\
+\x17\xa0\xca\xe2?\xe7Z{\x8dGd\x0f\xc2\xd2\
+\x07\x9f\x08\xa8\x11Q\x01\x10\xba\x0eB\xd7C\
+\x82\xa5\x81\xb1}\x91\xd1\xbc\xc7D\xb02\xd4r\
+m\x16\xb0&\xf3H;/x\x80\xbc\xf1\xbf\xe5\xf8\
+\xf7W\x9f\x05e\xd2\xb3'\x9c\x82'o\xbaSv\xd9\
+\xa8\x00\x08\xf5\xc5\xa2>Y\xc1\x12\xcd\xacH3\
+,\xaa\xa4\x8c\x05\x1a\xd3D\xa4\xce\x0a>\x01\
+\xc7\xe5\x8b\xff\x82\xa3\xa5\xee\xdd\xa3\xbc\
+\xd1\x98ACq\xda\xd8\x898^]\x85/\xd6\xfd\xd8\
+\x89\xe5\xd2\xd3\xce\xc6\xfd\xd7\xdc(\xab1Q\
+\x01\x10\x1a\x0fB\xe3B\x82%57V\xb0\x96\xf3^\
+\xae1\x93 \xf5\xac\xe0\xa24\x0f\x1e+\xc2U\
+\x8f\xde\xeb!\x98z\x02\x8f\x19<\x14c\x06\x0d\
+\x03}B\xb4\x10\x05\x11\x05SG2\xc6\xc6a\xcd\
+\xf3o\xcbjTT\x00\xa4p\xeb\x01\x1c\xdd\x9c/\
+\xcb \xde\x98Rt\x89\x18\xaa\xa6\xfe\x09\xda~\
+\x1d\x0b6e1H9m`P\xf2\x96\xaf\xf9\x1eO-k\xdb\
+\xa5j\xf2\x881x\xf5\xce\x07|\xca\xfa\xe3S\
+\x0fc\xd7\x91\x83\x1e\xd7O\x1f7\x11\xff\\\
+\xf0WY\xf5G\x05@\xca\xf6\x15!\x7fu\xf0Q\x85\
+\x89\x9ax\x8c0\xbaw1R)t\x0b4\x0d\xd1\"e\xb2\
+\xbc\xac\"\x1dk\xbb\xf3\x95\xa7\xb0~\xf7\x8e\
+\xd6\xd3\x8f\\7\x1fs\xa6\xb6\xa5\x89\xea\xc8\
+\xefm\xbcr\xc7e\xd7`\xee\xcc9\xb2\x1a\x12\
+\x15\x00\xa9-\xae\xc2\xce\x15\xbes\xc2\xfa\
+\xb3\x94\x1a\x97\xee\xcfB\x81]\xb7\xe7\xea\
+\x914!\xb8d|\x13o\xf6\\\x09\xff\xe2\xd1\xe7\
+\x91\x95\xee{g\x80E\xef\xbe\x86\xaf6z:\xab.\
+\xb9\xef1\x8c\x1e(o\x0c\x14\x15\x00i\xac\xa9\
+\xc7\x96\x8f\x7f\x0a\xec.\xb6\xe3\xd61Z\x9c\
+\xa4\x86\xdd\x06m\xbf\x8e\x05\x1d\xa3c`\x1a#\
+/q[\xfb\xb2\xc5\x15e\xb8\xe4o\x0b[O\xd1\xe8\
+\xc3\xff=\xf1r\x97zu\xdc\x16\xdc\x18\x1b\x8b\
+5\xcfw\xbd\x91h{\x81Q\x01\x10\x97\xdd\x89\
+\xf5o\xb9sk\x05Cj\xd0T0V\xf3]\xc65\xde\x88\
+\x84<\xf9[P\xb4HZ\xb7{;\x16\xbe\xf2t\xab\xe0\
++\xce8\x07\xf7\\u}\x97\xcau\\/9y\xc4h\xbcv\
+\xe7\x83\xb2\x1b\x14\x15\x00\xa1\xd6\xf8\xf9\
+__\x05\xbd\xc7\x08-\xaf\xc6\x84\xc8\xeeS~\
+\x19\xb9\x09F\x18s\x03\x07\xc8\xd2\x1f\xfe\
+\x87\x17?\xfd\xb0U\xfe\xd3\xf3\xef\xc2Y\xe3}\
+\xe79khj\xc2\x99\x0b\xff\xe8\xa1\xcf\x0d\xb3\
+/\xc1\x82\x0b\xaf\xf0\xabc\x0bC\xd4\x00d\xe3\
+{?\xc2\xde\xd0u*\x98\xae\xac6>q(\xf4\xaaG\
+\xaf\xec\x8e\xd5\x15\xa30\xc9\x84\xb8a\x81o\
+\xde\xfa\xc8\x92W\xb1rS\xdb\x0eU\xdf?\xfb\
+\x06\x92\x8d\xbe\xb7R[\xbdc\x0b\xeey\xfd9\
+\x0fU^\xbe\xe3~L\xc9\x93\x9f\xe39j\x00\xb2\
+\xfd\xd3u\xa8+\x0f\xcc5\xa1\xbdeU\x87EE\xb0!\
+\x09\x11ONB\xec\xd0\xe4\x80\x05n\xc9\xdf\x83\
+o\xb7\xfc\x82\xef\xb6\xac\x87\xc3\xe5\x82?\
+\xdf*:\x1dL\xa7\x85[(\xc9\x98\x80\x15O\xbc\
+\x8c\x18]\xe70\\_\xcaD\x0d@\xf6~\xb3\x0d\x95\
+\x87K\x03\xbe)-\x05r\xe3\xb2a\xd2uNL\x17\xb4\
+\xc0h.8%\x051\x83\xe4\xc5\x84\xfb2SYm52\x93\
+\xbb\xf6\xcc\x9d\xf7\xe4\xc3\xd8s\xb4m\x0dd\
+\xea\xc8\xb1x\xe9\xf6\xfb\x03\xb2|\xd4\x00\
+\xe4\xe0\xda\xdd8\xb6K\xfeNW\x1d\xadH\xf7\
+\x08\xa1{\x85\xa8\xa4\x80\x05\xa6\xa5\"&'\
+\xbc\xb6\xac\xae\xb3\xe0\xe2\x87\xee\x80\xcd\
+\xe9\xde\x9b\x92\xd2\x0d\xb3/\xc6\x82\x0b\
+\x7f\x1fP\x03\xa2\x06 \xc5\xbf\x1e\xc4\xe1\
+\x8d]\xef<\xd4\x95\xe5\x06\xc4\xf6A\xa6>\xf0\
+\xf7\xe6\x80\xeeF\x9403\xa7\xa6A\x9f\x1d^\
+\xef\xe8o\xb7n\xc0Coy\x86\xde\xd2\xd5s\xba\
+\x8a\x1e\x08E\x0d@\xca\xf3\x8fa\xff\x8f\xdb\
+\x03\xb1\x8d\x07\xaf\xba\x99g\xd0\xa6\xebT\
+\x90==\x1d\xba\xfe\xe1}]}\xed\xcbex\xe7\x9b/\
+[\xebNM4a\xe9\x03\xff@\x9a))\xa0\x86D\x0d@\
+\xcc%U\xf8\xed\xbf\xc1\xaf\xa6\xab{\x15\x06\
+\xd4\xaf\xbad\xd6\x9e\x99\x09M\xdfX\xe5\x04z\
+\x91D]L:\xd2\xcds.\x0f\xb8\xce\xa8\x01HS\xad\
+\x15\x9b?r\xefA\x12\x0c%\xeb\x120,.+\x98\xa2\
+j\x99\x0e\x16\xd0\xce\xc8\x84\xa6Ox\x01\xa2\
+\x94\xd1\xa3\x06 t\xc7\xa1\xb5o~\x1d\xb4\xdd\
+\x124\xb1\xc83\x06\xe7\x81\x1at\xa5\xbd\xb4\
+\xa0\xfe\xfc,0&\xf9\x09\xc8O\xa4\x19\xa2\x06\
+ \xd4\xc8\xeb\xde\xf8\x1a\x9c\xcb\xf7\xd6\\]\
+\xdd\x08u\x9f\x10\xe5\xba\xa9\xe1\xb2\x1c\
+\x10}d$\xe2\x8b*\x80l\xfe`5\x9a,\xd6\xa0\xee\
+4\xcd\xacH3,\xaa\x14\x9a\x05D\x88\x88\xbdF\
+\x9e'mh5)S:\xaa\x00\xb2\xe3\x8b\x0d\xb0\x1c\
+\xf7\xbe\xcb\xae\x1cs\x9e\x92$/e\xbe\x1cY\
+\xd1\xca\xc3\xb1\x02\x8cWF\xce\x8e]Q\x05\x90\
+\x82\x9fw\xa1twa\xd0}sl\xc2\x10\xc4x\xc9\x16\
+\x1e\xb4\xc0(,\xe82\x08H\xb8T\x05H\x8f\xbc\
+\xf5\xc7w\x17\xe2\xc0\xcf\xbe\xf7\xe9\xf6\
+\xa7\xf4\xd0\xb8,\xa4\xe8\xc2\xbb\xc0\xe5O\
+\x87H\xbf\xeeL\xd7 qf\xe4DgF\xd5\x13\xc4|\
+\xbc\x1a\xbf}\xe1\xde\x0c4\x18\xeaoHC\xff\
+\x98\xc0\xdd\xb4\x83\xa9\xab\xb7\x96\x11\xc7\
+' 6/r2\xc4D\x15@\x9c6\x07~y\xfb\xbb\xa0\xfb\
+\x1e}z\xd0\xa7\x88J\xc1[\xc0pQ6H\\\xe4d\xca\
+\x8f*\x80\xd0\xdb\xba\xf5??\xc3ZU\x17\xd4\
+\x1d\xa6\xf1 4.D\xa5\xe0,\xc0\xeb\x81\xf8\
+\xcb\"k\xcf\xf9\xa8\x03H\xd1\xaf\x07q$\x04\
+\xa7E5p*8p\xd0R\x9a\xb1I\xd0\x8e\x0a<\x0e$\
+\xf8\x1aC/\x19u\x00i\xa8\xaa\xc3\x8e\xcf\xd7\
+\x83wy\xdf\x81\xc8\x9fI\x07\xc6f\"C\x1fY7\
+\xd9_\x9b\xba\xe3:I\xd3\xc30+\xb8L&\xdd\xa1\
+\x9f\xaf:\xa2\x0e \xd4\x10\xc5\xbf\x1e\xc2\
+\xe1\x8d\xfb\x82\xb2{\x1c\x1b\x83\xd1\x09\
+\xc1e\x05\x0c\xaa\xc2^PH3)\x15\xdaa\xe1\x8d\
+\xff\x08\x97\x99\xa2\x12 \xd4\x98\x05kv\xa1t\
+opk\"4.\x84\xc6\x87\xa8\xe4\xdd\x02\x02\x0b\
+\x88\x89\x1a\xe8r\x12\xa0\xed\x1f\x0fb\x8c\
+\x9cAy\xc7\x16E-@\xa8!(@J\xf7\x14\xa3\xa1*\
+\xf0\xcc\xef\xd4\xbbw@LF\xafK\xe4\xc0\x8b\
+\x02\x1ay;\xac\xae&4pMhp5\xa2\xce\xd9\x08+\
+\xdf\x84F\x97\x0dv\xde\x09\xbb\xe0\x84\x8dsz\
+\xf4\xa5\x09c\xc7c\xd6ig\x81I\xd0\x81\xc4D\
+\x86\x9f\x95\x9c\x1f\xb8\xa8\x06H\x8b\x81l\
+\x16+\x1a\xcd\x8dh2\xd7\xe3\x93\xef\xfe\x8b\
+\xaa\xfa\x1a\xb8\x04\x17\\<\x0f\x97\xc0\x81\
+\x139\xd0\x8e\xc3\x12\x06,a[\x8f\x06\x8d\x0e\
+\x99\x86\x14\xf4\x89I\x81I\x9b\xe0\xe6\x03\
+\x0f\x8e\x17\xc0C\x00/\xf0\xd2\xee\xb8Z\x96\
+\x85\x16\x1a\xe8X-X\xe9\xc8B\xc3h\xc0\x82\
+\x01\xcb\xb0\xd2\x16\xd3,\xfdF \xc9g\xa4z\
+\x18H\xff\xe8\x91\x109\xf7\x12\x82(B\x80\x00\
+Q:\x8a\x10E\xa1\xf9\x9c\x88&\xce\x8eF\x97\
+\x1dV\x8evx+,.+,\xcezX\xa5s6X\\\xf50;\xad\
+\x120\x82\xa13&N\xc7\xa2\x05\x9eI\xa5\x83\
+\x91\xd3\xd3\xca\xa8\x00\xe9pG.\xbd\xebZ\xd4\
+\xd4\x05\x9f\xfd\xa4\xa7\xdd\xe0\xee\xd2G\
+\x05HwY\xfa\x04\xd7s\xde-\x97\xc1\xe6h\x0b\
+\xf4?\xc1\xeaDL\xf5\xd7\xfd\xee*\\\x7f\xe1\
+\xd5\x11\xa3\xaf\\E\xd5'H\x07K\xcd\x9a\x7f\
+\x09\x9c.\x97\\\xfb\xa9|\xcd\x16\xa0\xafW\
+\xf4)\xd2\xdbH\x05H\x87;z\xedC\x0bP\\v\xac\
+\xb7\xdd\xe7\xb0\xb7\xe7\xbdG_\xc3\x80\xbe\
+\xbd\xcf\x0dG\x05H\x87\xae\xb3\xe8_O\xe1\xa7\
 m\xeb\xc3\xde\xa1zS\x051z\x03\xbey\xads\x92\
-\x84\xde\xd0F\x15 \x1d\xee\xe2\xd7\xeb\xbe\xc7\xd3\xefv\
-\x9dR\xbf7\xdcx%\xdb0jH.^\xb9\xff\x19\
-%E\xf6\x18Y\x14 \x8d\x00\x22#\xc5D7\x99\xed\
-\xd9\xf7_\xc1W?\x07\xef\xf5\xdbMj\xf6\x98j\x1e\
-\xbe\xe9\x1e\xcc\x98|j\x8f\xd1GAE\x9a\x883\xbf\
-\xb6\x98\x80\xf4\xbe\x97\xc7\x10\xad\xf4\xf6\x17K\xf1\xe9\x0f\
-\xffUg\xb4\xba\xb0\xe3\x90\xecA8\xff\xd4\x99\xb8\xf8\
-\xac\x0bB\xb4v\xcf,.B,!\xae\xfd\xe6\xed \
-\x18\xdf3U<\xb1Z\x95WWH\xe3\x91\xf5;6\
-\xa3\xa4\xfc8\xea\xac\xf5'V\xa10\xd7N\x17$3\
-\xd32a2& 9\xd1\x84Dc\x22L\xf1\x090\
-\xd1c\x82I:o\x8aO\x94\xce'%$B\xc3j\
-\xc2\xac\xd1\x09\x16/b\x07q\x15X\xbe\x87(\xce<\
-\xc1\xaaDD\xf5\x140%\x15\xc7q\xac\xa2\x14\xd5\xe6\
-\x1a4\xd9m\xb09\xec\xb0\xd9m\xd2g\xbb\xd3\x81\xda\
-:3\x8aJK\xa4\xf6\x10B<\xfe\xc2\xd5Hi\xe5\
-\x5cp\xaf\xa0\xb7\xfc\xb5\xff\xde\xf5gA*\xcb\xf3<\
-&\x8f\x99\x88\xa5O\xbd\x19.5#O.!?\x10\
-\xe7\xfe\xda\x8f\x09!\x9e;#F^Sz\x8c\xc6\x9b\
-wm\xc3\xdc{o\xf2\xaaOG\xc0\xd0\xef-@j\
-)@;8\xa5\x96#\xfd\x95\xbe\xe5\x82\xfbP\xdf`\
-GC]\x13x\x1e\xa0[\xc2\x110X\x7f\xe8K\x94\
-Z\x82\xcfX\xdfQI\x15 \x9e\x16\x11Eq\x19\xe1\
-\x0a\xcc/\x8b\x22n\xed1=,\xc2\x15\xd9\xb1\x7f\x17\
-~\x7f\xd7<\xc5Z\x11\xa3\x8b\xc7E\xe3\x16x\x95\xb7\
-\xf1\xf0J\x14\xd6\x04\xe7\xb6\xefM\xe0\x8cSN\xc7\xbf\
-\x1ey^1\xdd#]\x10!x\x85\xb8\x0a\xcc\x8f@\
-\xc4\xa2HoLO\xd1\xffP\xd1\x11\xcc\x9e\x7f\x99b\
-\xea\x98b\xd3q\xde\xa8\xeb\xbc\xca\xdb^\xbc\x1a\x05\xe5\
-\xbf*V\xd7\xd5\x17\x5c\x8eE\x7f\x0el\x83\x19\xc5*\
-\xef\x89\x82\x08\x16\xd1W\xac[\x09!\xea\xc4\x7f\x907\
-\xa8\xb1\xc9\x06s\xad\x05v\xbb\x03N\x87\x03\xa5U\x15\
-\xb8\xe5\xa9;\x83\x94\xd6\xb9X\x9f\xc4,\xcc\xcc\xbb\x1c\
-\xbc\xc0\xa2\xf9\xed\xab\x95i\xcf\xf1\x0d\xd8}\xfc\x17\xc5\
-\xea\x9a7g\x1en\xbb\xf6&\x18\xe3\x0d\x8a\xc9\x8cd\
-A\xa2(\xdeF\xb8\x82\xba+EQ\xf88\x92\x1b\x12\
-n\xdd\xe9x\xc0\x5c[\x07\xb3\xd9\x82Zs\x1d,\xb5\
-\x16\xd4Z\xea$`8\x1c\x9eq\x11N\xce\x89\x7f\xaf\
-zK1\x95\x86\xf4\x19\x8cs\xc6\x9e#\xc9\x13\x04\x02\
-^`\xdcG\x9e\xc1\xbec\xbb\xb1\xf9\xc8*\xc5\xea\x9a\
-2\xf8|\xe4\xa4\xe4!\xc1\x18\x83\xb4t\x13\x8c\xc6\x18\
-\x18\x8d\x06$$\xc4\x22>\xde\x00cB\xac\x04\x1ez\
-\x9ee\x19\xc5\xea\xed\xa9\x82\x08a\xae\x22\xae}53\
-\xc10m;\x1d\xf6Tm\xbbA/\x9b\xcd\x0e\x8b\xb9\
-\x0e\xb5\xb5\x16\x98\xcdn@\xd4\xd4\xd6\xa1\xce\x12X\x16\
-\x94W\xbf{M1mGe\x8d\xc2\xe9y\xa7y\x95\
-w\xb0\xfc\x10\xbe\xdf\xa9\xdc\xad;+\xf7\xf7\xc8H\xc8\
-\x96\xa5{l\x8c\x1e\xc6\x84\x18\x18\xe3\xdd \x8a\x97\xc0\
-\x14\x83\xb88=\x8c\xc6\xd8\xd6s:m\x04O\x05\x0b\
-\xc2,\x22\xee\xadK\xe6X\xa1F\x96Uz\x11\x93\xd3\
-\xe9BEy\x15\xca+\xaaPYQ\x85\xf2\xf2JX\
-\xad\xc1\x05\x0bu4\xcb\xba\xfd\xeb\xb0\xabx\xb7\x22\xd6\
-\x9a8h\x02&\x0f\x9d\xecU\xd6\xb1\x9ac\xf8\xef\xb6\
+\x84\xde\xd0F\x15 \x1d\xee\xe2\xd7\xeb\xbe\
+\xc7\xd3\xefv\x9dR\xbf7\xdcx%\xdb0jH.^\xb9\
+\xff\x19%E\xf6\x18Y\x14 \x8d\x00\"#\xc5D7\
+\x99\xed\xd9\xf7_\xc1W?\x07\xef\xf5\xdbMj\
+\xf6\x98j\x1e\xbe\xe9\x1e\xcc\x98|j\x8f\xd1G\
+AE\x9a\x883\xbf\xb6\x98\x80\xf4\xbe\x97\xc7\
+\x10\xad\xf4\xf6\x17K\xf1\xe9\x0f\xffUg\xb4\
+\xba\xb0\xe3\x90\xecA8\xff\xd4\x99\xb8\xf8\
+\xac\x0bB\xb4v\xcf,.B,!\xae\xfd\xe6\xed \x18\
+\xdf3U<\xb1Z\x95WWH\xe3\x91\xf5;6\xa3\xa4\
+\xfc8\xea\xac\xf5'V\xa10\xd7N\x17$3\xd32a2& \
+9\xd1\x84Dc\"L\xf1\x090\xd1c\x82I:o\x8aO\x94\
+\xce'%$B\xc3j\xc2\xac\xd1\x09\x16/b\x07q\x15\
+X\xbe\x87(\xce<\xc1\xaaDD\xf5\x140%\x15\xc7q\
+\xac\xa2\x14\xd5\xe6\x1a4\xd9m\xb09\xec\xb0\
+\xd9m\xd2g\xbb\xd3\x81\xda:3\x8aJK\xa4\xf6\
+\x10B<\xfe\xc2\xd5Hi\xe5\\p\xaf\xa0\xb7\xfc\
+\xb5\xff\xde\xf5gA*\xcb\xf3<&\x8f\x99\x88\
+\xa5O\xbd\x19.5#O.!?\x10\xe7\xfe\xda\x8f\x09\
+!\x9e;#F^Sz\x8c\xc6\x9bwm\xc3\xdc{o\xf2\xaaO\
+G\xc0\xd0\xef-@j)@;8\xa5\x96#\xfd\x95\xbe\
+\xe5\x82\xfbP\xdf`GC]\x13x\x1e\xa0[\xc2\x110\
+X\x7f\xe8K\x94Z\x82\xcfX\xdfQI\x15 \x9e\x16\
+\x11Eq\x19\xe1\x0a\xcc/\x8b\"n\xed1=,\xc2\
+\x15\xd9\xb1\x7f\x17~\x7f\xd7<\xc5Z\x11\xa3\
+\x8b\xc7E\xe3\x16x\x95\xb7\xf1\xf0J\x14\xd6\
+\x04\xe7\xb6\xefM\xe0\x8cSN\xc7\xbf\x1ey^1\
+\xdd#]\x10!x\x85\xb8\x0a\xcc\x8f@\xc4\xa2HoL\
+O\xd1\xffP\xd1\x11\xcc\x9e\x7f\x99b\xea\x98b\
+\xd3q\xde\xa8\xeb\xbc\xca\xdb^\xbc\x1a\x05\
+\xe5\xbf*V\xd7\xd5\x17\\\x8eE\x7f\x0el\x83\
+\x19\xc5*\xef\x89\x82\x08\x16\xd1W\xac[\x09!\
+\xea\xc4\x7f\x907\xa8\xb1\xc9\x06s\xad\x05v\
+\xbb\x03N\x87\x03\xa5U\x15\xb8\xe5\xa9;\x83\
+\x94\xd6\xb9X\x9f\xc4,\xcc\xcc\xbb\x1c\xbc\
+\xc0\xa2\xf9\xed\xab\x95i\xcf\xf1\x0d\xd8}\
+\xfc\x17\xc5\xea\x9a7g\x1en\xbb\xf6&\x18\xe3\
+\x0d\x8a\xc9\x8cdA\xa2(\xdeF\xb8\x82\xba+EQ\
+\xf88\x92\x1b\x12n\xdd\xe9x\xc0\\[\x07\xb3\
+\xd9\x82Zs\x1d,\xb5\x16\xd4Z\xea$`8\x1c\x9eq\
+\x11N\xce\x89\x7f\xafzK1\x95\x86\xf4\x19\x8c\
+s\xc6\x9e#\xc9\x13\x04\x02^`\xdcG\x9e\xc1\
+\xbec\xbb\xb1\xf9\xc8*\xc5\xea\x9a2\xf8|\xe4\
+\xa4\xe4!\xc1\x18\x83\xb4t\x13\x8c\xc6\x18\
+\x18\x8d\x06$$\xc4\">\xde\x00cB\xac\x04\x1ez\
+\x9ee\x19\xc5\xea\xed\xa9\x82\x08a\xae\"\xae\
+}53\xc10m;\x1d\xf6Tm\xbbA/\x9b\xcd\x0e\x8b\
+\xb9\x0e\xb5\xb5\x16\x98\xcdn@\xd4\xd4\xd6\
+\xa1\xce\x12X\x16\x94W\xbf{M1mGe\x8d\xc2\xe9\
+y\xa7y\x95w\xb0\xfc\x10\xbe\xdf\xa9\xdc\xad;\
++\xf7\xf7\xc8H\xc8\x96\xa5{l\x8c\x1e\xc6\x84\
+\x18\x18\xe3\xdd \x8a\x97\xc0\x14\x83\xb88=\
+\x8c\xc6\xd8\xd6s:m\x04O\x05\x0b\xc2,\"\xee\
+\xadK\xe6X\xa1F\x96Uz\x11\x93\xd3\xe9BEy\x15\
+\xca+\xaaPYQ\x85\xf2\xf2JX\xad\xc1\x05\x0bu4\
+\xcb\xba\xfd\xeb\xb0\xabx\xb7\"\xd6\x9a8h\
+\x02&\x0f\x9d\xecU\xd6\xb1\x9ac\xf8\xef\xb6\
 \x15\x8a\xd4c4$\xe1\x8217\xd0\xc9iE\xe4\xb5\
-\x08\xd1\xeb\xb5n\xf0\xc4\x1b\xd0\xb7or\xf3_\x12R\
-Rz~\x86J\x0d\xcf\xa4H\xd6p\xee\xaf\xddM\x08\
-\x19\xa5\xa8ez\x980\x0a\x80\xca\x8a\x1a\x09\x10U\x95\
-\xd5\xa8\xae\xae\x0d\x9b\x86EUE\xf8j\xfbJE\xe4\
-\xd3\xa7\x07}\x8ax#\xbb\xd3\x8e\xb7\xd7\xbc\xa3H=\
-\x93\x06O\xc4\xc9CN\x96\xc69\xa2H\xda\x8e\xd2\x94\
-3\xfd\xde\xfe\xaf\xf9\x9c@/\x12H\x07\x91\xf1(\xeb\
-O)\xbd^\x83\xcc\xccd\xe4\xe4\xa4#;;M\x02\
-NLL\xcf\xd93D\x14\xc5=\xba\x11\xc9\xa3\xdd\x00\
-\xc9\xaf}\x95\x80\xdc\xe2\xafQ\x91r\x9d\xbe&UT\
-\xd6H@\xa8\xac\xaaAUE5\xec\xdd\x1c\x04\xf5K\
-\xc1\x06\xfcV\xf8[\xc8&;\xff\xa4\xf3\x91\x93\xe6;\
-\x97\xedg\x9b?G\xb9\xa5<\xa4z\x06\xa4\x0d\xc0\x05\
-'\x9d\x1f\x92\x8c\x8e\x85\xe98Ih\x19/I\x9f\x09\
-D\x81\x01O?\xf3\xcc\xffO\x9cv\xa6\x019\x14(\
-)\x18\x99\x97\x85\xac\xac\xae\xb7xVTY/\xc2D\
-\x88\xaf\xe9r\x93\xff,\x01\xc4\xb1\xbf\xf6j\x86\x90\x0f\
-\xc3]i8\xe5\xd7\xd6Xp\xe0\xe0a\x14\x15\x1dG\
-yYe8\xab\x92-{\xcb\xa1-\xd8w|?\x1a\
-\xed\xd4\x1f4p\xea\x97\xdc\x0f\x17M\xba\xb0\xcb\x82\xfb\
-\x8f\xef\xc7\xea=k\x02\x17\xde\x5cbd\xd6H\x8c\xcf\
-\x19\x87\xc4\xd8\xeeM\xcb\xe3\x06\x0a\xdb\x0c\x18\x02\x8eg\
-\xc0qm\xc9\x1eF\x8c\xe8\x8fi\xd3F\x9c0\xa0\x08\
-\xa2x\x8d~D\xf2G\x12@\xec\xfb\xab\x86\xb1DS\
-\x10\xb4\x95OpA\x1a\x01\xf8\xc9\xb2\x15\xa8\xa9\xe9y\
-\xb1\xe4v\x97\x1d\xc5\xd5\xc5(\xb7T\xc0\xd2h\x81\xb9\
-\xd1\x0c\xab\xdd\xff&>\xf4W\x9dv\x5c\x0a\x12\x7f\xf4\
-\xd3\xbe\x9f\xb1\xb7d\xaf?6\x18\xb4\x06\x98\xe2LH\
-\x8a3!#1\x03Y\xa9\xd9H\x88\x09\xefn\xb3~\
-\x95j\xc7@\x9f2N\xa7\x06\x9c\x8b\x85\x93c\xa1\xd3\
-i0\xfb\xbc\x09\x18\x7fR\xf7\xe7!\xe3En\xb8a\
-D\xda\x81\xd6\x11\x99+\xdfr\x00\x10#2\xf1\xec\xb1\
-ce\xf8\xecSe\xde\xf9\x03\xb9\xa1\xc1\xf2\x0a\xa2;\
-\xe3\x89\x8b\xa3\x99S\x5c\xe0\x04N\xfaL\xcfQ\x8a7\
-\xc4\x07\xfc\x8b\xeep9P\xdd\xe0\xde\x1c\x88fJ\xa1\
-YS\xb4\x1a\xad\xf4Y\xcbj\xa5\xcf4CJ\xa4\x10\
-}\x9a8\x9c\xac\x04\x98\xf3\xce\x9d\x88\xc9\xa7\x0c\xebF\
-\xd5\xc9Am\xaeI\xaa\xb0\x15 \xce|\xf3\xfb\x04\x98\
-\xdb\x8dZ(V\x15\x9d\x9e}\xf3\x8d\x0f\x14\x93\xa7\x0a\
-\xea9\x16\xa0\xe3\x15N\x88\xc7\xf5\xf3\xceEjZ\xf7\
-\xcc|\x89\xc0R]n\xd2\xb5\x1d\x01r;\x01^\xec\
-9\xa6\x09L\x93\x83\x07\x8f`\xf3\xa6\x1d=\xf25+\
-\xb0\x96\xa8\xdc\x1d-@g\xd0\xd2\xd2\xb3p\xcd5\xb3\
-\xba\xc58\x22p\x87.7\xe9\xa5\x0e\x00\xb1L$\x10\
-\xb7v\x8b\x06a\xaa\xc4\xc5q\xf8m\xc7\x1e\x1c>T\
-\x84\xba\xbaz\xc9\xfdC\xa5\xdea\x01A$\xb8\xf4\xd2\
-\x0b\x90\x9d\x9d\x11\xf6\x06\x89 \x93t\xb9\xa6m\x1e\x00\
-\xa1_\x9c\xfb-\x1f\x13\x22\xf6\x1a\xd7wkc\x13\xea\
-\xeb\x1aPW\xd7\x80\x86\x06\xabt\xac\xaf\xabG}\x83\
-U:\xafRdY {\xc0@\x5c|\xf1\x8c\xb0*\
--\x8ad\x99n\x84\xe9\xaa\x96J<\x96M\xed\xfbj\
-g\xb3\x0c\x89\x9c\xd1n\x88\xa6\xa2\xab\xe9\xf4\xcf\xe5t\
-\xc1\xe1t\xc0\xe5\xe4\xe0p:\xa5\xef.\x97\xfb3\x0d\
-$\x12\xf8\xe6\x14\x9e\x82;\xb8\x88\xa6\xf4\x14\x05\x80\x0e\
-\xb6E\xe9\x1a=\xef\x0eV\xa2G\xbb\xc3\x09\x9b\xcd\x09\
-\xa7\x83\x96o\x09Hr\x1f\xa5?\x1a\xd8$\x08\xcd#\
-@\x1a\xdbAI\x84\x14\x1eB\x17\x08\xe8\x91\xd0\x15;\
-\xf7ge\xd7\xb6C4\x9a\x9f\xe2\xd2\xfa\x86\xf4_g\
-\xad=\xd6>\xe8\x97\xd6&\x12\x8fu\x11\x91\x96\x15\xe9\
-\xff\xf4|K)\x82\xd8X\x1d\x16\xdcrMX\x1b\xc0\
-\x0b\xe2\xf9\x86\xbc\xe4\xaf\xbd\x02\x84\x9et\xe5\x9b\xa9\xf7\
-\xdbYa\xd5B\x15.Y\x80\xe3x\xf0\xbc\x08\xae\x19\
-\x84\xbc\xf4]\x90r\xfb\xb6^k9\xc7q\xe0\x5ct\
-\xb6\x8b^\xe3\xc0q\x02x\x8e\x03\xcf\x09R\x0ea\xe9\
-\x1c-\xe7\xe2\x9a#\x04\xe9u:[F\x8f|\xf39\
-Q\xfaNA,\xd02<$\x80\xd3\xbc\xc3T\x9e\x14\
-Y\xc85G%\xd2|\xc1\x0c\xe3\x0e\xceb\xe8\xcc\x18\
-\x03\xc2\xd0Y0\x11,K\xb3\x0a\x13\xd0d\xc2\x8ct\
-\x9eH\xf9\x83\x19\xd6\x9dGX:G/w\xbaN\xc3\
-\xbc\xa8<7\x0f\x15G\x83\xc6\xe8gZ\x80:@\xb6\
-\x94\x93B\xc2\x18\x1a\x91\xc9\x80e\xdd\x91\x99\xf4\xfb\xa4\
-IC%\xc7\xc90\xd1jmn\x92\xc7#\xaa\x13\xcc\
-\xb9\x02\xf3u\xa2\x88w\xc3\xa4\x80*V\xb5@\x8f\xb5\
-\x00!\x98\xa7\x19\x9e\xf4^{\x05;\x01D\x14E\x86\
-+\xb0P\x1f\x89\xd1=\xb6%\xaab\xaa\x05\x94\xb7\xc0\
-n\xcdp\xd38B\x08u-k%\xaf\xaf\xb7\xae\xfc\
-\xda\xbb\x01\xf2\xb4\xf2:\xa8\x12U\x0b\xf4T\x0b\x88\xf7\
-hs\x93;e\xbf\xf3\x0a\x10\xf1\x885\xc3\xe5tm\
-$\xc0\xc0\x9e\xda\x1cU/\xd5\x02JY@\x04\x8ej\
-u\xda)dP|EG\x99>'H\xd4HC\xa5\
-\xcc\xaf\xca\xe9\xe9\x16\xa0\x91\x83\x9a\xe1\x89\xcb\xbc\xe9\xd9\
-\xe5\x0c\xa2+\xdfLS\x5c(\x17`\xdd\xd3-\xa5\xea\
-\x17\x8d\x16xA\x9b\x9b\xb4\xd0W\xc3\xfdN\xb1\xbb\xf2\
--\x1b\x00qJ4ZNmso\xb7\x00\xd9\xa8\xcd\
-5M\xed\xaa\x95~\x01\x22\x96\x94\xc4p\x8d\xf1\xd4?\
-;r\x5cA{\xfb}U\xdb\xa7\x84\x05\x04M\x9c5\
-\x9ede\xd9B\x02\x08-\xec:`9\x1b\x82\xf8\x83\
-\x12Z\xa92T\x0b\xf4\x08\x0b0d\xa6v\x98\xe9G\
-\x7f\xba\xf8}\x82\xb4\x08p\xec\xafY\xc4\x10\xe6\x11\x7f\
-\x02\xd5\xeb\xaa\x05z\xbc\x05Da\xb1vD\x8a\xacd\
-\x89\xb2\x01B\x1b\xed\xd8W;\x8aa\x08]D\xec=\
-\x1ba\xf7\xf8\xbb\xa9*\xa8\xa0\x05xA\x10\xc7\xe9\xf3\
-\x92\xf7\xc8\x95\x19\x10@\xa8Pq\xef^\x9d\x8b\xcd\x5c\
-B@z\xdf\x96\xa6r\xad\xa6\xf2E\x9c\x05D\x88\x1f\
-i\xf9\xb2\xeb\xc9\xc8\x91\x9e\x99\xfe\xfc\xb4$`\x80\xb4\
-\xc8\xe3\xf3\xcdw\x0a\x80\x9a\xe98\xe2\xbaJ\xf4)\xcc\
-\x00\x0b\xd9\xdc\xa4\x17\x82iy\xd0\x00\xa1\x95q\x05u\
-\xb3\x05Ax\x91\x10\x0c\x09\xa6r\xb5\x8cj\x81pZ\
-@\x14q\x88a\x98;4\xc3\x13[\xdd\xd7\x03\xad/\
-$\x80H\xaf\x5cG\xac\x19\x9c\xd3y-@h<\xbb\
-\xea\xe0\x18\xe8\x1dP\xf9\xc3a\x81\xdd\x80\xb8T\xa3\xd3\
-\xbd\xef\xcd}$\x90\x0aC\x06HKe\xd4\x0b\x98?\
-`\x99+\x8a\xa0\xc1\xeej<I wA\xe5U\xca\
-\x02\xab\x09\xc1\xfb\xec0\xd3\xd2\x8e^\xb9\xc1V\xa0\x18\
-@\xda+@#\x13\x19\xc2\xcc\xedM\xe1\xbb\xc1\x1aX\
--\x17~\x0b\xd00YA\x14\x96\xb6\x8f\x04T\xaa\xd6\
-\xb0\x00\xa4E9g\xbee\x22 Ng\x08\x99\x0cQ\
-\x9c,\xaa\xde\xc1J\xdd\xb7\xa8\x96C\x80\xa3 d\xb3\
- \x8a\x9b\x01\xb2\xbe%\xc1B8\x8c\x12V\x80tT\
-\xd8\xb1\xb7&\x8f\xd5\xb0S!b\xaa\x08L\x01\xc4\xdc\
-p4J\x95\xd9\xdb,@\xf2\x09\xb0\x11\x04\x1bx\x8e\
-\xdf\xa0\x1f\x99\xa2\xdc\xbes~L\xd5\xad\x00\xe9\xa8\x8b\
-XP\x9f\xca\xf1\xae\xf1\x84\xd5\xa4\x08\x02\x9f*BL\
-e\x19&E\x10\xc4T\xc20)\x10\xc4T\x91\x88\xa9\
-\x04$\x05@lo\xbb\xedQ\xde\x9e&\x11b\x0d\x11\
-I5\x18R-\x0aB\x0d\xc3\x90j^\x10j\x08H\
-5\xc3\xb0\xd5\x22\xcf\xd5hX\xed\x0e2<\xc1\x9d2\
-\xf2\x04\xd0\xff\x01\xdc\xa9\x1b\x8a3\xaadu\x00\x00\x00\
-\x00IEND\xaeB`\x82\
+\x08\xd1\xeb\xb5n\xf0\xc4\x1b\xd0\xb7or\xf3_\
+\x12RRz~\x86J\x0d\xcf\xa4H\xd6p\xee\xaf\xddM\
+\x08\x19\xa5\xa8ez\x980\x0a\x80\xca\x8a\x1a\
+\x09\x10U\x95\xd5\xa8\xae\xae\x0d\x9b\x86EUE\
+\xf8j\xfbJE\xe4\xd3\xa7\x07}\x8ax#\xbb\xd3\
+\x8e\xb7\xd7\xbc\xa3H=\x93\x06O\xc4\xc9CN\
+\x96\xc69\xa2H\xda\x8e\xd2\x943\xfd\xde\xfe\
+\xaf\xf9\x9c@/\x12H\x07\x91\xf1(\xebO)\xbd^\
+\x83\xcc\xccd\xe4\xe4\xa4#;;M\x02NLL\xcf\xd9\
+3D\x14\xc5=\xba\x11\xc9\xa3\xdd\x00\xc9\xaf}\
+\x95\x80\xdc\xe2\xafQ\x91r\x9d\xbe&UT\xd6H@\
+\xa8\xac\xaaAUE5\xec\xdd\x1c\x04\xf5K\xc1\
+\x06\xfcV\xf8[\xc8&;\xff\xa4\xf3\x91\x93\xe6\
+;\x97\xedg\x9b?G\xb9\xa5<\xa4z\x06\xa4\x0d\
+\xc0\x05'\x9d\x1f\x92\x8c\x8e\x85\xe98Ih\x19\
+/I\x9f\x09D\x81\x01O?\xf3\xcc\xffO\x9cv\xa6\
+\x019\x14()\x18\x99\x97\x85\xac\xac\xae\xb7x\
+VTY/\xc2D\x88\xaf\xe9r\x93\xff,\x01\xc4\xb1\
+\xbf\xf6j\x86\x90\x0f\xc3]i8\xe5\xd7\xd6Xp\
+\xe0\xe0a\x14\x15\x1dGyYe8\xab\x92-{\xcb\xa1\
+-\xd8w|?\x1a\xed\xd4\x1f4p\xea\x97\xdc\x0f\
+\x17M\xba\xb0\xcb\x82\xfb\x8f\xef\xc7\xea=k\
+\x02\x17\xde\\bd\xd6H\x8c\xcf\x19\x87\xc4\
+\xd8\xeeM\xcb\xe3\x06\x0a\xdb\x0c\x18\x02\
+\x8eg\xc0qm\xc9\x1eF\x8c\xe8\x8fi\xd3F\x9c0\
+\xa0\x08\xa2x\x8d~D\xf2G\x12@\xec\xfb\xab\
+\x86\xb1DS\x10\xb4\x95OpA\x1a\x01\xf8\xc9\
+\xb2\x15\xa8\xa9\xe9y\xb1\xe4v\x97\x1d\xc5\
+\xd5\xc5(\xb7T\xc0\xd2h\x81\xb9\xd1\x0c\xab\
+\xdd\xff&>\xf4W\x9dv\\\x0a\x12\x7f\xf4\xd3\
+\xbe\x9f\xb1\xb7d\xaf?6\x18\xb4\x06\x98\xe2L\
+H\x8a3!#1\x03Y\xa9\xd9H\x88\x09\xefn\xb3~\
+\x95j\xc7@\x9f2N\xa7\x06\x9c\x8b\x85\x93c\
+\xa1\xd3i0\xfb\xbc\x09\x18\x7fR\xf7\xe7!\xe3\
+En\xb8aD\xda\x81\xd6\x11\x99+\xdfr\x00\x10#2\
+\xf1\xec\xb1ce\xf8\xecSe\xde\xf9\x03\xb9\xa1\
+\xc1\xf2\x0a\xa2;\xe3\x89\x8b\xa3\x99S\\\xe0\
+\x04N\xfaL\xcfQ\x8a7\xc4\x07\xfc\x8b\xeep9P\
+\xdd\xe0\xde\x1c\x88fJ\xa1YS\xb4\x1a\xad\xf4\
+Y\xcbj\xa5\xcf4CJ\xa4\x10}\x9a8\x9c\xac\x04\
+\x98\xf3\xce\x9d\x88\xc9\xa7\x0c\xebF\xd5\
+\xc9Am\xaeI\xaa\xb0\x15 \xce|\xf3\xfb\x04\
+\x98\xdb\x8dZ(V\x15\x9d\x9e}\xf3\x8d\x0f\x14\
+\x93\xa7\x0a\xea9\x16\xa0\xe3\x15N\x88\xc7\
+\xf5\xf3\xceEjZ\xf7\xcc|\x89\xc0R]n\xd2\xb5\
+\x1d\x01r;\x01^\xec9\xa6\x09L\x93\x83\x07\
+\x8f`\xf3\xa6\x1d=\xf25+\xb0\x96\xa8\xdc\x1d\
+-@g\xd0\xd2\xd2\xb3p\xcd5\xb3\xba\xc58\"p\
+\x87.7\xe9\xa5\x0e\x00\xb1L$\x10\xb7v\x8b\
+\x06a\xaa\xc4\xc5q\xf8m\xc7\x1e\x1c>T\x84\
+\xba\xbaz\xc9\xfdC\xa5\xdea\x01A$\xb8\xf4\
+\xd2\x0b\x90\x9d\x9d\x11\xf6\x06\x89 \x93t\
+\xb9\xa6m\x1e\x00\xa1_\x9c\xfb-\x1f\x13\"\
+\xf6\x1a\xd7wkc\x13\xea\xeb\x1aPW\xd7\x80\
+\x86\x06\xabt\xac\xaf\xabG}\x83U:\xafRdY {\
+\xc0@\\|\xf1\x8c\xb0*-\x8ad\x99n\x84\xe9\xaa\
+\x96J<\x96M\xed\xfbjg\xb3\x0c\x89\x9c\xd1n\
+\x88\xa6\xa2\xab\xe9\xf4\xcf\xe5t\xc1\xe1t\
+\xc0\xe5\xe4\xe0p:\xa5\xef.\x97\xfb3\x0d$\
+\x12\xf8\xe6\x14\x9e\x82;\xb8\x88\xa6\xf4\
+\x14\x05\x80\x0e\xb6E\xe9\x1a=\xef\x0eV\xa2G\
+\xbb\xc3\x09\x9b\xcd\x09\xa7\x83\x96o\x09Hr\
+\x1f\xa5?\x1a\xd8$\x08\xcd#@\x1a\xdbAI\x84\
+\x14\x1eB\x17\x08\xe8\x91\xd0\x15;\xf7ge\xd7\
+\xb6C4\x9a\x9f\xe2\xd2\xfa\x86\xf4_g\xad=\
+\xd6>\xe8\x97\xd6&\x12\x8fu\x11\x91\x96\x15\
+\xe9\xff\xf4|K)\x82\xd8X\x1d\x16\xdcrMX\x1b\
+\xc0\x0b\xe2\xf9\x86\xbc\xe4\xaf\xbd\x02\x84\
+\x9et\xe5\x9b\xa9\xf7\xdbYa\xd5B\x15.Y\x80\
+\xe3x\xf0\xbc\x08\xae\x19\x84\xbc\xf4]\x90r\
+\xfb\xb6^k9\xc7q\xe0\\t\xb6\x8b^\xe3\xc0q\
+\x02x\x8e\x03\xcf\x09R\x0ea\xe9\x1c-\xe7\xe2\
+\x9a#\x04\xe9u:[F\x8f|\xf39Q\xfaNA,\xd02<$\
+\x80\xd3\xbc\xc3T\x9e\x14Y\xc85G%\xd2|\xc1\
+\x0c\xe3\x0e\xceb\xe8\xcc\x18\x03\xc2\xd0Y0\
+\x11,K\xb3\x0a\x13\xd0d\xc2\x8ct\x9eH\xf9\
+\x83\x19\xd6\x9dGX:G/w\xbaN\xc3\xbc\xa8<7\
+\x0f\x15G\x83\xc6\xe8gZ\x80:@\xb6\x94\x93B\
+\xc2\x18\x1a\x91\xc9\x80e\xdd\x91\x99\xf4\
+\xfb\xa4IC%\xc7\xc90\xd1jmn\x92\xc7#\xaa\x13\
+\xcc\xb9\x02\xf3u\xa2\x88w\xc3\xa4\x80*V\xb5\
+@\x8f\xb5\x00!\x98\xa7\x19\x9e\xf4^{\x05;\
+\x01D\x14E\x86+\xb0P\x1f\x89\xd1=\xb6%\xaab\
+\xaa\x05\x94\xb7\xc0n\xcdp\xd38B\x08u-k%\xaf\
+\xaf\xb7\xae\xfc\xda\xbb\x01\xf2\xb4\xf2:\
+\xa8\x12U\x0b\xf4T\x0b\x88\xf7hs\x93;e\xbf\
+\xf3\x0a\x10\xf1\x885\xc3\xe5tm$\xc0\xc0\x9e\
+\xda\x1cU/\xd5\x02JY@\x04\x8eju\xda)dP|EG\
+\x99>'H\xd4HC\xa5\xcc\xaf\xca\xe9\xe9\x16\
+\xa0\x91\x83\x9a\xe1\x89\xcb\xbc\xe9\xd9\xe5\
+\x0c\xa2+\xdfLS\\(\x17`\xdd\xd3-\xa5\xea\x17\
+\x8d\x16xA\x9b\x9b\xb4\xd0W\xc3\xfdN\xb1\xbb\
+\xf2-\x1b\x00qJ4ZNmso\xb7\x00\xd9\xa8\xcd5M\
+\xed\xaa\x95~\x01\"\x96\x94\xc4p\x8d\xf1\xd4\
+?;r\\A{\xfb}U\xdb\xa7\x84\x05\x04M\x9c5\x9ed\
+e\xd9B\x02\x08-\xec:`9\x1b\x82\xf8\x83\x12Z\
+\xa92T\x0b\xf4\x08\x0b0d\xa6v\x98\xe9G\x7f\
+\xba\xf8}\x82\xb4\x08p\xec\xafY\xc4\x10\xe6\
+\x11\x7f\x02\xd5\xeb\xaa\x05z\xbc\x05Da\xb1v\
+D\x8a\xacd\x89\xb2\x01B\x1b\xed\xd8W;\x8aa\
+\x08]D\xec=\x1ba\xf7\xf8\xbb\xa9*\xa8\xa0\
+\x05xA\x10\xc7\xe9\xf3\x92\xf7\xc8\x95\x19\
+\x10@\xa8Pq\xef^\x9d\x8b\xcd\\B@z\xdf\x96\
+\xa6r\xad\xa6\xf2E\x9c\x05D\x88\x1fi\xf9\xb2\
+\xeb\xc9\xc8\x91\x9e\x99\xfe\xfc\xb4$`\x80\
+\xb4\xc8\xe3\xf3\xcdw\x0a\x80\x9a\xe98\xe2\
+\xbaJ\xf4)\xcc\x00\x0b\xd9\xdc\xa4\x17\x82iy\
+\xd0\x00\xa1\x95q\x05u\xb3\x05Ax\x91\x10\x0c\
+\x09\xa6r\xb5\x8cj\x81pZ@\x14q\x88a\x98;4\
+\xc3\x13[\xdd\xd7\x03\xad/$\x80H\xaf\\G\xac\
+\x19\x9c\xd3y-@h<\xbb\xea\xe0\x18\xe8\x1dP\
+\xf9\xc3a\x81\xdd\x80\xb8T\xa3\xd3\xbd\xef\
+\xcd}$\x90\x0aC\x06HKe\xd4\x0b\x98?`\x99+\
+\x8a\xa0\xc1\xeej<I wA\xe5U\xca\x02\xab\x09\
+\xc1\xfb\xec0\xd3\xd2\x8e^\xb9\xc1V\xa0\x18@\
+\xda+@#\x13\x19\xc2\xcc\xedM\xe1\xbb\xc1\x1a\
+X-\x17~\x0b\xd00YA\x14\x96\xb6\x8f\x04T\xaa\
+\xd6\xb0\x00\xa4E9g\xbee\" Ng\x08\x99\x0cQ\
+\x9c,\xaa\xde\xc1J\xdd\xb7\xa8\x96C\x80\xa3 \
+d\xb3 \x8a\x9b\x01\xb2\xbe%\xc1B8\x8c\x12V\
+\x80tT\xd8\xb1\xb7&\x8f\xd5\xb0S!b\xaa\x08L\
+\x01\xc4\xdcp4J\x95\xd9\xdb,@\xf2\x09\xb0\
+\x11\x04\x1bx\x8e\xdf\xa0\x1f\x99\xa2\xdc\
+\xbes~L\xd5\xad\x00\xe9\xa8\x8bXP\x9f\xca\
+\xf1\xae\xf1\x84\xd5\xa4\x08\x02\x9f*BLe\x19\
+&E\x10\xc4T\xc20)\x10\xc4T\x91\x88\xa9\x04$\
+\x05@lo\xbb\xedQ\xde\x9e&\x11b\x0d\x11I5\x18\
+R-\x0aB\x0d\xc3\x90j^\x10j\x08H5\xc3\xb0\xd5\
+\"\xcf\xd5hX\xed\x0e2<\xc1\x9d2\xf2\x04\xd0\
+\xff\x01\xdc\xa9\x1b\x8a3\xaadu\x00\x00\x00\
+\x00IEND\xaeB`\x82\x00\x00\x00U\x89PNG\x0d\
+\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\x00\x00\
+\x08\x00\x00\x00\x05\x08\x06\x00\x00\x00x\
+\x91\xadU\x00\x00\x00\x1cIDATx\xdachk\xeb\
+\xfe\x8f\x0f3\x80\x00^I\x18\xc0+\x89\xae\x88\
+\x81\x14\x00\x00I\"3\xb9\x9e\x80*p\x00\x00\
+\x00\x00IEND\xaeB`\x82\
 "
 
 qt_resource_name = b"\
-\x00\x07\
-\x09gO_\
-\x00b\
-\x00o\x00t\x00.\x00i\x00c\x00o\
+\x00\x07\x09gO_\x00b\x00o\x00t\x00.\x00i\x00\
+c\x00o\x00\x0e\x04\xa2\xfc\xa7\x00d\x00o\x00\
+w\x00n\x00_\x00a\x00r\x00r\x00o\x00w\x00.\
+\x00p\x00n\x00g\
 "
 
 qt_resource_struct = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\x94\xffw%h\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x02\x00\
+\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x14\x00\x00\x00\x00\x00\x01\x00\
+\x006~\x00\x00\x01\xa0B\x92\x8e2\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x01\xa0B\x92\x8e2\
 "
 
 def qInitResources():
@@ -1,14 +1,348 @@
-from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel,
-                             QLineEdit, QTextEdit, QPushButton, QComboBox,
+from dataclasses import replace
+from PySide6.QtWidgets import (QApplication, QDialog, QVBoxLayout, QHBoxLayout,
+                             QLabel, QLineEdit, QTextEdit, QPushButton, QComboBox,
                              QTabWidget, QWidget, QListWidget, QInputDialog,
-                             QCheckBox, QGridLayout, QFrame, QScrollArea,
-                             QGroupBox, QSpacerItem, QSizePolicy)
-from PySide6.QtCore import Qt, QTimer, QThread, Signal
-from PySide6.QtGui import QFont, QIcon
+                             QCheckBox, QFormLayout, QFrame,
+                             QScrollArea, QGroupBox, QSpacerItem, QSizePolicy)
+from PySide6.QtCore import Qt, QEvent, QTimer, QThread, Signal
+from PySide6.QtGui import QDoubleValidator, QFont, QIcon, QIntValidator
 from PySide6.QtWidgets import QMessageBox
 from core.ai_config import AIConfigManager
 from core.ai_types import AIProvider
 from core.model_fetcher import ModelFetcher, model_cache
+import resources_rc
+
+# 共享调色板：QSS由f-string在导入时展开一次，颜色只在此处定义
+_C_BLUE = "#007AFF"
+_C_BLUE_HOVER = "#0069D9"
+_C_BLUE_PRESSED = "#0051A8"
+_C_TEXT = "#1D1D1F"
+_C_MUTED = "#86868B"
+_C_BORDER = "#E5E5EA"
+_C_BORDER_HOVER = "#C7C7CC"
+_C_BG_SOFT = "#F2F2F7"
+_C_BG_FOCUS = "#FAFBFF"
+
+# 对话框级样式提取为模块常量：字符串只在导入时构建一次，
+# 并随应用级样式表一次性安装，重复打开设置不再重新解析
+_DIALOG_QSS = f"""
+    QDialog {{
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #FAFAFA, stop:1 #F0F0F0);
+        border-radius: 12px;
+    }}
+    QWidget {{
+        font-family: 'SF Pro Display', 'Microsoft YaHei UI', sans-serif;
+    }}
+    QLabel {{
+        color: {_C_TEXT};
+        font-size: 14px;
+    }}
+    QLabel[class="section-title"] {{
+        color: {_C_TEXT};
+        font-size: 16px;
+        font-weight: 600;
+        margin: 8px 0px;
+    }}
+    QLabel[class="description"] {{
+        color: {_C_MUTED};
+        font-size: 12px;
+        margin-bottom: 8px;
+    }}
+    QLineEdit {{
+        color: {_C_TEXT};
+        background-color: white;
+        border: 2px solid {_C_BORDER};
+        border-radius: 8px;
+        padding: 10px 12px;
+        font-size: 14px;
+        selection-background-color: {_C_BLUE};
+        selection-color: white;
+    }}
+    QLineEdit:focus {{
+        border-color: {_C_BLUE};
+        background-color: {_C_BG_FOCUS};
+        color: {_C_TEXT};
+    }}
+    QLineEdit:hover {{
+        border-color: {_C_BORDER_HOVER};
+    }}
+    QLineEdit::placeholder {{
+        color: {_C_MUTED};
+    }}
+    QTextEdit {{
+        color: {_C_TEXT};
+        background-color: white;
+        border: 2px solid {_C_BORDER};
+        border-radius: 8px;
+        padding: 10px 12px;
+        font-size: 14px;
+        selection-background-color: {_C_BLUE};
+        selection-color: white;
+    }}
+    QTextEdit:focus {{
+        border-color: {_C_BLUE};
+        background-color: {_C_BG_FOCUS};
+        color: {_C_TEXT};
+    }}
+    QTextEdit:hover {{
+        border-color: {_C_BORDER_HOVER};
+    }}
+    QComboBox {{
+        color: {_C_TEXT};
+        background-color: white;
+        border: 2px solid {_C_BORDER};
+        border-radius: 8px;
+        padding: 8px 12px;
+        min-height: 20px;
+        font-size: 14px;
+        selection-background-color: {_C_BLUE};
+        selection-color: white;
+    }}
+    QComboBox:focus {{
+        border-color: {_C_BLUE};
+        color: {_C_TEXT};
+    }}
+    QComboBox:hover {{
+        border-color: {_C_BORDER_HOVER};
+    }}
+    QComboBox::drop-down {{
+        border: none;
+        width: 20px;
+    }}
+    QComboBox::down-arrow {{
+        image: url(:/down_arrow.png);
+        width: 8px;
+        height: 5px;
+        margin-right: 5px;
+    }}
+    QComboBox QAbstractItemView {{
+        background-color: white;
+        border: 1px solid {_C_BORDER};
+        border-radius: 6px;
+        color: {_C_TEXT};
+        selection-background-color: {_C_BLUE};
+        selection-color: white;
+    }}
+    QTabWidget::pane {{
+        border: none;
+        background-color: transparent;
+        margin-top: 10px;
+    }}
+    QTabBar::tab {{
+        background-color: transparent;
+        border: none;
+        padding: 12px 20px;
+        margin-right: 4px;
+        border-radius: 8px;
+        color: {_C_MUTED};
+        font-size: 14px;
+        font-weight: 500;
+    }}
+    QTabBar::tab:selected {{
+        background-color: white;
+        color: {_C_BLUE};
+        border: 2px solid {_C_BLUE};
+    }}
+    QTabBar::tab:hover:!selected {{
+        background-color: {_C_BG_SOFT};
+        color: {_C_TEXT};
+    }}
+    QCheckBox {{
+        color: {_C_TEXT};
+        font-size: 14px;
+        spacing: 8px;
+    }}
+    QCheckBox::indicator {{
+        width: 20px;
+        height: 20px;
+        border-radius: 4px;
+        border: 2px solid #D2D2D7;
+        background-color: white;
+    }}
+    QCheckBox::indicator:checked {{
+        background-color: {_C_BLUE};
+        border-color: {_C_BLUE};
+    }}
+    QCheckBox::indicator:hover {{
+        border-color: {_C_BLUE};
+    }}
+    QGroupBox {{
+        font-size: 14px;
+        font-weight: 600;
+        color: {_C_TEXT};
+        border: 2px solid {_C_BORDER};
+        border-radius: 12px;
+        margin-top: 12px;
+        padding-top: 8px;
+        background-color: white;
+    }}
+    QGroupBox::title {{
+        subcontrol-origin: margin;
+        left: 12px;
+        padding: 0 8px 0 8px;
+        background-color: white;
+    }}
+"""
+
+# 各Modern组件的样式合并为一份全局QSS：Qt整个进程只解析一次CSS，
+# 按class属性选择器命中，替代每个实例构造时的setStyleSheet
+_GLOBAL_QSS = f"""
+    QPushButton[class="primary"] {{
+        background-color: {_C_BLUE};
+        color: white;
+        border: none;
+        border-radius: 8px;
+        padding: 8px 20px;
+        font-weight: 500;
+    }}
+    QPushButton[class="primary"]:hover {{
+        background-color: {_C_BLUE_HOVER};
+    }}
+    QPushButton[class="primary"]:pressed {{
+        background-color: {_C_BLUE_PRESSED};
+    }}
+    QPushButton[class="secondary"] {{
+        background-color: {_C_BG_SOFT};
+        color: {_C_TEXT};
+        border: 1px solid #D2D2D7;
+        border-radius: 8px;
+        padding: 8px 20px;
+        font-weight: 500;
+    }}
+    QPushButton[class="secondary"]:hover {{
+        background-color: {_C_BORDER};
+        border-color: {_C_BORDER_HOVER};
+    }}
+    QPushButton[class="secondary"]:pressed {{
+        background-color: #D1D1D6;
+    }}
+    QLineEdit[class="modern"] {{
+        background-color: white;
+        border: 2px solid {_C_BORDER};
+        border-radius: 8px;
+        padding: 10px 12px;
+        font-size: 14px;
+        color: {_C_TEXT};
+        selection-background-color: {_C_BLUE};
+        selection-color: white;
+    }}
+    QLineEdit[class="modern"]:focus {{
+        border-color: {_C_BLUE};
+        background-color: {_C_BG_FOCUS};
+        color: {_C_TEXT};
+    }}
+    QLineEdit[class="modern"]:hover {{
+        border-color: {_C_BORDER_HOVER};
+    }}
+    QLineEdit[class="modern"]::placeholder {{
+        color: {_C_MUTED};
+    }}
+    QComboBox[class="modern"] {{
+        background-color: white;
+        border: 2px solid {_C_BORDER};
+        border-radius: 8px;
+        padding: 8px 12px;
+        min-height: 20px;
+        font-size: 14px;
+        color: {_C_TEXT};
+        selection-background-color: {_C_BLUE};
+        selection-color: white;
+    }}
+    QComboBox[class="modern"]:focus {{
+        border-color: {_C_BLUE};
+        color: {_C_TEXT};
+    }}
+    QComboBox[class="modern"]:hover {{
+        border-color: {_C_BORDER_HOVER};
+    }}
+    QComboBox[class="modern"]::drop-down {{
+        border: none;
+        width: 20px;
+    }}
+    QComboBox[class="modern"]::down-arrow {{
+        image: url(:/down_arrow.png);
+        width: 8px;
+        height: 5px;
+        margin-right: 5px;
+    }}
+    QComboBox[class="modern"] QAbstractItemView {{
+        background-color: white;
+        border: 1px solid {_C_BORDER};
+        border-radius: 6px;
+        color: {_C_TEXT};
+        selection-background-color: {_C_BLUE};
+        selection-color: white;
+    }}
+    QTextEdit[class="modern"] {{
+        background-color: white;
+        border: 2px solid {_C_BORDER};
+        border-radius: 8px;
+        padding: 10px 12px;
+        font-size: 14px;
+        color: {_C_TEXT};
+        selection-background-color: {_C_BLUE};
+        selection-color: white;
+    }}
+    QTextEdit[class="modern"]:focus {{
+        border-color: {_C_BLUE};
+        background-color: {_C_BG_FOCUS};
+        color: {_C_TEXT};
+    }}
+    QTextEdit[class="modern"]:hover {{
+        border-color: {_C_BORDER_HOVER};
+    }}
+"""
+
+# 快速设置按钮的数据表：(显示名, 参数)，循环构建替代逐块复制粘贴
+# 状态提示条的两档配色，字符串在导入时构建一次
+_TOAST_INFO_QSS = f"color: {_C_MUTED}; font-size: 12px;"
+_TOAST_WARN_QSS = "color: #D70015; font-size: 12px;"
+
+_QUICK_SERVICES = (
+    ("DeepSeek", "deepseek"),
+    ("通义千问", "qianwen"),
+    ("OpenAI", "openai"),
+)
+_QUICK_MODELS = (
+    ("GPT-3.5", "gpt-3.5-turbo"),
+    ("GPT-4", "gpt-4"),
+    ("DeepSeek", "deepseek-chat"),
+)
+_QUICK_PROXIES = (
+    ("Clash (7890)", "7890"),
+    ("V2Ray (1080)", "1080"),
+    ("SS (1080)", "1080"),
+)
+_PRESET_PROMPTS = (
+    ("友善助手", "friendly"),
+    ("专业助手", "professional"),
+    ("创意助手", "creative"),
+)
+
+# 按(字号,字重)缓存QFont：字体族回退解析每个进程只发生一次
+_FONTS = {}
+
+def _font(size, weight=-1):
+    key = (size, weight)
+    f = _FONTS.get(key)
+    if f is None:
+        f = (QFont('SF Pro Display', size) if weight < 0
+             else QFont('SF Pro Display', size, weight))
+        _FONTS[key] = f
+    return f
+
+_global_qss_installed = False
+
+def _install_global_qss():
+    """把组件样式追加到应用级样式表，进程内只安装一次"""
+    global _global_qss_installed
+    if _global_qss_installed:
+        return
+    app = QApplication.instance()
+    if app is not None:
+        app.setStyleSheet(app.styleSheet() + _GLOBAL_QSS)
+        _global_qss_installed = True
 
 class ModelFetchThread(QThread):
     """模型获取线程"""
@@ -39,326 +373,148 @@ class ModelFetchThread(QThread):
         except Exception as e:
             self.fetch_failed.emit(str(e))
 
+class ConfigLoadThread(QThread):
+    """配置加载线程：读盘+JSON解析移出UI线程"""
+    config_loaded = Signal()
+
+    def __init__(self, ai_config, parent=None):
+        super().__init__(parent)
+        self.ai_config = ai_config
+
+    def run(self):
+        try:
+            self.ai_config.load_config()
+        except Exception:
+            pass
+        self.config_loaded.emit()
+
 class ModernButton(QPushButton):
     """现代化按钮组件"""
+
+    # sizeHint缓存，类属性兜底保证构造期间可读
+    _hint = None
+
     def __init__(self, text='', button_type='primary', parent=None):
         super().__init__(text, parent)
         self.button_type = button_type
         self.setMinimumHeight(36)
-        self.setFont(QFont('SF Pro Display', 13))
+        self.setFont(_font(13))
+        _install_global_qss()
         self.update_style()
 
     def update_style(self):
-        if self.button_type == 'primary':
-            self.setStyleSheet("""
-                QPushButton {
-                    background-color: #007AFF;
-                    color: white;
-                    border: none;
-                    border-radius: 8px;
-                    padding: 8px 20px;
-                    font-weight: 500;
-                }
-                QPushButton:hover {
-                    background-color: #0069D9;
-                }
-                QPushButton:pressed {
-                    background-color: #0051A8;
-                }
-            """)
-        elif self.button_type == 'secondary':
-            self.setStyleSheet("""
-                QPushButton {
-                    background-color: #F2F2F7;
-                    color: #1D1D1F;
-                    border: 1px solid #D2D2D7;
-                    border-radius: 8px;
-                    padding: 8px 20px;
-                    font-weight: 500;
-                }
-                QPushButton:hover {
-                    background-color: #E5E5EA;
-                    border-color: #C7C7CC;
-                }
-                QPushButton:pressed {
-                    background-color: #D1D1D6;
-                }
-            """)
+        # 样式由全局QSS按class属性匹配，这里只标记类型
+        self.setProperty("class", self.button_type)
+
+    def sizeHint(self):
+        # 布局每轮pass都会问尺寸，CSS盒计算只做一次并缓存
+        if self._hint is None:
+            self._hint = super().sizeHint()
+        return self._hint
+
+    def changeEvent(self, event):
+        if event.type() in (QEvent.StyleChange, QEvent.FontChange):
+            self._hint = None
+        super().changeEvent(event)
 
 class ModernLineEdit(QLineEdit):
     """现代化输入框组件"""
+
+    _hint = None
+
     def __init__(self, placeholder="", parent=None):
         super().__init__(parent)
         if placeholder:
             self.setPlaceholderText(placeholder)
-        self.setStyleSheet("""
-            QLineEdit {
-                background-color: white;
-                border: 2px solid #E5E5EA;
-                border-radius: 8px;
-                padding: 10px 12px;
-                font-size: 14px;
-                color: #1D1D1F;
-                selection-background-color: #007AFF;
-                selection-color: white;
-            }
-            QLineEdit:focus {
-                border-color: #007AFF;
-                background-color: #FAFBFF;
-                color: #1D1D1F;
-            }
-            QLineEdit:hover {
-                border-color: #C7C7CC;
-            }
-            QLineEdit::placeholder {
-                color: #86868B;
-            }
-        """)
+        _install_global_qss()
+        self.setProperty("class", "modern")
+
+    def sizeHint(self):
+        # 布局每轮pass都会问尺寸，CSS盒计算只做一次并缓存
+        if self._hint is None:
+            self._hint = super().sizeHint()
+        return self._hint
+
+    def changeEvent(self, event):
+        if event.type() in (QEvent.StyleChange, QEvent.FontChange):
+            self._hint = None
+        super().changeEvent(event)
 
 class ModernComboBox(QComboBox):
     """现代化下拉框组件"""
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.setStyleSheet("""
-            QComboBox {
-                background-color: white;
-                border: 2px solid #E5E5EA;
-                border-radius: 8px;
-                padding: 8px 12px;
-                min-height: 20px;
-                font-size: 14px;
-                color: #1D1D1F;
-                selection-background-color: #007AFF;
-                selection-color: white;
-            }
-            QComboBox:focus {
-                border-color: #007AFF;
-                color: #1D1D1F;
-            }
-            QComboBox:hover {
-                border-color: #C7C7CC;
-            }
-            QComboBox::drop-down {
-                border: none;
-                width: 20px;
-            }
-            QComboBox::down-arrow {
-                image: none;
-                border-left: 5px solid transparent;
-                border-right: 5px solid transparent;
-                border-top: 5px solid #86868B;
-                margin-right: 5px;
-            }
-            QComboBox QAbstractItemView {
-                background-color: white;
-                border: 1px solid #E5E5EA;
-                border-radius: 6px;
-                color: #1D1D1F;
-                selection-background-color: #007AFF;
-                selection-color: white;
-            }
-        """)
+        _install_global_qss()
+        self.setProperty("class", "modern")
 
 class ModernTextEdit(QTextEdit):
     """现代化文本编辑框组件"""
+
+    _hint = None
+
     def __init__(self, placeholder="", parent=None):
         super().__init__(parent)
         if placeholder:
             self.setPlaceholderText(placeholder)
-        self.setStyleSheet("""
-            QTextEdit {
-                background-color: white;
-                border: 2px solid #E5E5EA;
-                border-radius: 8px;
-                padding: 10px 12px;
-                font-size: 14px;
-                color: #1D1D1F;
-                selection-background-color: #007AFF;
-                selection-color: white;
-            }
-            QTextEdit:focus {
-                border-color: #007AFF;
-                background-color: #FAFBFF;
-                color: #1D1D1F;
-            }
-            QTextEdit:hover {
-                border-color: #C7C7CC;
-            }
-        """)
+        _install_global_qss()
+        self.setProperty("class", "modern")
+
+    def sizeHint(self):
+        # 布局每轮pass都会问尺寸，CSS盒计算只做一次并缓存
+        if self._hint is None:
+            self._hint = super().sizeHint()
+        return self._hint
+
+    def changeEvent(self, event):
+        if event.type() in (QEvent.StyleChange, QEvent.FontChange):
+            self._hint = None
+        super().changeEvent(event)
 
 class SettingsDialog(QDialog):
+    # 应用级样式是否已安装，跨实例共享
+    _style_applied = False
+
     def __init__(self, config_manager, chat_manager, parent=None):
         super().__init__(parent)
         self.config = config_manager
         self.chat = chat_manager
         # 初始化AI配置管理器
         self.ai_config = AIConfigManager()
-        self.setup_ui()
-        self.load_settings()
+        # 模型下拉框当前内容的快照，内容未变时跳过重建
+        self._model_items = []
+        # 预设提示词会话内不变，首次使用后缓存
+        self._presets = None
+        # 加载完成后的初始值快照，保存时按差异决定是否写盘
+        self._initial = None
+        # 在途模型拉取的(api_key, base_url)，非None时不再并发起新线程
+        self._fetch_key = None
+        # 快速设置连点时用单发定时器去抖，只触发最后一次的自动刷新
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(500)
+        self._refresh_timer.timeout.connect(self._refresh_models)
+        # 先安装样式再构建子控件，每个孩子只经历一次polish
         self.apply_modern_style()
+        _install_global_qss()
+        # 构建期间挂起重绘，整棵控件树只在结束时合并为一次布局
+        self.setUpdatesEnabled(False)
+        try:
+            self.setup_ui()
+        finally:
+            self.setUpdatesEnabled(True)
+        # 配置读盘放到后台线程，对话框先以默认值即时显示，加载完成后回填
+        self._config_thread = ConfigLoadThread(self.ai_config, self)
+        self._config_thread.config_loaded.connect(self.load_settings)
+        self._config_thread.start()
 
     def apply_modern_style(self):
-        """应用现代化样式"""
-        self.setStyleSheet("""
-            QDialog {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #FAFAFA, stop:1 #F0F0F0);
-                border-radius: 12px;
-            }
-            QWidget {
-                font-family: 'SF Pro Display', 'Microsoft YaHei UI', sans-serif;
-            }
-            QLabel {
-                color: #1D1D1F;
-                font-size: 14px;
-            }
-            QLabel[class="section-title"] {
-                color: #1D1D1F;
-                font-size: 16px;
-                font-weight: 600;
-                margin: 8px 0px;
-            }
-            QLabel[class="description"] {
-                color: #86868B;
-                font-size: 12px;
-                margin-bottom: 8px;
-            }
-            QLineEdit {
-                color: #1D1D1F;
-                background-color: white;
-                border: 2px solid #E5E5EA;
-                border-radius: 8px;
-                padding: 10px 12px;
-                font-size: 14px;
-                selection-background-color: #007AFF;
-                selection-color: white;
-            }
-            QLineEdit:focus {
-                border-color: #007AFF;
-                background-color: #FAFBFF;
-                color: #1D1D1F;
-            }
-            QLineEdit:hover {
-                border-color: #C7C7CC;
-            }
-            QLineEdit::placeholder {
-                color: #86868B;
-            }
-            QTextEdit {
-                color: #1D1D1F;
-                background-color: white;
-                border: 2px solid #E5E5EA;
-                border-radius: 8px;
-                padding: 10px 12px;
-                font-size: 14px;
-                selection-background-color: #007AFF;
-                selection-color: white;
-            }
-            QTextEdit:focus {
-                border-color: #007AFF;
-                background-color: #FAFBFF;
-                color: #1D1D1F;
-            }
-            QTextEdit:hover {
-                border-color: #C7C7CC;
-            }
-            QComboBox {
-                color: #1D1D1F;
-                background-color: white;
-                border: 2px solid #E5E5EA;
-                border-radius: 8px;
-                padding: 8px 12px;
-                min-height: 20px;
-                font-size: 14px;
-                selection-background-color: #007AFF;
-                selection-color: white;
-            }
-            QComboBox:focus {
-                border-color: #007AFF;
-                color: #1D1D1F;
-            }
-            QComboBox:hover {
-                border-color: #C7C7CC;
-            }
-            QComboBox::drop-down {
-                border: none;
-                width: 20px;
-            }
-            QComboBox::down-arrow {
-                image: none;
-                border-left: 5px solid transparent;
-                border-right: 5px solid transparent;
-                border-top: 5px solid #86868B;
-                margin-right: 5px;
-            }
-            QComboBox QAbstractItemView {
-                background-color: white;
-                border: 1px solid #E5E5EA;
-                border-radius: 6px;
-                color: #1D1D1F;
-                selection-background-color: #007AFF;
-                selection-color: white;
-            }
-            QTabWidget::pane {
-                border: none;
-                background-color: transparent;
-                margin-top: 10px;
-            }
-            QTabBar::tab {
-                background-color: transparent;
-                border: none;
-                padding: 12px 20px;
-                margin-right: 4px;
-                border-radius: 8px;
-                color: #86868B;
-                font-size: 14px;
-                font-weight: 500;
-            }
-            QTabBar::tab:selected {
-                background-color: white;
-                color: #007AFF;
-                border: 2px solid #007AFF;
-            }
-            QTabBar::tab:hover:!selected {
-                background-color: #F2F2F7;
-                color: #1D1D1F;
-            }
-            QCheckBox {
-                color: #1D1D1F;
-                font-size: 14px;
-                spacing: 8px;
-            }
-            QCheckBox::indicator {
-                width: 20px;
-                height: 20px;
-                border-radius: 4px;
-                border: 2px solid #D2D2D7;
-                background-color: white;
-            }
-            QCheckBox::indicator:checked {
-                background-color: #007AFF;
-                border-color: #007AFF;
-            }
-            QCheckBox::indicator:hover {
-                border-color: #007AFF;
-            }
-            QGroupBox {
-                font-size: 14px;
-                font-weight: 600;
-                color: #1D1D1F;
-                border: 2px solid #E5E5EA;
-                border-radius: 12px;
-                margin-top: 12px;
-                padding-top: 8px;
-                background-color: white;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 12px;
-                padding: 0 8px 0 8px;
-                background-color: white;
-            }
-        """)
+        """应用现代化样式（进程内只安装一次到应用级样式表）"""
+        if SettingsDialog._style_applied:
+            return
+        app = QApplication.instance()
+        if app is not None:
+            app.setStyleSheet(app.styleSheet() + _DIALOG_QSS)
+            SettingsDialog._style_applied = True
 
     def setup_ui(self):
         """设置UI界面"""
@@ -373,26 +529,45 @@ class SettingsDialog(QDialog):
 
         # 标题
         title_label = QLabel("应用设置")
-        title_label.setFont(QFont('SF Pro Display', 20, QFont.Bold))
+        title_label.setFont(_font(20, QFont.Bold))
         title_label.setAlignment(Qt.AlignCenter)
         title_label.setStyleSheet("color: #1D1D1F; margin-bottom: 10px;")
         main_layout.addWidget(title_label)
 
         # 创建标签页
-        tab_widget = QTabWidget()
-        main_layout.addWidget(tab_widget)
-
-        # API设置页
+        self.tab_widget = QTabWidget()
+        main_layout.addWidget(self.tab_widget)
+
+        # 非阻塞的状态提示条：替代模态弹窗，不打断事件循环里的后台刷新
+        self._status_toast = QLabel()
+        self._status_toast.setAlignment(Qt.AlignCenter)
+        self._status_toast.hide()
+        main_layout.addWidget(self._status_toast)
+        self._toast_timer = QTimer(self)
+        self._toast_timer.setSingleShot(True)
+        self._toast_timer.setInterval(3000)
+        self._toast_timer.timeout.connect(self._status_toast.hide)
+
+        # API设置页：打开时可见，立即构建
         api_tab = self.create_api_tab()
-        tab_widget.addTab(api_tab, "🤖 模型设置")
+        self.tab_widget.addTab(api_tab, "🤖 模型设置")
 
-        # 网络代理设置页
-        proxy_tab = self.create_proxy_tab()
-        tab_widget.addTab(proxy_tab, "🌐 网络代理")
+        # 代理页与提示词页按需构建：多数用户只改模型设置，
+        # 首次切换到对应页时再创建其控件
+        self._proxy_built = False
+        self._pending_proxy = {"enabled": False, "http": "", "https": ""}
+        self._proxy_placeholder = QWidget()
+        proxy_index = self.tab_widget.addTab(self._proxy_placeholder, "🌐 网络代理")
 
-        # 系统提示词设置页
-        prompt_tab = self.create_prompt_tab()
-        tab_widget.addTab(prompt_tab, "💬 提示词设置")
+        self._prompt_built = False
+        self._pending_prompt = ""
+        self._prompt_placeholder = QWidget()
+        prompt_index = self.tab_widget.addTab(self._prompt_placeholder, "💬 提示词设置")
+
+        # 占位页索引到构建函数的映射，构建一次后即从表中移除
+        self._tab_builders = {proxy_index: self._build_proxy_tab,
+                              prompt_index: self._build_prompt_tab}
+        self.tab_widget.currentChanged.connect(self._on_tab_changed)
 
         # 按钮区域
         button_layout = QHBoxLayout()
@@ -405,9 +580,11 @@ class SettingsDialog(QDialog):
         cancel_btn.clicked.connect(self.reject)
         button_layout.addWidget(cancel_btn)
 
-        save_btn = ModernButton("保存设置", "primary")
-        save_btn.clicked.connect(self.save_settings)
-        button_layout.addWidget(save_btn)
+        self.save_btn = ModernButton("保存设置", "primary")
+        self.save_btn.clicked.connect(self.save_settings)
+        # 配置仍在后台加载，先禁用保存，避免把默认值当作用户修改写盘
+        self.save_btn.setEnabled(False)
+        button_layout.addWidget(self.save_btn)
 
         main_layout.addLayout(button_layout)
 
@@ -458,17 +635,11 @@ class SettingsDialog(QDialog):
         quick_layout = QHBoxLayout()
         quick_layout.addWidget(QLabel("快速设置:"))
 
-        deepseek_btn = ModernButton("DeepSeek", "secondary")
-        deepseek_btn.clicked.connect(lambda: self._set_quick_service("deepseek"))
-        quick_layout.addWidget(deepseek_btn)
-
-        qianwen_btn = ModernButton("通义千问", "secondary")
-        qianwen_btn.clicked.connect(lambda: self._set_quick_service("qianwen"))
-        quick_layout.addWidget(qianwen_btn)
-
-        openai_btn = ModernButton("OpenAI", "secondary")
-        openai_btn.clicked.connect(lambda: self._set_quick_service("openai"))
-        quick_layout.addWidget(openai_btn)
+        for label, service in _QUICK_SERVICES:
+            btn = ModernButton(label, "secondary")
+            btn.setProperty("svc", service)
+            btn.clicked.connect(self._on_quick_service_clicked)
+            quick_layout.addWidget(btn)
 
         quick_layout.addStretch()
         url_layout.addLayout(quick_layout)
@@ -503,17 +674,11 @@ class SettingsDialog(QDialog):
         model_quick_layout = QHBoxLayout()
         model_quick_layout.addWidget(QLabel("常用模型:"))
 
-        gpt35_btn = ModernButton("GPT-3.5", "secondary")
-        gpt35_btn.clicked.connect(lambda: self.model_combo.setCurrentText("gpt-3.5-turbo"))
-        model_quick_layout.addWidget(gpt35_btn)
-
-        gpt4_btn = ModernButton("GPT-4", "secondary")
-        gpt4_btn.clicked.connect(lambda: self.model_combo.setCurrentText("gpt-4"))
-        model_quick_layout.addWidget(gpt4_btn)
-
-        deepseek_model_btn = ModernButton("DeepSeek", "secondary")
-        deepseek_model_btn.clicked.connect(lambda: self.model_combo.setCurrentText("deepseek-chat"))
-        model_quick_layout.addWidget(deepseek_model_btn)
+        for label, model in _QUICK_MODELS:
+            btn = ModernButton(label, "secondary")
+            btn.setProperty("model", model)
+            btn.clicked.connect(self._on_quick_model_clicked)
+            model_quick_layout.addWidget(btn)
 
         model_quick_layout.addStretch()
         model_layout.addLayout(model_quick_layout)
@@ -521,49 +686,48 @@ class SettingsDialog(QDialog):
 
         layout.addWidget(newapi_group)
 
-        # 高级设置
+        # 高级设置（表单布局统一做标签列几何，尺寸计算比逐行QHBoxLayout轻）
         advanced_group = QGroupBox("高级设置")
-        advanced_layout = QVBoxLayout(advanced_group)
+        advanced_layout = QFormLayout(advanced_group)
         advanced_layout.setSpacing(8)
 
-        # 温度参数
-        temp_layout = QHBoxLayout()
-        temp_layout.addWidget(QLabel("温度参数:"))
+        # 温度参数（输入期即校验，保存路径不再需要异常兜底解析）
         self.temperature_input = ModernLineEdit("0.7")
         self.temperature_input.setMaximumWidth(100)
+        temp_validator = QDoubleValidator(0.1, 2.0, 2, self)
+        temp_validator.setNotation(QDoubleValidator.StandardNotation)
+        self.temperature_input.setValidator(temp_validator)
+        temp_layout = QHBoxLayout()
         temp_layout.addWidget(self.temperature_input)
         temp_layout.addWidget(QLabel("(0.1-2.0, 控制回复的随机性)"))
         temp_layout.addStretch()
-        advanced_layout.addLayout(temp_layout)
+        advanced_layout.addRow("温度参数:", temp_layout)
 
         # 最大Token数
-        token_layout = QHBoxLayout()
-        token_layout.addWidget(QLabel("最大Token数:"))
         self.max_tokens_input = ModernLineEdit("2000")
         self.max_tokens_input.setMaximumWidth(100)
+        self.max_tokens_input.setValidator(QIntValidator(1, 200000, self))
+        token_layout = QHBoxLayout()
         token_layout.addWidget(self.max_tokens_input)
         token_layout.addWidget(QLabel("(控制回复的最大长度)"))
         token_layout.addStretch()
-        advanced_layout.addLayout(token_layout)
+        advanced_layout.addRow("最大Token数:", token_layout)
 
         layout.addWidget(advanced_group)
 
-        # 连接测试按钮
-        test_layout = QHBoxLayout()
-        test_layout.addStretch()
+        # 连接测试按钮（对齐标志右贴，省掉一层HBox和弹簧项）
         self.test_btn = ModernButton("测试连接", "secondary")
         self.test_btn.clicked.connect(self._test_connection)
-        test_layout.addWidget(self.test_btn)
-        layout.addLayout(test_layout)
+        layout.addWidget(self.test_btn, alignment=Qt.AlignRight)
 
         # 添加弹性空间
         layout.addStretch()
 
         return tab
 
-    def create_proxy_tab(self):
-        """创建网络代理设置标签页"""
-        tab = QWidget()
+    def _build_proxy_tab(self):
+        """在占位页上按需构建网络代理设置内容"""
+        tab = self._proxy_placeholder
         layout = QVBoxLayout(tab)
         layout.setContentsMargins(16, 16, 16, 16)
         layout.setSpacing(20)
@@ -594,37 +758,24 @@ class SettingsDialog(QDialog):
         proxy_settings_layout.setContentsMargins(20, 0, 0, 0)
         proxy_settings_layout.setSpacing(12)
 
-        # HTTP代理设置
-        http_layout = QVBoxLayout()
-        http_layout.setSpacing(6)
-        http_layout.addWidget(QLabel("HTTP 代理:"))
+        # HTTP/HTTPS代理设置（一个表单布局管理两行，几何计算更轻）
+        proxy_form = QFormLayout()
+        proxy_form.setSpacing(6)
         self.http_proxy = ModernLineEdit("http://127.0.0.1:7890")
-        http_layout.addWidget(self.http_proxy)
-        proxy_settings_layout.addLayout(http_layout)
-
-        # HTTPS代理设置
-        https_layout = QVBoxLayout()
-        https_layout.setSpacing(6)
-        https_layout.addWidget(QLabel("HTTPS 代理:"))
+        proxy_form.addRow("HTTP 代理:", self.http_proxy)
         self.https_proxy = ModernLineEdit("http://127.0.0.1:7890")
-        https_layout.addWidget(self.https_proxy)
-        proxy_settings_layout.addLayout(https_layout)
+        proxy_form.addRow("HTTPS 代理:", self.https_proxy)
+        proxy_settings_layout.addLayout(proxy_form)
 
         # 快速设置按钮
         quick_proxy_layout = QHBoxLayout()
         quick_proxy_layout.addWidget(QLabel("常用代理:"))
 
-        clash_btn = ModernButton("Clash (7890)", "secondary")
-        clash_btn.clicked.connect(lambda: self._set_quick_proxy("7890"))
-        quick_proxy_layout.addWidget(clash_btn)
-
-        v2ray_btn = ModernButton("V2Ray (1080)", "secondary")
-        v2ray_btn.clicked.connect(lambda: self._set_quick_proxy("1080"))
-        quick_proxy_layout.addWidget(v2ray_btn)
-
-        shadowsocks_btn = ModernButton("SS (1080)", "secondary")
-        shadowsocks_btn.clicked.connect(lambda: self._set_quick_proxy("1080"))
-        quick_proxy_layout.addWidget(shadowsocks_btn)
+        for label, port in _QUICK_PROXIES:
+            btn = ModernButton(label, "secondary")
+            btn.setProperty("port", port)
+            btn.clicked.connect(self._on_quick_proxy_clicked)
+            quick_proxy_layout.addWidget(btn)
 
         quick_proxy_layout.addStretch()
         proxy_settings_layout.addLayout(quick_proxy_layout)
@@ -641,12 +792,9 @@ class SettingsDialog(QDialog):
         test_desc.setProperty("class", "description")
         test_layout.addWidget(test_desc)
 
-        test_btn_layout = QHBoxLayout()
-        test_btn_layout.addStretch()
         self.proxy_test_btn = ModernButton("测试代理连接", "secondary")
         self.proxy_test_btn.clicked.connect(self._test_proxy_connection)
-        test_btn_layout.addWidget(self.proxy_test_btn)
-        test_layout.addLayout(test_btn_layout)
+        test_layout.addWidget(self.proxy_test_btn, alignment=Qt.AlignRight)
 
         layout.addWidget(test_group)
 
@@ -670,11 +818,30 @@ class SettingsDialog(QDialog):
         # 添加弹性空间
         layout.addStretch()
 
-        return tab
-
-    def create_prompt_tab(self):
-        """创建提示词设置标签页"""
-        tab = QWidget()
+        # 回填延迟加载期间记录的代理配置
+        pending = self._pending_proxy
+        widgets = (self.proxy_enabled_check, self.http_proxy, self.https_proxy)
+        for w in widgets:
+            w.blockSignals(True)
+        try:
+            self.proxy_enabled_check.setChecked(pending["enabled"])
+            self.http_proxy.setText(pending["http"])
+            self.https_proxy.setText(pending["https"])
+        finally:
+            for w in widgets:
+                w.blockSignals(False)
+        self.proxy_settings_widget.setEnabled(pending["enabled"])
+        self._proxy_built = True
+
+    def _on_tab_changed(self, index):
+        """首次切到某个占位页时才构建其内容"""
+        builder = self._tab_builders.pop(index, None)
+        if builder:
+            builder()
+
+    def _build_prompt_tab(self):
+        """在占位页上按需构建提示词设置内容"""
+        tab = self._prompt_placeholder
         layout = QVBoxLayout(tab)
         layout.setContentsMargins(16, 16, 16, 16)
         layout.setSpacing(16)
@@ -698,28 +865,62 @@ class SettingsDialog(QDialog):
         preset_layout = QHBoxLayout()
         preset_layout.addWidget(QLabel("快速预设:"))
 
-        friendly_btn = ModernButton("友善助手", "secondary")
-        friendly_btn.clicked.connect(lambda: self.set_preset_prompt("friendly"))
-        preset_layout.addWidget(friendly_btn)
-
-        professional_btn = ModernButton("专业助手", "secondary")
-        professional_btn.clicked.connect(lambda: self.set_preset_prompt("professional"))
-        preset_layout.addWidget(professional_btn)
-
-        creative_btn = ModernButton("创意助手", "secondary")
-        creative_btn.clicked.connect(lambda: self.set_preset_prompt("creative"))
-        preset_layout.addWidget(creative_btn)
+        for label, preset in _PRESET_PROMPTS:
+            btn = ModernButton(label, "secondary")
+            btn.setProperty("preset", preset)
+            btn.clicked.connect(self._on_preset_clicked)
+            preset_layout.addWidget(btn)
 
         preset_layout.addStretch()
         layout.addLayout(preset_layout)
 
-        return tab
+        # 回填延迟加载期间记录的提示词
+        self.system_prompt.setText(self._pending_prompt)
+        self._prompt_built = True
+
+    def _set_model_items(self, models, current=None):
+        """更新模型下拉列表，内容未变时跳过clear+addItems的Qt模型重置
+
+        批量填充期间屏蔽信号并挂起重绘：clear+addItems+setCurrentText
+        各自都会触发currentTextChanged与视图重排，合并为最后一次。
+        """
+        combo = self.model_combo
+        combo.setUpdatesEnabled(False)
+        combo.blockSignals(True)
+        try:
+            if models != self._model_items:
+                combo.clear()
+                combo.addItems(models)
+                self._model_items = list(models)
+            if current and current in models:
+                combo.setCurrentText(current)
+            elif models:
+                combo.setCurrentText(models[0])
+        finally:
+            combo.blockSignals(False)
+            combo.setUpdatesEnabled(True)
+
+    # 快捷按钮共用槽：参数挂在按钮属性上，免去每个按钮一个闭包
+    def _on_quick_service_clicked(self):
+        self._set_quick_service(self.sender().property("svc"))
+
+    def _on_quick_model_clicked(self):
+        self.model_combo.setCurrentText(self.sender().property("model"))
+
+    def _on_quick_proxy_clicked(self):
+        self._set_quick_proxy(self.sender().property("port"))
+
+    def _on_preset_clicked(self):
+        self.set_preset_prompt(self.sender().property("preset"))
 
     def set_preset_prompt(self, preset_type):
         """设置预设提示词"""
-        presets = self.ai_config.get_preset_prompts()
-        if preset_type in presets:
-            self.system_prompt.setText(presets[preset_type])
+        if self._presets is None:
+            self._presets = self.ai_config.get_preset_prompts()
+        text = self._presets.get(preset_type)
+        if text:
+            # setPlainText跳过富文本探测，与保存用的toPlainText对应
+            self.system_prompt.setPlainText(text)
 
     def _set_quick_service(self, service):
         """设置快速服务配置"""
@@ -743,25 +944,30 @@ class SettingsDialog(QDialog):
             self.newapi_url.setText(config["url"])
 
             # 先使用默认模型列表
-            self.model_combo.clear()
-            self.model_combo.addItems(config["models"])
-            if config["models"]:
-                self.model_combo.setCurrentText(config["models"][0])
+            self._set_model_items(config["models"])
 
             self.model_status_label.setText("已设置默认模型，建议点击刷新获取最新列表")
 
-            # 如果有API Key，自动刷新模型列表
+            # 如果有API Key，自动刷新模型列表（去抖：重启定时器合并连续点击）
             if self.newapi_key.text().strip():
-                QTimer.singleShot(500, self._refresh_models)  # 延迟500ms后自动刷新
+                self._refresh_timer.start()
+
+    def _toast(self, message, level="info"):
+        """在对话框底部内联显示状态提示，3秒后自动隐藏"""
+        self._status_toast.setStyleSheet(
+            _TOAST_WARN_QSS if level == "warn" else _TOAST_INFO_QSS)
+        self._status_toast.setText(message)
+        self._status_toast.show()
+        self._toast_timer.start()
 
     def _test_connection(self):
         """测试API连接"""
         if not self.newapi_key.text().strip():
-            QMessageBox.warning(self, "测试失败", "请先输入API Key")
+            self._toast("请先输入API Key", "warn")
             return
 
         if not self.newapi_url.text().strip():
-            QMessageBox.warning(self, "测试失败", "请先输入API Base URL")
+            self._toast("请先输入API Base URL", "warn")
             return
 
         self.test_btn.setText("测试中...")
@@ -775,15 +981,21 @@ class SettingsDialog(QDialog):
         """显示测试结果"""
         self.test_btn.setText("测试连接")
         self.test_btn.setEnabled(True)
-        QMessageBox.information(self, "连接测试", "连接测试功能正在开发中...")
+        self._toast("连接测试功能正在开发中...")
 
     def _on_proxy_enabled_changed(self, state):
         """处理代理启用状态变化"""
         enabled = bool(state)
-        self.proxy_settings_widget.setEnabled(enabled)
-        if not enabled:
-            self.http_proxy.clear()
-            self.https_proxy.clear()
+        # 批量改动期间挂起重绘，整个切换只合并成一次paint
+        self.setUpdatesEnabled(False)
+        try:
+            self.proxy_settings_widget.setEnabled(enabled)
+            if not enabled:
+                self.http_proxy.clear()
+                self.https_proxy.clear()
+        finally:
+            self.setUpdatesEnabled(True)
+            self.update()
 
     def _set_quick_proxy(self, port):
         """设置快速代理配置"""
@@ -794,11 +1006,11 @@ class SettingsDialog(QDialog):
     def _test_proxy_connection(self):
         """测试代理连接"""
         if not self.proxy_enabled_check.isChecked():
-            QMessageBox.warning(self, "测试失败", "请先启用网络代理")
+            self._toast("请先启用网络代理", "warn")
             return
 
         if not self.http_proxy.text().strip():
-            QMessageBox.warning(self, "测试失败", "请先配置代理地址")
+            self._toast("请先配置代理地址", "warn")
             return
 
         self.proxy_test_btn.setText("测试中...")
@@ -811,7 +1023,7 @@ class SettingsDialog(QDialog):
         """显示代理测试结果"""
         self.proxy_test_btn.setText("测试代理连接")
         self.proxy_test_btn.setEnabled(True)
-        QMessageBox.information(self, "代理测试", "代理连接测试功能正在开发中...")
+        self._toast("代理连接测试功能正在开发中...")
 
     def _refresh_models(self):
         """刷新模型列表"""
@@ -819,13 +1031,18 @@ class SettingsDialog(QDialog):
         base_url = self.newapi_url.text().strip()
 
         if not api_key:
-            QMessageBox.warning(self, "刷新失败", "请先输入API Key")
+            self._toast("请先输入API Key", "warn")
             return
 
         if not base_url:
-            QMessageBox.warning(self, "刷新失败", "请先输入API Base URL")
+            self._toast("请先输入API Base URL", "warn")
             return
 
+        # 单航道：已有拉取在途时直接共享其结果，避免两个回调交错改写下拉框
+        if self._fetch_key is not None:
+            return
+        self._fetch_key = (api_key, base_url)
+
         # 禁用刷新按钮并显示加载状态
         self.refresh_models_btn.setText("刷新中...")
         self.refresh_models_btn.setEnabled(False)
@@ -839,29 +1056,20 @@ class SettingsDialog(QDialog):
 
     def _on_models_fetched(self, models):
         """模型获取成功"""
+        self._fetch_key = None
         self.refresh_models_btn.setText("🔄 刷新")
         self.refresh_models_btn.setEnabled(True)
 
         if models:
-            # 保存当前选中的模型
-            current_model = self.model_combo.currentText()
-
-            # 更新模型列表
-            self.model_combo.clear()
-            self.model_combo.addItems(models)
-
-            # 恢复之前选中的模型（如果存在）
-            if current_model and current_model in models:
-                self.model_combo.setCurrentText(current_model)
-            elif models:
-                self.model_combo.setCurrentText(models[0])
-
+            # 更新模型列表并恢复之前选中的模型（如果存在）
+            self._set_model_items(models, self.model_combo.currentText())
             self.model_status_label.setText(f"已获取 {len(models)} 个模型")
         else:
             self.model_status_label.setText("未获取到模型列表")
 
     def _on_models_fetch_failed(self, error):
         """模型获取失败"""
+        self._fetch_key = None
         self.refresh_models_btn.setText("🔄 刷新")
         self.refresh_models_btn.setEnabled(True)
         self.model_status_label.setText(f"获取失败: {error}")
@@ -870,111 +1078,145 @@ class SettingsDialog(QDialog):
         service_type = ModelFetcher.detect_service_type(self.newapi_url.text().strip())
         default_models = ModelFetcher.get_default_models(service_type)
 
-        current_model = self.model_combo.currentText()
-        self.model_combo.clear()
-        self.model_combo.addItems(default_models)
-
-        if current_model and current_model in default_models:
-            self.model_combo.setCurrentText(current_model)
-        elif default_models:
-            self.model_combo.setCurrentText(default_models[0])
+        self._set_model_items(default_models, self.model_combo.currentText())
 
     def load_settings(self):
-        """加载设置"""
-        # 加载AI配置
-        self.ai_config.load_config()
-
-        # NewAPI设置
-        self.newapi_key.setText(self.ai_config.get_api_key("newapi"))
-
-        newapi_config = self.ai_config.get_provider_config("newapi")
-        if newapi_config:
-            self.newapi_url.setText(newapi_config.base_url or "https://api.deepseek.com/v1")
-            self.temperature_input.setText(str(newapi_config.temperature))
-            self.max_tokens_input.setText(str(newapi_config.max_tokens))
-
-            # 初始化模型列表
-            base_url = newapi_config.base_url or "https://api.deepseek.com/v1"
-            service_type = ModelFetcher.detect_service_type(base_url)
-            default_models = ModelFetcher.get_default_models(service_type)
-
-            self.model_combo.clear()
-            self.model_combo.addItems(default_models)
-
-            # 设置当前模型
-            current_model = newapi_config.model or "deepseek-chat"
-            if current_model in default_models:
-                self.model_combo.setCurrentText(current_model)
-            elif default_models:
-                self.model_combo.setCurrentText(default_models[0])
-
-            self.model_status_label.setText("已加载默认模型列表，点击刷新获取最新列表")
-
-        # 代理设置
-        proxy = self.config.get_proxy()
-        proxy_enabled = bool(proxy.get("http") or proxy.get("https"))
-        self.proxy_enabled_check.setChecked(proxy_enabled)
-        self.http_proxy.setText(proxy.get("http", ""))
-        self.https_proxy.setText(proxy.get("https", ""))
-
-        # 启用/禁用代理设置
-        self.proxy_settings_widget.setEnabled(proxy_enabled)
-
-        # 系统提示词
-        self.system_prompt.setText(self.ai_config.settings.system_prompt)
-
-        # 连接代理复选框信号
-        self.proxy_enabled_check.stateChanged.connect(self._on_proxy_enabled_changed)
-
-    def save_settings(self):
-        """保存设置"""
+        """加载设置（配置已由后台线程读入内存）"""
+        # 批量填充期间屏蔽信号，避免setText/setChecked触发多余的处理器
+        widgets = [self.newapi_key, self.newapi_url, self.temperature_input,
+                   self.max_tokens_input, self.model_combo]
+        if self._proxy_built:
+            widgets += [self.proxy_enabled_check, self.http_proxy, self.https_proxy]
+        for w in widgets:
+            w.blockSignals(True)
         try:
-            # 保存NewAPI配置
-            self.ai_config.set_api_key("newapi", self.newapi_key.text().strip())
+            # NewAPI设置
+            self.newapi_key.setText(self.ai_config.get_api_key("newapi"))
 
             newapi_config = self.ai_config.get_provider_config("newapi")
             if newapi_config:
-                newapi_config.base_url = self.newapi_url.text().strip()
-                newapi_config.model = self.model_combo.currentText().strip()
-                newapi_config.enabled = True
-
-                # 保存高级设置
-                try:
-                    newapi_config.temperature = float(self.temperature_input.text())
-                except ValueError:
-                    newapi_config.temperature = 0.7
-
-                try:
-                    newapi_config.max_tokens = int(self.max_tokens_input.text())
-                except ValueError:
-                    newapi_config.max_tokens = 2000
-
-                self.ai_config.set_provider_config("newapi", newapi_config)
-
-            # 设置NewAPI为默认提供商
-            self.ai_config.settings.default_provider = AIProvider.NEWAPI
-
-            # 保存系统提示词
-            self.ai_config.settings.system_prompt = self.system_prompt.toPlainText().strip()
-
-            # 保存AI配置
-            self.ai_config.save_config()
-
-            # 向后兼容：保存到旧配置系统
-            self.config.set_api_key("newapi", self.newapi_key.text().strip())
+                self.newapi_url.setText(newapi_config.base_url or "https://api.deepseek.com/v1")
+                self.temperature_input.setText(str(newapi_config.temperature))
+                self.max_tokens_input.setText(str(newapi_config.max_tokens))
+
+                # 初始化模型列表
+                base_url = newapi_config.base_url or "https://api.deepseek.com/v1"
+                service_type = ModelFetcher.detect_service_type(base_url)
+                default_models = ModelFetcher.get_default_models(service_type)
+
+                # 设置当前模型
+                self._set_model_items(default_models, newapi_config.model or "deepseek-chat")
+
+                self.model_status_label.setText("已加载默认模型列表，点击刷新获取最新列表")
+
+            # 代理设置（页面可能尚未构建，先记录待回填值）
+            proxy = self.config.get_proxy()
+            proxy_enabled = bool(proxy.get("http") or proxy.get("https"))
+            self._pending_proxy = {"enabled": proxy_enabled,
+                                   "http": proxy.get("http", ""),
+                                   "https": proxy.get("https", "")}
+            if self._proxy_built:
+                self.proxy_enabled_check.setChecked(proxy_enabled)
+                self.http_proxy.setText(proxy.get("http", ""))
+                self.https_proxy.setText(proxy.get("https", ""))
+        finally:
+            for w in widgets:
+                w.blockSignals(False)
+
+        # 信号被屏蔽时不会走处理器，这里手动同步一次启用状态
+        if self._proxy_built:
+            self.proxy_settings_widget.setEnabled(proxy_enabled)
+
+        # 系统提示词（页面可能尚未构建，先记录待回填值）
+        self._pending_prompt = self.ai_config.settings.system_prompt
+        if self._prompt_built:
+            self.system_prompt.setText(self._pending_prompt)
+
+        # 记录初始快照，保存时与之对比，无改动则完全跳过写盘
+        self._initial = self._current_values()
+        self.save_btn.setEnabled(True)
+
+    def _current_values(self):
+        """收集界面上的当前配置值（每个输入框只取一次text+strip）"""
+        return {
+            "api_key": self.newapi_key.text().strip(),
+            "base_url": self.newapi_url.text().strip(),
+            "model": self.model_combo.currentText().strip(),
+            "temperature": self.temperature_input.text().strip(),
+            "max_tokens": self.max_tokens_input.text().strip(),
+            "proxy_enabled": (self.proxy_enabled_check.isChecked()
+                              if self._proxy_built else self._pending_proxy["enabled"]),
+            "http_proxy": (self.http_proxy.text().strip()
+                           if self._proxy_built else self._pending_proxy["http"]),
+            "https_proxy": (self.https_proxy.text().strip()
+                            if self._proxy_built else self._pending_proxy["https"]),
+            "prompt": (self.system_prompt.toPlainText().strip()
+                       if self._prompt_built else self._pending_prompt),
+        }
 
-            # 代理设置
-            if self.proxy_enabled_check.isChecked():
-                self.config.set_proxy(self.http_proxy.text().strip(), self.https_proxy.text().strip())
-            else:
-                self.config.set_proxy("", "")
+    def _sync_legacy(self, vals):
+        """把新配置的值同步进旧配置系统
+
+        直接更新配置字典再统一save_config：旧接口的每个setter都会
+        各自写盘，逐个调用一次保存要序列化四遍JSON。
+        """
+        cfg = self.config.config
+        ai_settings = cfg.get("ai_settings", {})
+        if "newapi" in ai_settings:
+            ai_settings["newapi"]["api_key"] = vals["api_key"]
+        if vals["proxy_enabled"]:
+            cfg["proxy"]["http"] = vals["http_proxy"]
+            cfg["proxy"]["https"] = vals["https_proxy"]
+        else:
+            cfg["proxy"]["http"] = ""
+            cfg["proxy"]["https"] = ""
+        cfg["default_model"] = "newapi"
+        cfg["system_prompt"] = vals["prompt"]
+        self.config.save_config()
 
-            # 默认模型
-            self.config.config["default_model"] = "newapi"
-            self.config.save_config()
+    def save_settings(self):
+        """保存设置"""
+        try:
+            vals = self._current_values()
+            if self._initial is not None and vals == self._initial:
+                # 无任何改动，跳过两套配置的序列化与磁盘写入
+                self.show_save_feedback()
+                QTimer.singleShot(800, self.accept)
+                return
 
-            # 系统提示词
-            self.config.set_system_prompt(self.system_prompt.toPlainText().strip())
+            # AI配置批量落盘：上下文内的setter不再各自写盘，退出时合并为一次
+            with self.ai_config.batched_writes():
+                # 保存NewAPI配置
+                self.ai_config.set_api_key("newapi", vals["api_key"])
+
+                newapi_config = self.ai_config.get_provider_config("newapi")
+                if newapi_config:
+                    # 一次replace生成新配置，替代逐字段的五次属性赋值；
+                    # 校验器保证文本可解析，空串退回默认值
+                    newapi_config = replace(
+                        newapi_config,
+                        base_url=vals["base_url"],
+                        model=vals["model"],
+                        enabled=True,
+                        temperature=float(vals["temperature"] or "0.7"),
+                        max_tokens=int(vals["max_tokens"] or "2000"),
+                    )
+                    self.ai_config.set_provider_config("newapi", newapi_config)
+
+                # 设置NewAPI为默认提供商
+                self.ai_config.settings.default_provider = AIProvider.NEWAPI
+
+                # 保存系统提示词
+                self.ai_config.settings.system_prompt = vals["prompt"]
+
+                # 保存AI配置
+                self.ai_config.save_config()
+
+            # 向后兼容：同步到旧配置系统（一次落盘）
+            self._sync_legacy(vals)
+
+            # 更新快照，再次保存时无改动即可直接跳过
+            self._initial = vals
 
             # 显示保存成功的反馈
             self.show_save_feedback()